@@ -0,0 +1,90 @@
+"""Cold-start benchmark for the ``influx`` CLI.
+
+Every sample runs in a fresh interpreter. The benchmark fails (exit code 1)
+when the median start-up time of a scenario exceeds its budget or when a
+light command imports one of the heavy modules.
+
+Usage::
+
+    python benchmarks/cold_start.py [--repeat 7] [--budget-scale 1.0] [--json results.json]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+HEAVY_MODULES = ["pandas", "pyarrow", "influxdb", "numpy"]
+
+# name -> (python code run in a fresh interpreter, budget in seconds)
+SCENARIOS = {
+    "import_cli": ("import influxdb_cli.cli.main", 0.6),
+    "help": ("from influxdb_cli.cli.main import app; app(['--help'])", 0.7),
+    "config_show": ("from influxdb_cli.cli.main import app; app(['config', 'show'])", 0.7),
+    "database_show": ("from influxdb_cli.cli.main import app; app(['database', 'show'])", 0.7),
+}
+
+def _environment() -> dict:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC_DIR), env.get("PYTHONPATH")]))
+    return env
+
+
+def _wrap(code: str) -> str:
+    # Typer exits through SystemExit, report the loaded heavy modules anyway
+    return (
+        "import sys, json\n"
+        "try:\n"
+        f"    exec({code!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]), file=sys.stderr)\n"
+    )
+
+
+def run_scenario(code: str, repeat: int) -> dict:
+    env = _environment()
+    samples = []
+    heavy = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        completed = subprocess.run([sys.executable, "-c", _wrap(code)], env=env,
+                                   capture_output=True, text=True)
+        samples.append(time.perf_counter() - started)
+        heavy = json.loads(completed.stderr.strip().splitlines()[-1])
+    return {"median_sec": statistics.median(samples), "min_sec": min(samples),
+            "samples_sec": samples, "heavy_modules": heavy}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=7, help="Fresh interpreters per scenario.")
+    parser.add_argument("--budget-scale", type=float, default=1.0,
+                        help="Multiply every budget, e.g. 2.0 on slow CI machines.")
+    parser.add_argument("--json", dest="json_path", help="Write the results to this JSON file.")
+    args = parser.parse_args(argv)
+
+    baseline = run_scenario("pass", args.repeat)["median_sec"]
+    results = {"interpreter_sec": baseline, "scenarios": {}}
+    failed = False
+    for name, (code, budget) in SCENARIOS.items():
+        result = run_scenario(code, args.repeat)
+        result["budget_sec"] = budget * args.budget_scale
+        result["ok"] = result["median_sec"] <= result["budget_sec"] and not result["heavy_modules"]
+        failed |= not result["ok"]
+        results["scenarios"][name] = result
+        print(f"{name:<15} median {result['median_sec']:.3f}s "
+              f"(budget {result['budget_sec']:.3f}s) heavy imports: "
+              f"{', '.join(result['heavy_modules']) or '-'} {'OK' if result['ok'] else 'FAIL'}")
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(results, indent=2))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""Local stand-in for an InfluxDB 1.x HTTP server, used by the benchmarks.
+
+``SELECT`` queries replay canned responses registered per measurement,
+restricted to the ``time`` conditions of the query, as a single JSON
+document or as newline separated chunks when ``chunked=true`` is asked for.
+Single ``SELECT`` statements are answered in CSV or msgpack when the
+``Accept`` header asks for it, unless ``formats`` leaves them out. Encoded
+responses are cached so the server costs as little as possible during a
+measurement. ``/write`` accepts line protocol and only counts the points and
+bytes it receives, or answers the status codes queued in ``write_errors``
+first.
+"""
+import csv
+import gzip
+import io
+import json
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import msgpack
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_FROM_PATTERN = re.compile(r'\bFROM\s+(?:"?[\w-]+"?\.)*"?([\w-]+)"?', re.IGNORECASE)
+_TIME_CONDITION = re.compile(r"\btime\s*(>=|<=|>|<)\s*'([^']+)'", re.IGNORECASE)
+_DESCENDING = re.compile(r"\bORDER\s+BY\s+time\s+DESC\b", re.IGNORECASE)
+_LIMIT = re.compile(r"\bLIMIT\s+(\d+)", re.IGNORECASE)
+_INTO = re.compile(r"\bINTO\b", re.IGNORECASE)
+_COMPARISONS = {">=": int.__ge__, "<=": int.__le__, ">": int.__gt__, "<": int.__lt__}
+
+
+def epoch_ns(timestamp: str) -> int:
+    """Nanoseconds since the epoch of a UTC timestamp like ``2024-01-01T10:00:00.123456789Z``."""
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    whole = datetime.fromisoformat(seconds).replace(tzinfo=timezone.utc) - _EPOCH
+    return whole // timedelta(seconds=1) * 10 ** 9 + int(fraction.ljust(9, "0")[:9])
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes, avoid the delayed-ACK stall on keep-alive
+    disable_nagle_algorithm = True
+    server: "FakeInfluxServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, code: int, body: bytes = b"", content_type: str = "application/json"):
+        self.send_response(code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("X-Influxdb-Version", "1.8.10")
+        if body and self.server.gzip_responses and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _params(self) -> tuple[dict[str, str], str, bytes]:
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        return params, url.path, body
+
+    def do_GET(self):
+        params, path, _ = self._params()
+        if path == "/ping":
+            return self._send(204)
+        if path == "/query":
+            return self._send(200, *self.server.answer(params, self.headers.get("Accept")))
+        self._send(404)
+
+    def do_POST(self):
+        params, path, body = self._params()
+        if path == "/write":
+            error = self.server.next_write_error()
+            if error is not None:
+                return self._send(error, json.dumps({"error": f"fake error {error}"}).encode())
+            self.server.record_write(params.get("db", ""), body)
+            return self._send(204)
+        if path == "/query":
+            if body:
+                params.update({key: values[0] for key, values in parse_qs(body.decode()).items()})
+            return self._send(200, *self.server.answer(params, self.headers.get("Accept")))
+        self._send(404)
+
+
+class FakeInfluxServer(ThreadingHTTPServer):
+    """Threaded HTTP server answering like InfluxDB 1.x.
+
+    Use as a context manager, the server runs on a background thread and
+    listens on ``port`` (a free port when 0). Responses are gzip compressed
+    for clients accepting it only when ``gzip_responses`` is set. Every query
+    is logged in ``queries``, write bodies are kept in ``write_bodies`` with
+    ``keep_writes``. ``SELECT ... INTO`` answers the number of points it
+    selects as written.
+    """
+    daemon_threads = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, gzip_responses: bool = False,
+                 formats: tuple[str, ...] = ("application/csv", "application/x-msgpack"),
+                 keep_writes: bool = False):
+        super().__init__((host, port), _Handler)
+        self.gzip_responses = gzip_responses
+        self.formats = formats
+        self.databases = {"bench"}
+        self.series: dict[str, tuple[list[str], list[list]]] = {}
+        self.field_keys: dict[str, dict[str, str]] = {}
+        self.tag_keys: dict[str, list[str]] = {}
+        self.points_written = 0
+        self.bytes_written = 0
+        self.write_errors: list[int] = []
+        self.keep_writes = keep_writes
+        self.write_bodies: list[bytes] = []
+        self.queries: list[str] = []
+        self._responses: dict[tuple, bytes] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def add_measurement(self, name: str, columns: list[str], values: list[list],
+                        field_types: dict[str, str] | None = None,
+                        tags: list[str] | None = None) -> None:
+        """Register the rows replayed for ``SELECT`` queries on measurement ``name``.
+
+        ``field_types`` and ``tags`` answer ``SHOW FIELD KEYS`` and ``SHOW TAG KEYS``.
+        """
+        with self._lock:
+            self.series[name] = (columns, values)
+            self.field_keys[name] = field_types or {}
+            self.tag_keys[name] = tags or []
+            self._responses = {key: body for key, body in self._responses.items()
+                               if key[0] != name}
+
+    def record_write(self, database: str, body: bytes) -> None:
+        points = body.count(b"\n") + (0 if not body or body.endswith(b"\n") else 1)
+        with self._lock:
+            self.points_written += points
+            self.bytes_written += len(body)
+            if self.keep_writes:
+                self.write_bodies.append(body)
+
+    def next_write_error(self) -> int | None:
+        with self._lock:
+            return self.write_errors.pop(0) if self.write_errors else None
+
+    def reset_writes(self) -> None:
+        with self._lock:
+            self.points_written = 0
+            self.bytes_written = 0
+            self.write_bodies = []
+
+    def _statement(self, statement: str, statement_id: int) -> dict:
+        upper = statement.upper()
+        result = {"statement_id": statement_id}
+        if upper.startswith("SHOW DATABASES"):
+            result["series"] = [{"name": "databases", "columns": ["name"],
+                                 "values": [[name] for name in sorted(self.databases)]}]
+        elif upper.startswith("SHOW MEASUREMENTS") and self.series:
+            result["series"] = [{"name": "measurements", "columns": ["name"],
+                                 "values": [[name] for name in sorted(self.series)]}]
+        elif upper.startswith(("SHOW FIELD KEYS", "SHOW TAG KEYS")):
+            match = _FROM_PATTERN.search(statement)
+            names = [match.group(1)] if match else sorted(self.series)
+            fields = upper.startswith("SHOW FIELD KEYS")
+            series = []
+            for name in names:
+                if fields and self.field_keys.get(name):
+                    series.append({"name": name, "columns": ["fieldKey", "fieldType"],
+                                   "values": [list(item) for item in self.field_keys[name].items()]})
+                elif not fields and self.tag_keys.get(name):
+                    series.append({"name": name, "columns": ["tagKey"],
+                                   "values": [[tag] for tag in self.tag_keys[name]]})
+            if series:
+                result["series"] = series
+        elif upper.startswith("CREATE DATABASE"):
+            self.databases.add(statement.split()[2].strip('"'))
+        elif upper.startswith("DROP DATABASE"):
+            self.databases.discard(statement.split()[2].strip('"'))
+        elif upper.startswith("SELECT"):
+            match = _FROM_PATTERN.search(statement)
+            if match and match.group(1) in self.series:
+                columns, values = self.series[match.group(1)]
+                conditions = [(_COMPARISONS[operator], epoch_ns(bound))
+                              for operator, bound in _TIME_CONDITION.findall(statement)]
+                if conditions:
+                    values = [row for row in values
+                              if all(compare(epoch_ns(row[0]), bound)
+                                     for compare, bound in conditions)]
+                if _DESCENDING.search(statement):
+                    values = values[::-1]
+                limit = _LIMIT.search(statement)
+                if limit:
+                    values = values[:int(limit.group(1))]
+                if _INTO.search(statement):
+                    result["series"] = [{"name": "result", "columns": ["time", "written"],
+                                         "values": [["1970-01-01T00:00:00Z", len(values)]]}]
+                elif values:
+                    result["series"] = [{"name": match.group(1), "columns": columns,
+                                         "values": values}]
+        return result
+
+    def _chunks(self, statement: str, chunk_size: int) -> bytes:
+        result = self._statement(statement, 0)
+        lines = []
+        for series in result.get("series", []):
+            values = series["values"]
+            for start in range(0, len(values), chunk_size):
+                chunk = {**series, "values": values[start:start + chunk_size]}
+                lines.append(json.dumps({"results": [{"statement_id": 0, "series": [chunk],
+                                                      "partial": True}]}))
+        if not lines:
+            lines.append(json.dumps({"results": [result]}))
+        return ("\n".join(lines) + "\n").encode()
+
+    def _csv(self, statement: str) -> bytes:
+        """Encode like InfluxDB's CSV writer: ``name,tags,time,...`` and epoch nanoseconds."""
+        output = io.StringIO()
+        writer = csv.writer(output, lineterminator="\n")
+        for series in self._statement(statement, 0).get("series", []):
+            writer.writerow(["name", "tags", *series["columns"]])
+            for row in series["values"]:
+                time_ns = (datetime.fromisoformat(row[0]) - _EPOCH) // timedelta(microseconds=1) * 1000
+                writer.writerow([series["name"], "", time_ns,
+                                 *["" if value is None else value for value in row[1:]]])
+        return output.getvalue().encode()
+
+    def answer(self, params: dict[str, str], accept: str | None = None) -> tuple[bytes, str]:
+        """Return the body and content type answering a query."""
+        query = params.get("q", "")
+        with self._lock:
+            self.queries.append(query)
+        chunked = params.get("chunked") == "true"
+        chunk_size = int(params.get("chunk_size", 10000))
+        statements = [statement.strip() for statement in query.split(";") if statement.strip()]
+        content_type = "application/json"
+        if accept in self.formats and len(statements) == 1 and not chunked:
+            content_type = accept
+        match = _FROM_PATTERN.search(query)
+        cacheable = query.lstrip().upper().startswith("SELECT") and match is not None
+        key = (match.group(1) if match else None, query, chunked, chunk_size, content_type)
+        if cacheable and key in self._responses:
+            return self._responses[key], content_type
+        if chunked:
+            body = self._chunks(query, chunk_size)
+        elif content_type == "application/csv":
+            body = self._csv(statements[0])
+        else:
+            response = {"results": [self._statement(statement, index)
+                                    for index, statement in enumerate(statements)]}
+            if content_type == "application/x-msgpack":
+                body = msgpack.packb(response)
+            else:
+                body = json.dumps(response).encode()
+        if cacheable:
+            with self._lock:
+                self._responses[key] = body
+        return body, content_type
+
+    def __enter__(self) -> "FakeInfluxServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+        self.server_close()
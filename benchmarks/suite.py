@@ -0,0 +1,262 @@
+"""Offline benchmark suite for the InfluxDB CLI.
+
+Runs against a local stand-in for the InfluxDB HTTP API, no server needed.
+``response_format`` compares decoding JSON, msgpack and CSV query answers,
+``serialize`` the line protocol serializer with ``DataFrameClient``'s.
+Every benchmark is measured for each data size and reported as the median of
+``--repeat`` runs. With ``--baseline`` the results are compared with an
+earlier ``--json`` output and the suite fails (exit code 1) when a benchmark
+got slower than the baseline by more than ``--tolerance``.
+
+Usage::
+
+    python benchmarks/suite.py [--sizes 1000 100000] [--repeat 5] [--only export]
+                               [--json results.json] [--baseline old.json --tolerance 0.25]
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import pandas as pd  # noqa: E402
+from influxdb import DataFrameClient  # noqa: E402
+from influxdb.resultset import ResultSet  # noqa: E402
+
+import cold_start  # noqa: E402
+from fake_influx import FakeInfluxServer  # noqa: E402
+from influxdb_cli.config.config_manager import ConfigModel  # noqa: E402
+from influxdb_cli.core.influx_client import (EXTENSIONS_WRITER_MAPPING, InfluxClient,  # noqa: E402
+                                             timestamp_passer)
+from influxdb_cli.core.line_protocol import lines_to_bytes, serialize_lines  # noqa: E402
+from influxdb_cli.core.response_decoders import RESPONSE_FORMATS  # noqa: E402
+
+DATABASE = "bench"
+MEASUREMENT = "bench_measurement"
+
+TIMESTAMPS = [
+    "2024-01-15 14:30:45",
+    "2024-01-15T14:30:45Z",
+    "2024-01-15T14:30:45.123456Z",
+    "2024-01-15 14:30:45.123456",
+]
+
+# Formats whose writers need optional packages
+OPTIONAL_WRITER_MODULES = {".xlsx": "openpyxl"}
+
+
+def make_series(size: int) -> tuple[list[str], list[list]]:
+    """Rows of a typical measurement as InfluxDB returns them in JSON."""
+    times = pd.date_range("2024-01-01", periods=size, freq="ms", tz="UTC")
+    iso = times.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    columns = ["time", "power", "speed", "torque", "state"]
+    values = [[iso[i], i * 0.5, float(i % 3000), i % 1000, f"s{i % 4}"] for i in range(size)]
+    return columns, values
+
+
+def measure(func, repeat: int, setup=None) -> dict:
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return {"median_sec": statistics.median(samples), "min_sec": min(samples),
+            "samples_sec": samples}
+
+
+def bench_to_dataframe(client: InfluxClient, server: FakeInfluxServer, size: int,
+                       repeat: int, workdir: Path) -> list[dict]:
+    columns, values = server.series[MEASUREMENT]
+    result_set = ResultSet({"statement_id": 0, "series": [
+        {"name": MEASUREMENT, "columns": columns, "values": values}]})
+    return [{"case": "-", **measure(lambda: client._to_dataframe(result_set), repeat)}]
+
+
+def bench_export(client: InfluxClient, server: FakeInfluxServer, size: int,
+                 repeat: int, workdir: Path) -> list[dict]:
+    results = []
+    for extension in EXTENSIONS_WRITER_MAPPING:
+        module = OPTIONAL_WRITER_MODULES.get(extension)
+        if module is not None:
+            try:
+                __import__(module)
+            except ImportError:
+                results.append({"case": extension, "skipped": f"{module} is not installed"})
+                continue
+        path = str(workdir / f"export{extension}")
+        results.append({"case": extension, **measure(
+            lambda: client.show_measurement(MEASUREMENT, DATABASE, path=path), repeat)})
+    return results
+
+
+def bench_ingest(client: InfluxClient, server: FakeInfluxServer, size: int,
+                 repeat: int, workdir: Path) -> list[dict]:
+    columns, values = server.series[MEASUREMENT]
+    df = pd.DataFrame(values, columns=columns).drop(columns="time")
+    path = workdir / "ingest.csv"
+    df.to_csv(path, index=False)
+    results = []
+    for case, chunk_size in (("whole", None), ("chunked", max(size // 10, 1))):
+        result = measure(
+            lambda: client.add_measurements(DATABASE, str(path), "bench_ingest",
+                                            chunk_size=chunk_size),
+            repeat, setup=server.reset_writes)
+        result["points_written"] = server.points_written
+        results.append({"case": case, **result})
+    return results
+
+
+def bench_serialize(client: InfluxClient, server: FakeInfluxServer, size: int,
+                    repeat: int, workdir: Path) -> list[dict]:
+    columns, values = server.series[MEASUREMENT]
+    df = pd.DataFrame(values, columns=columns)
+    df = df.set_index(pd.to_datetime(df.pop("time"), format="ISO8601"))
+    reference = DataFrameClient()
+    cases = {
+        "dataframe_client": lambda: "\n".join(reference._convert_dataframe_to_lines(
+            df, MEASUREMENT, tag_columns=["state"], time_precision="ms")).encode(),
+        "repr": lambda: lines_to_bytes(serialize_lines(
+            df, MEASUREMENT, tag_columns=["state"], time_precision="ms")),
+        "shortest": lambda: lines_to_bytes(serialize_lines(
+            df, MEASUREMENT, tag_columns=["state"], time_precision="ms",
+            float_format="shortest")),
+    }
+    return [{"case": case, **measure(serialize, repeat)} for case, serialize in cases.items()]
+
+
+def bench_response_format(client: InfluxClient, server: FakeInfluxServer, size: int,
+                          repeat: int, workdir: Path) -> list[dict]:
+    query = f"SELECT * FROM {MEASUREMENT}"
+    results = []
+    for response_format in RESPONSE_FORMATS:
+        # The first answer is encoded and cached by the server, keep it out of the samples
+        client.query(query, database=DATABASE, response_format=response_format)
+        results.append({"case": response_format, **measure(
+            lambda: client.query(query, database=DATABASE, response_format=response_format),
+            repeat)})
+    return results
+
+
+def bench_timestamp_passer(client: InfluxClient, server: FakeInfluxServer, size: int,
+                           repeat: int, workdir: Path) -> list[dict]:
+    results = []
+    for timestamp in TIMESTAMPS:
+        def parse_all():
+            for _ in range(size):
+                timestamp_passer(timestamp)
+        results.append({"case": timestamp, **measure(parse_all, repeat)})
+    return results
+
+
+BENCHMARKS = {
+    "to_dataframe": bench_to_dataframe,
+    "export": bench_export,
+    "ingest": bench_ingest,
+    "serialize": bench_serialize,
+    "response_format": bench_response_format,
+    "timestamp_passer": bench_timestamp_passer,
+}
+
+# timestamp_passer is a per-call cost, bigger sizes only add run time
+PER_CALL_SIZE_LIMIT = {"timestamp_passer": 1000}
+
+
+def run_suite(sizes: list[int], repeat: int, only: list[str] | None) -> list[dict]:
+    rows = []
+    with FakeInfluxServer() as server, tempfile.TemporaryDirectory() as tmp:
+        config = ConfigModel(host="127.0.0.1", port=server.port, database=DATABASE)
+        client = InfluxClient(config=config)
+        done = set()
+        for size in sizes:
+            server.add_measurement(MEASUREMENT, *make_series(size))
+            for name, benchmark in BENCHMARKS.items():
+                bench_size = min(size, PER_CALL_SIZE_LIMIT.get(name, size))
+                if (only and name not in only) or (name, bench_size) in done:
+                    continue
+                done.add((name, bench_size))
+                for result in benchmark(client, server, bench_size, repeat, Path(tmp)):
+                    row = {"benchmark": name, "size": bench_size, **result}
+                    if "median_sec" in row:
+                        row["rows_per_sec"] = bench_size / row["median_sec"]
+                    rows.append(row)
+                    print(_describe(row))
+    if not only or "cold_start" in only:
+        for name in ("import_cli", "help"):
+            code, _ = cold_start.SCENARIOS[name]
+            result = cold_start.run_scenario(code, repeat)
+            row = {"benchmark": "cold_start", "size": 0, "case": name, **result}
+            rows.append(row)
+            print(_describe(row))
+    return rows
+
+
+def _key(row: dict) -> tuple:
+    return row["benchmark"], row["size"], row["case"]
+
+
+def _describe(row: dict) -> str:
+    text = f"{row['benchmark']:<17} {row['case']:<28} size {row['size']:>8}"
+    if "skipped" in row:
+        return f"{text} skipped: {row['skipped']}"
+    text += f" median {row['median_sec'] * 1000:10.2f} ms"
+    if row.get("rows_per_sec"):
+        text += f" {row['rows_per_sec']:14,.0f} rows/s"
+    if "change" in row:
+        text += f" {row['change']:+.1%}{' REGRESSION' if row['regression'] else ''}"
+    return text
+
+
+def compare(rows: list[dict], baseline_rows: list[dict], tolerance: float) -> bool:
+    """Annotate rows with the change against the baseline, return True on a regression."""
+    baseline = {_key(row): row for row in baseline_rows if "median_sec" in row}
+    regressed = False
+    for row in rows:
+        old = baseline.get(_key(row))
+        if old is None or "median_sec" not in row:
+            continue
+        row["baseline_median_sec"] = old["median_sec"]
+        row["change"] = row["median_sec"] / old["median_sec"] - 1
+        row["regression"] = row["change"] > tolerance
+        regressed |= row["regression"]
+    return regressed
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000],
+                        help="Numbers of rows to benchmark with.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per benchmark.")
+    parser.add_argument("--only", nargs="+", choices=[*BENCHMARKS, "cold_start"],
+                        help="Run only these benchmarks.")
+    parser.add_argument("--json", dest="json_path", help="Write the results to this JSON file.")
+    parser.add_argument("--baseline", help="JSON results of an earlier run to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Relative slow-down over the baseline reported as a regression.")
+    args = parser.parse_args(argv)
+
+    rows = run_suite(args.sizes, args.repeat, args.only)
+    regressed = False
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressed = compare(rows, baseline["results"], args.tolerance)
+        print("Compared with", args.baseline)
+        for row in rows:
+            if "change" in row:
+                print(_describe(row))
+    if args.json_path:
+        meta = {"python": platform.python_version(), "platform": platform.platform(),
+                "sizes": args.sizes, "repeat": args.repeat}
+        Path(args.json_path).write_text(json.dumps({"meta": meta, "results": rows}, indent=2))
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+def get_influx_client():
+    """Create an InfluxClient, importing pandas and influxdb only when a command runs.
+
+    Command modules must not import ``influxdb_cli.core`` at module level, so
+    that ``influx --help`` or ``influx config show`` start without them.
+    """
+    from influxdb_cli.core.profiler import profile_phase
+    with profile_phase("client_init"):
+        from influxdb_cli.core.influx_client import InfluxClient
+        return InfluxClient()
@@ -1,7 +1,7 @@
 import typer
 
-from influxdb_cli.core.app_runner import AppRunner
-from influxdb_cli.core.influx_client import InfluxClient
+from influxdb_cli.cli.client import get_influx_client
+from influxdb_cli.cli.commands.database import echo_maintenance_report
 
 app = typer.Typer(name="measurement")
 
@@ -11,27 +11,108 @@ def run_app(
                                                   "to run measurement on"),
         config_path: str = typer.Argument(help="Path to the application config file"),
         check_interval: int = typer.Option(5, "--check-interval", "-c",
-                                          help="Interval in seconds to check container status")
+                                          help="Interval in seconds to check container status"),
+        completion_patterns: list[str] = typer.Option(
+            None, "--completion-pattern", "-m",
+            help="Regular expression marking a finished run in the container logs, can be "
+                 "given several times. Defaults to the driveline 'batch skipped' message."),
+        monitor_interval: float = typer.Option(
+            None, "--monitor-interval",
+            help="Poll the test database every this many seconds and print points written, "
+                 "points/s, progress through the source data and estimated time left."),
+        report_path: str = typer.Option(
+            None, "--report",
+            help="Write a per-database run report with phase times and processing rate "
+                 "to this .json or .csv file.")
 ):
     """Run measurement for a specified application container."""
+    from influxdb_cli.core.app_runner import AppRunner, write_run_report
     app_runner = AppRunner(
         app_config_path=config_path,
         docker_container_name=container_name,
-        influxdb_cli=InfluxClient()
+        influxdb_cli=get_influx_client(),
+        completion_patterns=completion_patterns,
+        monitor_interval_sec=monitor_interval
     )
-    app_runner.run(check_interval_sec=check_interval)
+    results = app_runner.run(check_interval_sec=check_interval)
+    if report_path:
+        write_run_report(results, report_path)
+        typer.echo(f"Run report written to {report_path}.")
 
 @app.command(name="clean-up", help="Clean up measurement results for an application.")
 def clean_up(
         container_name: str = typer.Argument(help="Name of the application container "
                                                   "to clean up measurement results from"),
-        config_path: str = typer.Argument(help="Path to the application config file")
+        config_path: str = typer.Argument(help="Path to the application config file"),
+        workers: int = typer.Option(None, "--workers", "-w",
+                                    help="Number of databases cleaned concurrently, "
+                                         "'maintenance_workers' from the config if not given.")
 ):
     """Clean up measurement results for a specified application container."""
+    from influxdb_cli.core.app_runner import AppRunner
     app_runner = AppRunner(
         app_config_path=config_path,
         docker_container_name=container_name,
-        influxdb_cli=InfluxClient()
+        influxdb_cli=get_influx_client()
     )
-    app_runner.clean_up()
-    typer.echo("Cleaned up measurement results for container {}".format(container_name))
\ No newline at end of file
+    report = app_runner.clean_up(workers=workers)
+    echo_maintenance_report(report, action="Cleaned")
+    if report.failed:
+        raise typer.Exit(code=1)
+    typer.echo("Cleaned up measurement results for container {}".format(container_name))
+
+@app.command(name="campaign", help="Run the test databases on several application containers.")
+def run_campaign(
+        container_names: list[str] = typer.Option(..., "--container", "-n",
+                                                  help="Name of an application container, "
+                                                       "give once per container."),
+        config_paths: list[str] = typer.Option(..., "--config", "-f",
+                                               help="Path to the config file of the container "
+                                                    "given at the same position."),
+        check_interval: int = typer.Option(5, "--check-interval", "-c",
+                                           help="Interval in seconds to check container status"),
+        completion_patterns: list[str] = typer.Option(
+            None, "--completion-pattern", "-m",
+            help="Regular expression marking a finished run in the container logs, can be "
+                 "given several times. Defaults to the driveline 'batch skipped' message."),
+        monitor_interval: float = typer.Option(
+            None, "--monitor-interval",
+            help="Poll the test database every this many seconds and print points written, "
+                 "points/s, progress through the source data and estimated time left."),
+        report_path: str = typer.Option(
+            None, "--report",
+            help="Write a per-database run report with phase times and processing rate "
+                 "to this .json or .csv file.")
+):
+    """Hand the test databases out to a pool of containers as they become free."""
+    from influxdb_cli.core.app_runner import AppRunner, write_run_report
+    from influxdb_cli.core.campaign import CampaignScheduler
+    if len(container_names) != len(config_paths):
+        typer.echo("Error: Give one --config for every --container.")
+        raise typer.Exit(code=1)
+    influx_client = get_influx_client()
+    runners = [
+        AppRunner(
+            app_config_path=config_path,
+            docker_container_name=container_name,
+            influxdb_cli=influx_client,
+            completion_patterns=completion_patterns,
+            monitor_interval_sec=monitor_interval
+        )
+        for container_name, config_path in zip(container_names, config_paths)
+    ]
+    report = CampaignScheduler(runners, check_interval_sec=check_interval).run()
+    if report_path:
+        write_run_report(report.results, report_path)
+        typer.echo(f"Run report written to {report_path}.")
+    for result in report.results:
+        status = result.status if result.error is None else f"{result.status} ({result.error})"
+        typer.echo(f"- {result.database} on {result.container or '-'}: restart "
+                   f"{result.restart_seconds:.1f}s, warm-up {result.warmup_seconds:.1f}s, "
+                   f"processing {result.processing_seconds:.1f}s "
+                   f"({result.points_per_sec:.0f} points/s), {status}")
+    phases = ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in report.seconds_by_phase().items())
+    typer.echo(f"Ran {len(report.results)} databases on {len(runners)} containers in "
+               f"{report.wall_seconds:.1f}s ({phases}), {len(report.failed)} failed.")
+    if report.failed:
+        raise typer.Exit(code=1)
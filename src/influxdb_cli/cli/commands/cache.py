@@ -0,0 +1,30 @@
+import typer
+from influxdb_cli.config.config_manager import load_config, get_user_cache_dir
+
+app = typer.Typer()
+
+
+def _get_query_cache():
+    from influxdb_cli.core.query_cache import QueryCache
+    config = load_config()
+    return QueryCache(cache_dir=get_user_cache_dir(),
+                      max_bytes=config.cache_max_size_mb * 1024 ** 2,
+                      ttl=config.cache_ttl)
+
+
+@app.command("info")
+def cache_info():
+    """Show location, number of entries and size of the result cache."""
+    cache = _get_query_cache()
+    entries = cache.entries()
+    size = sum(stat.st_size for _, stat in entries)
+    typer.echo(f"Path: {cache.cache_dir}")
+    typer.echo(f"Entries: {len(entries)}")
+    typer.echo(f"Size: {size / 1024 ** 2:.1f} MB of {cache.max_bytes / 1024 ** 2:.0f} MB")
+
+
+@app.command("clear")
+def cache_clear():
+    """Remove all entries from the result cache."""
+    removed = _get_query_cache().clear()
+    typer.echo(f"Removed {removed} cached results.")
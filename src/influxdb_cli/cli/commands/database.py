@@ -1,9 +1,27 @@
 import typer
-from influxdb_cli.core.influx_client import InfluxClient
+from influxdb_cli.cli.client import get_influx_client
+from influxdb_cli.config.config_manager import load_config
 
 app = typer.Typer(name="database")
 
 
+def echo_maintenance_report(report, action: str) -> None:
+    for result in report.results:
+        status = "OK" if result.ok else f"FAILED ({result.error})"
+        typer.echo(f"- {result.database}: {len(result.dropped)} dropped "
+                   f"in {result.seconds:.1f}s {status}")
+    typer.echo(f"{action} {len(report.results)} databases in {report.wall_seconds:.1f}s, "
+               f"{len(report.failed)} failed.")
+
+
+def echo_bundle_report(report, action: str) -> None:
+    for measurement in report.measurements:
+        typer.echo(f"- {measurement.retention_policy}.{measurement.name}: "
+                   f"{measurement.points} points in {measurement.seconds:.1f}s")
+    typer.echo(f"{action} {report.points} points of {len(report.measurements)} measurements "
+               f"in {report.wall_seconds:.1f}s.")
+
+
 @app.command(name="create", help="Create a new database.")
 def create_database(
         database_name: str = typer.Argument(help="Name of the database to create"),
@@ -11,7 +29,7 @@ def create_database(
             False, "--retention-policy", "-r",
             help="Create retention policies as defined in the config file")
 ):
-    influx_client = InfluxClient()
+    influx_client = get_influx_client()
     influx_client.create_database(database_name, retention_policy=retention_policy)
     typer.echo("Database created successfully.")
 
@@ -20,18 +38,22 @@ def create_database(
 def delete_database(
         database_name: str = typer.Argument(help="Name of the database to delete"),
         delete_all_databases: bool = typer.Option(
-            False, "--all", "-a", help="Delete all databases (use with caution!)")
+            False, "--all", "-a", help="Delete all databases (use with caution!)"),
+        workers: int = typer.Option(None, "--workers", "-w",
+                                    help="Number of databases deleted concurrently with --all, "
+                                         "'maintenance_workers' from the config if not given.")
 ):
-    influx_client = InfluxClient()
+    influx_client = get_influx_client()
     if delete_all_databases:
         confirm = typer.confirm(
             "Are you sure you want to delete ALL databases? This action cannot be undone.")
         if not confirm:
             typer.echo("Operation cancelled.")
             raise typer.Exit()
-        databases = influx_client.list_databases()
-        for db in databases:
-            influx_client.delete_database(db)
+        report = influx_client.delete_databases(influx_client.list_databases(), workers=workers)
+        echo_maintenance_report(report, action="Deleted")
+        if report.failed:
+            raise typer.Exit(code=1)
         typer.echo("All databases deleted successfully.")
         raise typer.Exit()
     else:
@@ -41,7 +63,7 @@ def delete_database(
 
 @app.command(name="list", help="List all databases.")
 def list_databases():
-    influx_client = InfluxClient()
+    influx_client = get_influx_client()
     databases = influx_client.list_databases()
     typer.echo("Databases:")
     for db in databases:
@@ -52,7 +74,7 @@ def list_databases():
 def list_retention_policies(
         database_name: str = typer.Option(None, "--database", "-d ", help="Name of the database")
 ):
-    influx_client = InfluxClient()
+    influx_client = get_influx_client()
     database = database_name or influx_client.config.database
     rps = influx_client.list_retention_policies(database)
     typer.echo(f"Retention Policies for database '{database}':")
@@ -66,15 +88,14 @@ def list_retention_policies(
 def use_database(
         database_name: str = typer.Argument(help="Name of the database to use")
 ):
-    influx_client = InfluxClient()
+    influx_client = get_influx_client()
     influx_client.switch_database(database_name)
     typer.echo(f"Active database set to '{database_name}'.")
 
 
 @app.command(name="show", help="Show database name in use")
 def show_used_db():
-    influx_client = InfluxClient()
-    typer.echo(f"Database name used: {influx_client.config.database}")
+    typer.echo(f"Database name used: {load_config().database}")
 
 
 @app.command(name="modify-retention-policy", help="Modify a retention policy.")
@@ -88,7 +109,7 @@ def modify_retention_policy(
         new_replication: int = typer.Option(
             None, "--replication", "-r", help="New replication factor for the retention policy")
 ):
-    influx_client = InfluxClient()
+    influx_client = get_influx_client()
     database = database_name or influx_client.config.database
     influx_client.modify_retention_policy(
         database=database,
@@ -107,9 +128,45 @@ def clean_database(
         exclude_measurements: str = typer.Option(None, "--except", "-e",
                                                  help="Name of the measurement to exclude from cleaning")
 ):
-    influx_client = InfluxClient()
-    influx_client.clean_database(
-        database_name=database_name or influx_client.config.database,
+    influx_client = get_influx_client()
+    database_name = database_name or influx_client.config.database
+    dropped = influx_client.clean_database(
+        database_name=database_name,
         exclude_measurements=exclude_measurements
     )
-    typer.echo(f"Database '{database_name}' cleaned successfully.")
+    typer.echo(f"Database '{database_name}' cleaned successfully, "
+               f"{len(dropped)} measurements dropped.")
+
+
+@app.command(name="dump", help="Dump a whole database to a Parquet bundle.")
+def dump_database(
+        path: str = typer.Option(..., "--path", "-p",
+                                 help="Directory of the bundle, must be empty or missing."),
+        database_name: str = typer.Option(None, "--database-name", "-d",
+                                          help="Name of the database to dump, if not specified "
+                                               "the current database will be used."),
+        workers: int = typer.Option(None, "--workers", "-w",
+                                    help="Number of measurements dumped concurrently, "
+                                         "'maintenance_workers' from the config if not given.")
+):
+    """Export every measurement with its retention policy, tag keys and field types."""
+    influx_client = get_influx_client()
+    database_name = database_name or influx_client.config.database
+    report = influx_client.dump_database(database_name, path, workers=workers)
+    echo_bundle_report(report, action=f"Dumped database '{database_name}' to {path}:")
+
+
+@app.command(name="restore", help="Restore a database from a Parquet bundle.")
+def restore_database(
+        path: str = typer.Argument(help="Directory of the bundle written by 'database dump'."),
+        database_name: str = typer.Option(None, "--database-name", "-d",
+                                          help="Name of the database to create, the name of "
+                                               "the dumped database if not specified."),
+        workers: int = typer.Option(None, "--workers", "-w",
+                                    help="Number of concurrent write requests, "
+                                         "'maintenance_workers' from the config if not given.")
+):
+    """Create the database with the bundle's retention policies and write all points back."""
+    influx_client = get_influx_client()
+    report = influx_client.restore_database(path, database_name=database_name, workers=workers)
+    echo_bundle_report(report, action=f"Restored database '{report.database}' from {path}:")
@@ -1,5 +1,5 @@
 import typer
-from influxdb_cli.core.influx_client import InfluxClient
+from influxdb_cli.cli.client import get_influx_client
 
 app = typer.Typer(name="measurement")
 
@@ -12,7 +12,7 @@ def list_measurements(
                                                "specific one without checking out.")
 ):
     """List all measurements in the specified database."""
-    client = InfluxClient()
+    client = get_influx_client()
     measurements = client.show_measurements(database_name=database_name)
     typer.echo(f"Measurements in database: {database_name or client.config.database}:")
     for measurement in measurements:
@@ -40,29 +40,66 @@ def add_measurements(
                                           help="Name of the database if not using any "
                                                "database or wanting to add measurement to the "
                                                "specific one without checking out."
-                                               "DO NOT use when adding from directory.")
+                                               "DO NOT use when adding from directory."),
+        retention_policy: str = typer.Option(None, "--retention-policy", "-r",
+                                             help="Retention policy to write the measurement "
+                                                  "to, the database default if not given."),
+        chunk_size: int = typer.Option(None, "--chunk-size", "-s",
+                                       help="Stream the file into the database in chunks "
+                                            "instead of loading it whole. CSV files are read "
+                                            "in chunks of this many rows, Parquet files by "
+                                            "row group and Feather files by record batch."),
+        workers: int = typer.Option(None, "--workers", "-w",
+                                    help="Load files from --dir-path concurrently: files are "
+                                         "parsed on this many processes and written on this "
+                                         "many threads."),
+        max_in_flight_mb: int = typer.Option(512, "--max-in-flight-mb",
+                                             help="Memory budget in MB for files parsed or "
+                                                  "being written when using --workers."),
+        spool_dir: str = typer.Option(None, "--spool",
+                                      help="Write-ahead spool directory: parsed points are "
+                                           "logged there and sent in the background, waiting "
+                                           "out server outages. Resume an interrupted load "
+                                           "with 'spool flush'.")
 ):
     """Count all measurements in the specified database."""
-    client = InfluxClient()
+    client = get_influx_client()
     if dir_path and file_path:
         typer.echo("Error: Please provide either --dir-path or --file-path, not both.")
         raise typer.Exit(code=1)
     if dir_path:
-        client.add_measurement_from_dir(
+        report = client.add_measurement_from_dir(
             file_path=dir_path,
             measurement_name=measurement_name,
             add_batch_timestamp=add_batch_timestamp,
+            workers=workers,
+            max_in_flight_bytes=max_in_flight_mb * 1024 ** 2,
         )
+        if report is not None:
+            for result in report.results:
+                status = "OK" if result.ok else f"FAILED ({result.error})"
+                typer.echo(f"- {result.file} -> {result.database}: {result.points} points "
+                           f"in {result.seconds:.1f}s {status}")
+            typer.echo(f"Loaded {report.points} points from {len(report.results)} files in "
+                       f"{report.wall_seconds:.1f}s ({report.points_per_sec:.0f} points/s), "
+                       f"{len(report.failed)} failed.")
+            if report.failed:
+                raise typer.Exit(code=1)
+            return
         typer.echo(f"Created databases and added measurements from directory: {dir_path}.")
         return
-    measurements = client.add_measurements(
+    stats = client.add_measurements(
         database_name=database_name,
         file_path=file_path,
         measurement_name=measurement_name,
         add_batch_timestamp=add_batch_timestamp,
+        chunk_size=chunk_size,
+        retention_policy=retention_policy,
+        spool_dir=spool_dir,
     )
-    typer.echo(f"Added {measurements} measurements to database: "
-               f"{database_name or client.config.database}.")
+    typer.echo(f"Added {stats.points} points to database: "
+               f"{database_name or client.config.database} in {stats.batches} requests "
+               f"({stats.points_per_sec:.0f} points/s, {stats.retries} retries).")
 
 
 @app.command(name="delete", help="Delete a measurement from a database.")
@@ -74,7 +111,7 @@ def delete_measurement(
                                                "the specific one without checking out.")
 ):
     """Delete a measurement from the specified database."""
-    client = InfluxClient()
+    client = get_influx_client()
     client.delete_measurement(
         measurement_name=measurement_name,
         database_name=database_name
@@ -112,9 +149,34 @@ def show_measurement(
                                                "database or wanting to show measurement from "
                                                "the specific one without checking out."),
         path: str = typer.Option(None, "--path", "-p",
-                                 help="Path to the file to save the measurement.")
+                                 help="Path to the file to save the measurement."),
+        chunk_size: int = typer.Option(None, "--chunk-size", "-s",
+                                       help="Stream the export to --path in chunks of this "
+                                            "many points instead of loading the whole result "
+                                            "into memory. Supported formats: csv, ndjson/jsonl "
+                                            "(one record per line), parquet, feather/arrow."),
+        parallel: int = typer.Option(None, "--parallel", "-P",
+                                     help="Split the time range into slices and fetch this many "
+                                          "slices concurrently. Results are kept in time order."),
+        slice_duration: str = typer.Option("1h", "--slice",
+                                           help="Duration of a single time slice used with "
+                                                "--parallel, e.g. 30min, 1h, 1d."),
+        use_cache: bool = typer.Option(None, "--cache/--no-cache",
+                                       help="Serve settled time windows from the local result "
+                                            "cache. Defaults to 'cache_enabled' in the config."),
+        every: str = typer.Option(None, "--every", "-e",
+                                  help="Downsample in InfluxDB to buckets of this duration, "
+                                       "e.g. 10s, 1min, 1h. Only the aggregated points are "
+                                       "transferred."),
+        aggregate: str = typer.Option("mean", "--agg",
+                                      help="Aggregate function used with --every: mean, median, "
+                                           "mode, min, max, first, last, sum, count, spread, "
+                                           "stddev."),
+        fill: str = typer.Option(None, "--fill",
+                                 help="Value of buckets without data used with --every: none, "
+                                      "null, previous, linear or a number.")
 ):
-    influx_client = InfluxClient()
+    influx_client = get_influx_client()
     results = influx_client.show_measurement(
         measurement_name=measurement_name,
         retention_policy=retention_policy,
@@ -124,10 +186,105 @@ def show_measurement(
         where_clause=where_clause,
         limit=limit,
         database_name=database_name or influx_client.config.database,
-        path=path
+        path=path,
+        chunk_size=chunk_size,
+        parallel=parallel,
+        slice_duration=slice_duration,
+        use_cache=use_cache,
+        every=every,
+        aggregate=aggregate,
+        fill=fill
     )
     if path:
         typer.echo(f"Saved {results} records from measurement '{measurement_name}' to {path}.")
         return
     typer.echo(f"Displayed command result from measurement '{measurement_name}':")
     typer.echo(results)
+
+
+@app.command(name="sync", help="Append new points of measurements to a Parquet dataset.")
+def sync_measurements(
+        measurement_names: list[str] = typer.Argument(help="Names of the measurements to sync."),
+        target_dir: str = typer.Option(..., "--path", "-p",
+                                       help="Directory of the datasets. Every measurement is "
+                                            "kept in <path>/<database>/<measurement>, "
+                                            "partitioned by day (date=YYYY-MM-DD)."),
+        retention_policy: str = typer.Option(None, "--retention-policy", "-r",
+                                             help="Retention policy of the measurements."),
+        database_name: str = typer.Option(None, "--database_name", "-d",
+                                          help="Name of the database if not using the any "
+                                               "database or wanting to sync measurements from "
+                                               "the specific one without checking out."),
+        chunk_size: int = typer.Option(100000, "--chunk-size", "-s",
+                                       help="Points fetched and written at a time.")
+):
+    """Fetch only the points newer than the previous sync and add them as new files."""
+    influx_client = get_influx_client()
+    database_name = database_name or influx_client.config.database
+    for measurement_name in measurement_names:
+        result = influx_client.sync_measurement(
+            measurement_name=measurement_name,
+            database_name=database_name,
+            target_dir=target_dir,
+            retention_policy=retention_policy,
+            chunk_size=chunk_size
+        )
+        mark = result.high_water_mark.isoformat() if result.high_water_mark is not None else "-"
+        typer.echo(f"Synced {result.points} new points of '{measurement_name}' into "
+                   f"{len(result.files)} files in {result.seconds:.1f}s, "
+                   f"high-water mark: {mark}.")
+
+
+@app.command(name="copy", help="Copy a measurement to another database or server.")
+def copy_measurement(
+        measurement_name: str = typer.Argument(help="Name of the measurement to copy."),
+        destination_database: str = typer.Option(..., "--to-database", "-D",
+                                                 help="Database to copy to, created with the "
+                                                      "config's retention policies if missing."),
+        destination_measurement: str = typer.Option(None, "--to-measurement", "-M",
+                                                    help="Name of the copy, the source name if "
+                                                         "not given."),
+        destination_server: str = typer.Option(None, "--to-server", "-S",
+                                               help="Name of a server defined in 'servers' of "
+                                                    "the config, the current server if not "
+                                                    "given."),
+        database_name: str = typer.Option(None, "--database_name", "-d",
+                                          help="Name of the source database if not using the "
+                                               "any database."),
+        retention_policy: str = typer.Option(None, "--retention-policy", "-r",
+                                             help="Retention policy of the source measurement."),
+        destination_retention_policy: str = typer.Option(None, "--to-retention-policy",
+                                                         help="Retention policy of the copy, "
+                                                              "the default one if not given."),
+        from_time: str = typer.Option(None, "--from-time", "-f",
+                                      help="Start of the copied time range, supported formats "
+                                           "are the same as for 'measurement show'."),
+        to_time: str = typer.Option(None, "--to-time", "-t",
+                                    help="End of the copied time range."),
+        where_clause: str = typer.Option(None, "--where-clause", "-w",
+                                         help="Additional WHERE clause for filtering data."),
+        slice_duration: str = typer.Option("1d", "--slice",
+                                           help="Time range copied by one SELECT INTO statement "
+                                                "on the same server, e.g. 1h, 1d."),
+        parallel: int = typer.Option(None, "--parallel", "-P",
+                                     help="Number of SELECT INTO slices run concurrently.")
+):
+    """Copy with SELECT INTO on the same server, stream the points to another server."""
+    influx_client = get_influx_client()
+    report = influx_client.copy_measurement(
+        measurement_name=measurement_name,
+        database_name=database_name or influx_client.config.database,
+        destination_database=destination_database,
+        destination_measurement=destination_measurement,
+        retention_policy=retention_policy,
+        destination_retention_policy=destination_retention_policy,
+        destination_server=destination_server,
+        from_time=from_time,
+        to_time=to_time,
+        where_clause=where_clause,
+        slice_duration=slice_duration,
+        parallel=parallel
+    )
+    typer.echo(f"Copied {report.points} points of '{measurement_name}' from {report.source} to "
+               f"{report.destination} ({report.mode}, {report.batches} batches) "
+               f"in {report.wall_seconds:.1f}s.")
@@ -0,0 +1,30 @@
+import typer
+from influxdb_cli.cli.client import get_influx_client
+
+app = typer.Typer()
+
+
+@app.command("status")
+def spool_status(
+        spool_dir: str = typer.Argument(help="Write spool directory.")
+):
+    """Show target and points not yet written of a write spool."""
+    from influxdb_cli.core.write_spool import WriteSpool
+    spool = WriteSpool(spool_dir)
+    segment, offset = spool.read_ack()
+    retention_policy = spool.meta["retention_policy"] or "default"
+    typer.echo(f"Database: {spool.meta['database']} ({retention_policy} retention policy)")
+    typer.echo(f"State: {'complete' if spool.closed else 'open or interrupted'}")
+    typer.echo(f"Segments: {len(spool.segments())}, acknowledged up to segment {segment} "
+               f"byte {offset}")
+    typer.echo(f"Pending: {spool.pending_bytes() / 1024 ** 2:.1f} MB")
+
+
+@app.command("flush")
+def spool_flush(
+        spool_dir: str = typer.Argument(help="Write spool directory.")
+):
+    """Write the points left in a spool from the last acknowledged one on and remove it."""
+    stats = get_influx_client().flush_spool(spool_dir)
+    typer.echo(f"Flushed {stats.points} points in {stats.batches} requests "
+               f"({stats.points_per_sec:.0f} points/s, {stats.retries} retries).")
@@ -1,7 +1,6 @@
 import typer
-from influxdb_cli.cli.commands import config, database, measurement, app_runner
-
-from influxdb_cli.core.influx_client import InfluxClient
+from influxdb_cli.cli.client import get_influx_client
+from influxdb_cli.cli.commands import cache, config, database, measurement, app_runner, spool
 
 app = typer.Typer()
 
@@ -9,10 +8,32 @@ app.add_typer(config.app, name="config", help="Manage configuration settings.")
 app.add_typer(database.app, name="database", help="Manage the database.")
 app.add_typer(measurement.app, name="measurement", help="Manage the measurement.")
 app.add_typer(app_runner.app, name="app-runner", help="Run application tests.")
+app.add_typer(cache.app, name="cache", help="Manage the local query result cache.")
+app.add_typer(spool.app, name="spool", help="Inspect and flush write-ahead spools.")
+
+
+@app.callback()
+def main(
+        ctx: typer.Context,
+        profile: bool = typer.Option(False, "--profile",
+                                     help="Time the phases of the command (HTTP, decoding, "
+                                          "DataFrame building, serialization, file writing) "
+                                          "and print a summary table."),
+        profile_trace: str = typer.Option(None, "--profile-trace",
+                                          help="With --profile, write every phase call as a "
+                                               "Chrome trace JSON file (chrome://tracing)."),
+        profile_stats: str = typer.Option(None, "--profile-stats",
+                                          help="With --profile, write cProfile statistics to "
+                                               "this file, e.g. for snakeviz or pstats.")
+):
+    if not profile:
+        return
+    from influxdb_cli.cli.profiling import start_profiling
+    ctx.call_on_close(start_profiling(trace_path=profile_trace, stats_path=profile_stats))
 
 @app.command(name="query", help="Execute a custom InfluxDB query.")
 def query():
-    influx_client = InfluxClient()
+    influx_client = get_influx_client()
     query_str = typer.prompt("Enter your InfluxDB query")
     result = influx_client.query(query_str)
     typer.echo("Query Result:")
@@ -20,5 +41,15 @@ def query():
         typer.echo(point)
 
 
+@app.command(name="shell", help="Start an interactive InfluxQL shell.")
+def shell(
+        database_name: str = typer.Option(None, "--database_name", "-d",
+                                          help="Database to query, the configured one if "
+                                               "not given. Change it with 'use <database>'.")
+):
+    from influxdb_cli.cli.shell import InteractiveShell
+    InteractiveShell(get_influx_client(), database=database_name).run()
+
+
 if __name__ == "__main__":
     app()
\ No newline at end of file
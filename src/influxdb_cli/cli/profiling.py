@@ -0,0 +1,25 @@
+import cProfile
+
+import typer
+
+from influxdb_cli.core.profiler import PROFILER
+
+
+def start_profiling(trace_path: str | None = None, stats_path: str | None = None):
+    """Enable phase profiling and return the function reporting it when the command ends."""
+    PROFILER.enable(trace=trace_path is not None)
+    profiler = cProfile.Profile() if stats_path else None
+    if profiler is not None:
+        profiler.enable()
+
+    def report() -> None:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(stats_path)
+        typer.echo(PROFILER.format_table(), err=True)
+        if trace_path:
+            PROFILER.write_trace(trace_path)
+            typer.echo(f"Profile trace written to {trace_path}.", err=True)
+        if stats_path:
+            typer.echo(f"cProfile statistics written to {stats_path}.", err=True)
+    return report
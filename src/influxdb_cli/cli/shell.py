@@ -0,0 +1,159 @@
+import shutil
+import time
+
+import typer
+
+from influxdb_cli.config.config_manager import get_user_config_path
+
+HISTORY_LENGTH = 1000
+
+KEYWORDS = [
+    "SELECT", "FROM", "WHERE", "GROUP BY", "ORDER BY", "LIMIT", "OFFSET", "SHOW", "DATABASES",
+    "MEASUREMENTS", "RETENTION POLICIES", "FIELD KEYS", "TAG KEYS", "TAG VALUES", "SERIES",
+    "CREATE", "DROP", "DATABASE", "MEASUREMENT", "INTO", "time", "now()", "fill", "mean",
+    "max", "min", "last", "first", "count", "sum"
+]
+
+HELP = """Statements are sent to InfluxDB as typed, e.g. SELECT * FROM cpu LIMIT 10.
+Shell commands:
+  use <database>   query another database for the rest of the session
+  refresh          reload database and measurement names used for completion
+  help             show this message
+  exit, quit       leave the shell (Ctrl-D works too)"""
+
+
+def get_history_path():
+    return get_user_config_path().parent / "shell_history"
+
+
+class InteractiveShell:
+    """Read-eval-print loop running InfluxQL statements on a single warm client.
+
+    The client, its HTTP connection pool and the database/measurement names
+    used for completion live for the whole session, so statements do not pay
+    start-up or connection cost. Results taller than the terminal are shown
+    through a pager.
+    """
+
+    def __init__(self, influx_client, database: str | None = None):
+        self.influx_client = influx_client
+        self.database = database or influx_client.config.database
+        self._metadata: dict[str, list[str]] = {}
+        self._readline = None
+
+    def _setup_readline(self) -> None:
+        try:
+            import readline
+        except ImportError:
+            return
+        self._readline = readline
+        readline.set_history_length(HISTORY_LENGTH)
+        history_path = get_history_path()
+        if history_path.exists():
+            readline.read_history_file(history_path)
+        readline.set_completer(self._complete)
+        readline.set_completer_delims(" \t\n,;()=")
+        readline.parse_and_bind("tab: complete")
+
+    def _save_history(self) -> None:
+        if self._readline is not None:
+            self._readline.write_history_file(get_history_path())
+
+    def _names(self) -> list[str]:
+        """Database and measurement names, loaded once and kept for the session."""
+        if "databases" not in self._metadata:
+            self._metadata["databases"] = self.influx_client.list_databases()
+        if self.database and self.database not in self._metadata:
+            self._metadata[self.database] = self.influx_client.show_measurements(self.database)
+        return self._metadata["databases"] + self._metadata.get(self.database, [])
+
+    def refresh_metadata(self) -> None:
+        self._metadata = {}
+        self._names()
+
+    def _complete(self, text: str, state: int) -> str | None:
+        try:
+            candidates = KEYWORDS + self._names()
+        except Exception:
+            candidates = KEYWORDS
+        matches = [word for word in candidates if word.lower().startswith(text.lower())]
+        return matches[state] if state < len(matches) else None
+
+    def _prompt(self) -> str:
+        return f"influx [{self.database or '-'}]> "
+
+    def execute(self, statement: str) -> None:
+        import pandas as pd
+
+        started = time.perf_counter()
+        result = self.influx_client.query(statement, database=self.database)
+        elapsed = time.perf_counter() - started
+        # Several statements give a list with one result per statement
+        results = result if isinstance(result, list) else [result]
+        rows = 0
+        output = []
+        for index, statement_result in enumerate(results):
+            if len(results) > 1:
+                output.append(f"statement: {index}")
+            if isinstance(statement_result, dict):
+                frames = {f"name: {key}": df for key, df in statement_result.items()}
+            else:
+                points = list(statement_result.get_points())
+                frames = {None: pd.DataFrame(points)} if points else {}
+            for title, df in frames.items():
+                if title is not None:
+                    output.append(title)
+                output.append(df.to_string(index=False))
+                rows += len(df)
+        self._display("\n".join(output))
+        typer.echo(f"({rows} rows in {elapsed:.3f}s)")
+
+    def _display(self, text: str) -> None:
+        if not text:
+            return
+        if text.count("\n") + 2 > shutil.get_terminal_size().lines:
+            typer.echo_via_pager(text)
+        else:
+            typer.echo(text)
+
+    def handle(self, line: str) -> bool:
+        """Handle one input line, return False when the session should end."""
+        line = line.strip().rstrip(";").strip()
+        if not line:
+            return True
+        command, _, argument = line.partition(" ")
+        command = command.lower()
+        if command in ("exit", "quit"):
+            return False
+        if command == "help":
+            typer.echo(HELP)
+        elif command == "use" and argument:
+            self.database = argument.strip().strip('"')
+            typer.echo(f"Using database '{self.database}' for this session.")
+        elif command == "refresh":
+            self.refresh_metadata()
+            typer.echo("Metadata refreshed.")
+        else:
+            try:
+                self.execute(line)
+            except Exception as e:
+                typer.echo(f"Error: {e}", err=True)
+        return True
+
+    def run(self) -> None:
+        self._setup_readline()
+        typer.echo("InfluxDB shell, type 'help' for help and 'exit' to quit.")
+        try:
+            while True:
+                try:
+                    line = input(self._prompt())
+                except KeyboardInterrupt:
+                    typer.echo("")
+                    continue
+                except EOFError:
+                    typer.echo("")
+                    break
+                if not self.handle(line):
+                    break
+        finally:
+            self._save_history()
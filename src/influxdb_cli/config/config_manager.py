@@ -1,6 +1,7 @@
 import yaml
 from pathlib import Path
-from platformdirs import user_config_dir
+from typing import Literal
+from platformdirs import user_cache_dir, user_config_dir
 from pydantic import BaseModel, Field
 
 class InvalidConfigError(Exception):
@@ -17,6 +18,72 @@ class ConfigModel(BaseModel):
         description="List of retention policies to create with databases"
     )
     database: str | None = Field(default=None, description="Default database to use")
+    pool_size: int = Field(default=10, ge=1,
+                           description="Number of pooled HTTP connections to InfluxDB")
+    keep_alive: bool = Field(default=True,
+                             description="Reuse HTTP connections and enable TCP keep-alive")
+    gzip: bool = Field(default=False,
+                       description="Compress request bodies and ask for compressed responses")
+    gzip_level: int = Field(default=1, ge=1, le=9,
+                            description="Compression level of gzip compressed request bodies")
+    connect_timeout: float | None = Field(
+        default=5.0, description="Seconds to wait for a connection, None waits forever")
+    read_timeout: float | None = Field(
+        default=None, description="Seconds to wait for response data, None waits forever")
+    response_format: Literal["json", "msgpack", "csv"] = Field(
+        default="msgpack", description="Format InfluxDB is asked to answer queries in, csv "
+                                       "is decoded column-wise by Arrow")
+    retries: int = Field(default=3, ge=0,
+                         description="Attempts for requests failing on connection errors, "
+                                     "0 retries until success; not used by writes, see "
+                                     "write_retries")
+    cache_enabled: bool = Field(default=False,
+                                description="Serve settled time windows of 'measurement show' "
+                                            "from the local result cache")
+    cache_max_size_mb: int = Field(default=1024, ge=1,
+                                   description="Size of the result cache before least recently "
+                                               "used entries are evicted")
+    cache_ttl: str = Field(default="7d", description="Age after which a cached window is "
+                                                     "fetched again")
+    cache_settled_after: str = Field(default="1d",
+                                     description="Data older than this is considered immutable "
+                                                 "and may be served from the cache")
+    cache_bucket: str = Field(default="1d", description="Time window stored in one cache entry")
+    maintenance_workers: int = Field(default=4, ge=1,
+                                     description="Databases cleaned or deleted concurrently")
+    statements_per_request: int = Field(default=100, ge=1,
+                                        description="DROP statements sent in a single request")
+    downsample_max_buckets: int = Field(default=10000, ge=1,
+                                        description="GROUP BY time() buckets fetched in one "
+                                                    "query, longer ranges are split")
+    write_batch_size: int = Field(default=5000, ge=1,
+                                  description="Points of the first write request, later "
+                                              "requests are sized from the observed latency")
+    write_batch_min_size: int = Field(default=500, ge=1,
+                                      description="Fewest points sent in one write request")
+    write_batch_max_size: int = Field(default=100000, ge=1,
+                                      description="Most points sent in one write request")
+    write_batch_max_bytes: int = Field(default=10 * 1024 ** 2, ge=1,
+                                       description="Largest line protocol body of one write "
+                                                   "request")
+    write_batch_target_sec: float = Field(default=0.5, gt=0,
+                                          description="Latency write requests are sized for")
+    write_max_in_flight: int = Field(default=4, ge=1,
+                                     description="Write requests sent concurrently, by all "
+                                                 "threads of an ingest, restore or copy")
+    write_retries: int = Field(default=5, ge=0,
+                               description="Retries of a write failing on connection errors, "
+                                           "timeouts or server errors, each attempt connects "
+                                           "once; the only retry policy of writes")
+    write_backoff_sec: float = Field(default=0.5, ge=0,
+                                     description="Base of the jittered exponential backoff "
+                                                 "between write retries")
+    spool_segment_mb: int = Field(default=64, ge=1,
+                                  description="Size in MB of the segment files of a write "
+                                              "spool")
+    servers: dict[str, dict] = Field(default={},
+                                     description="Other InfluxDB servers by name, their keys "
+                                                 "override the settings above, e.g. host, port")
 
 
 def get_user_config_path():
@@ -24,6 +91,17 @@ def get_user_config_path():
     config_dir.mkdir(parents=True, exist_ok=True)
     return config_dir / 'config.yaml'
 
+def get_user_cache_dir() -> Path:
+    cache_dir = Path(user_cache_dir(APP_NAME))
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+def server_config(config: ConfigModel, server_name: str) -> ConfigModel:
+    """Return the config of a server listed in ``servers``."""
+    if server_name not in config.servers:
+        raise InvalidConfigError(f"Server '{server_name}' is not defined in 'servers'.")
+    return ConfigModel(**{**config.model_dump(), **config.servers[server_name]})
+
 def load_default_config() -> dict:
     with open(Path(__file__).parent / 'default_config.yaml', 'r') as file:
         return yaml.safe_load(file)
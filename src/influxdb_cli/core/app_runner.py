@@ -1,10 +1,16 @@
+import csv
 import json
 import pathlib
+import re
 import subprocess
 import time
+from dataclasses import asdict, dataclass
 from time import sleep
 
 from influxdb_cli.core.influx_client import InfluxClient
+from influxdb_cli.core.log_follower import LogFollower
+from influxdb_cli.core.run_monitor import RunMonitor
+from influxdb_cli.core.maintenance import MaintenanceExecutor, MaintenanceReport
 
 
 def path_passer(path: str) -> pathlib.Path:
@@ -28,14 +34,74 @@ def path_passer(path: str) -> pathlib.Path:
     return config_path
 
 
+DEFAULT_COMPLETION_PATTERNS = [re.escape("Driveline is not rotating, batch skipped.")]
+SOURCE_MEASUREMENT = "driveline_power_data"
+BATCH_MEASUREMENT = "batch_timestamps"
+
+
+@dataclass
+class RunResult:
+    database: str
+    container: str
+    status: str = "pending"
+    restart_seconds: float = 0.0
+    warmup_seconds: float = 0.0
+    processing_seconds: float = 0.0
+    points: int = 0
+    points_per_sec: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "done"
+
+    @property
+    def total_seconds(self) -> float:
+        return self.restart_seconds + self.warmup_seconds + self.processing_seconds
+
+
+def write_run_report(results: list[RunResult], path: str) -> None:
+    """Write a per-database run report to a ``.json`` or ``.csv`` file.
+    Parameters
+    ----------
+    results : list[RunResult]
+        Results of the runs.
+    path : str
+        Path to the report file, the format is taken from its extension.
+    Raises
+    ------
+    ValueError
+        If the extension is not supported.
+    """
+    rows = [{**asdict(result), "total_seconds": result.total_seconds} for result in results]
+    fieldnames = list(RunResult.__dataclass_fields__) + ["total_seconds"]
+    report_path = pathlib.Path(path)
+    extension = report_path.suffix.lower()
+    if extension == ".json":
+        with open(report_path, "w") as f:
+            json.dump(rows, f, indent=4)
+    elif extension == ".csv":
+        with open(report_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        raise ValueError(f"Unsupported report extension: {extension}")
+
+
 class AppRunner:
     """Class to run tests on application."""
     def __init__(self,
                  app_config_path: str,
                  docker_container_name: str,
-                 influxdb_cli: InfluxClient):
+                 influxdb_cli: InfluxClient,
+                 completion_patterns: list[str] | None = None,
+                 monitor_interval_sec: float | None = None):
         self.app_config_path = path_passer(app_config_path)
         self.influxdb_cli = influxdb_cli
+        self.completion_patterns = completion_patterns or DEFAULT_COMPLETION_PATTERNS
+        self.monitor_interval_sec = monitor_interval_sec
+        self.log_prefix = ""
         self.default_results_dir = self.get_results_dir()
         self.default_database = self.get_default_database()
         command = subprocess.check_output(["docker", "ps"])
@@ -66,21 +132,6 @@ class AppRunner:
             config_data = json.load(f)
         return config_data["data_management"]["influxdb"]["client_data"]["database"]
 
-    def get_logs(self, since_sec: int = 30) -> str:
-        """Get the logs from the docker container.
-        Parameters
-        ----------
-        since_sec : str
-            Time duration to get logs since.
-        Returns
-        -------
-        str
-            Logs from the docker container.
-        """
-        command = subprocess.check_output(
-            ["docker", "logs", "--since", f"{since_sec}s", self.docker_container_name])
-        return command.decode("utf-8")
-
     def restore_config(self):
         """Restore the original application configuration."""
         self.switch_database(self.default_database)
@@ -90,34 +141,37 @@ class AppRunner:
         with open(self.app_config_path, "w") as f:
             json.dump(config_data, f, indent=4)
 
-    def clean_up(self):
-        databases = self.get_test_databases()
-        for db in databases:
-            self.influxdb_cli.clean_database(
+    def clean_up(self, workers: int | None = None) -> MaintenanceReport:
+        """Clean the results from all test databases concurrently.
+        Parameters
+        ----------
+        workers : int | None
+            Number of databases cleaned at the same time, ``maintenance_workers``
+            from the config if not given.
+        Returns
+        -------
+        MaintenanceReport
+            Dropped measurements and errors per database.
+        """
+        def clean_test_database(db: str) -> list[str]:
+            dropped = self.influxdb_cli.clean_database(
                 database_name=db,
-                exclude_measurements=["driveline_power_data"]
+                exclude_measurements=[SOURCE_MEASUREMENT]
             )
             self.influxdb_cli.add_first_timestamp_to_batch_measurement(
                 database_name=db,
-                measurement_name="driveline_power_data",
+                measurement_name=SOURCE_MEASUREMENT,
             )
+            return dropped
+
+        executor = MaintenanceExecutor(
+            self.influxdb_cli, workers=workers or self.influxdb_cli.config.maintenance_workers)
+        return executor.run(self.get_test_databases(), clean_test_database)
 
     def restart_container(self):
         """Restart the docker container."""
         subprocess.run(["docker", "restart", self.docker_container_name])
 
-    def is_run_complete(self, check_interval_sec) -> bool:
-        """Check if the run is complete.
-        Returns
-        -------
-        bool
-            True if the run is complete, False otherwise.
-        """
-        logs = self.get_logs(check_interval_sec)
-        if "Driveline is not rotating, batch skipped." in logs:
-            return True
-        return False
-
     def get_test_databases(self, prefix: str = "test") -> list:
         """Get the list of test databases.
         Returns
@@ -132,12 +186,14 @@ class AppRunner:
         print("Databases found:", test_databases)
         return test_databases
 
-    def switch_database(self, database_name: str | None):
+    def switch_database(self, database_name: str | None, restart: bool = True):
         """Switch the database in the application config.
         Parameters
         ----------
         database_name : str | None
             Name of the database to switch to. If None, switch to default database.
+        restart : bool
+            Restart the container to apply the config.
         """
         with open(self.app_config_path, "r") as f:
             config_data = json.load(f)
@@ -151,32 +207,97 @@ class AppRunner:
         with open(self.app_config_path, "w") as f:
             json.dump(config_data, f, indent=4)
 
-        self.restart_container()
+        if restart:
+            self.restart_container()
 
-    def run_process(self, check_interval_sec: int = 60):
-        """Run the tests on application and monitor logs until complete.
+    def run_process(self, check_interval_sec: int = 60, since: float | None = None):
+        """Run the tests on application and follow logs until complete.
         Parameters
         ----------
         check_interval_sec : int
-            Time interval in seconds to check the logs.
+            Time interval in seconds between status messages while waiting.
+        since : float | None
+            Unix timestamp to follow logs from, so markers of earlier runs are
+            ignored. All logs of the container are followed if None.
+        """
+        follower = LogFollower(
+            container_name=self.docker_container_name,
+            patterns=self.completion_patterns,
+            since=since,
+            on_line=lambda line: print(f"{self.log_prefix}{line}")
+        )
+        with follower:
+            while not follower.wait(timeout=check_interval_sec or None):
+                print(f"{self.log_prefix}Run not complete, waiting...")
+        print(f"{self.log_prefix}Run complete.")
+
+    def run_database(self, database_name: str, check_interval_sec: int = 30,
+                     result: RunResult | None = None) -> RunResult:
+        """Run the tests on a single database and time every phase.
+        Parameters
+        ----------
+        database_name : str
+            Name of the test database.
+        check_interval_sec : int
+            Warm-up time after the restart and interval between status messages.
+        result : RunResult | None
+            Result to fill in, so its status can be watched while running.
+        Returns
+        -------
+        RunResult
+            Status and time spent restarting, warming up and processing.
+        """
+        result = result or RunResult(database=database_name, container=self.docker_container_name)
+        result.status = "restarting"
+        started = time.time()
+        self.switch_database(database_name, restart=False)
+        self.restart_container()
+        result.restart_seconds = time.time() - started
+        result.status = "warming-up"
+        sleep(check_interval_sec)
+        result.warmup_seconds = time.time() - started - result.restart_seconds
+        result.status = "processing"
+        processing_started = time.perf_counter()
+        if self.monitor_interval_sec:
+            monitor = RunMonitor(
+                influx_client=self.influxdb_cli,
+                database_name=database_name,
+                source_measurement=SOURCE_MEASUREMENT,
+                poll_interval_sec=self.monitor_interval_sec,
+                ignored_measurements=[BATCH_MEASUREMENT],
+                on_sample=lambda sample: print(f"{self.log_prefix}Progress: {sample.describe()}")
+            )
+            with monitor:
+                self.run_process(check_interval_sec=check_interval_sec, since=started)
+            result.points = monitor.progress.points
+        else:
+            self.run_process(check_interval_sec=check_interval_sec, since=started)
+        result.processing_seconds = time.perf_counter() - processing_started
+        if result.processing_seconds:
+            result.points_per_sec = result.points / result.processing_seconds
+        result.status = "done"
+        return result
+
+    def run(self, check_interval_sec: int = 30) -> list[RunResult]:
+        """Run tests on all test databases.
+        Returns
+        -------
+        list[RunResult]
+            Results of the databases run before the campaign ended.
         """
-        while not self.is_run_complete(check_interval_sec):
-            print("Logs:")
-            print(self.get_logs(check_interval_sec))
-            print("Run not complete, waiting...")
-            time.sleep(check_interval_sec)
-        print("Run complete.")
-
-    def run(self, check_interval_sec: int = 30):
-        """Run tests on all test databases."""
+        results = []
         try:
             test_databases = self.get_test_databases()
             for db in test_databases:
-                print(f"Switching to database: {db}")
-                self.switch_database(db)
-                sleep(check_interval_sec)
                 print(f"Running process for database: {db}")
-                self.run_process(check_interval_sec=check_interval_sec)
+                result = RunResult(database=db, container=self.docker_container_name)
+                results.append(result)
+                try:
+                    self.run_database(db, check_interval_sec=check_interval_sec, result=result)
+                except Exception as e:
+                    result.status = "failed"
+                    result.error = f"{type(e).__name__}: {e}"
+                    raise
                 print(f"Completed process for database: {db}")
         except Exception as e:
             print(f"An error occurred: {e}")
@@ -186,3 +307,4 @@ class AppRunner:
             self.restore_config()
             self.restart_container()
             print("Configuration restored.")
+        return results
@@ -0,0 +1,92 @@
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+
+from influxdb_cli.core.app_runner import AppRunner, RunResult
+
+
+@dataclass
+class CampaignReport:
+    results: list[RunResult] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[RunResult]:
+        return [result for result in self.results if not result.ok]
+
+    def seconds_by_phase(self) -> dict[str, float]:
+        return {
+            "restart": sum(result.restart_seconds for result in self.results),
+            "warm-up": sum(result.warmup_seconds for result in self.results),
+            "processing": sum(result.processing_seconds for result in self.results),
+        }
+
+
+class CampaignScheduler:
+    """Run the test databases on a pool of application containers.
+
+    Every container has its own worker thread taking the next database from
+    a shared queue as soon as its previous run is finished, so restarts and
+    warm-ups of different containers overlap. Statuses in ``results`` are
+    updated while the campaign runs. A failed run is recorded and the
+    container moves on to the next database. Every container's config is
+    restored and the container restarted when the campaign ends, also when it
+    is interrupted.
+    """
+
+    def __init__(self, runners: list[AppRunner], check_interval_sec: int = 30):
+        if not runners:
+            raise ValueError("At least one application container is required.")
+        self.runners = runners
+        self.check_interval_sec = check_interval_sec
+        self.results: list[RunResult] = []
+        if len(runners) > 1:
+            for runner in runners:
+                runner.log_prefix = f"[{runner.docker_container_name}] "
+
+    def _work(self, runner: AppRunner, pending: queue.Queue) -> None:
+        while True:
+            try:
+                result = pending.get_nowait()
+            except queue.Empty:
+                return
+            result.container = runner.docker_container_name
+            print(f"{runner.log_prefix}Running process for database: {result.database}")
+            try:
+                runner.run_database(result.database, check_interval_sec=self.check_interval_sec,
+                                    result=result)
+            except Exception as e:
+                result.status = "failed"
+                result.error = f"{type(e).__name__}: {e}"
+            print(f"{runner.log_prefix}Database {result.database}: {result.status}")
+
+    def _restore(self, runner: AppRunner) -> None:
+        try:
+            runner.restore_config()
+            runner.restart_container()
+        except Exception as e:
+            print(f"{runner.log_prefix}Could not restore config: {e}")
+
+    def run(self, databases: list[str] | None = None) -> CampaignReport:
+        databases = databases if databases is not None else self.runners[0].get_test_databases()
+        self.results = [RunResult(database=db, container="") for db in databases]
+        pending = queue.Queue()
+        for result in self.results:
+            pending.put(result)
+        started = time.perf_counter()
+        threads = [threading.Thread(target=self._work, args=(runner, pending), daemon=True)
+                   for runner in self.runners]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=1)
+        finally:
+            # Stop handing out databases after an interrupt, runs not started stay pending
+            while not pending.empty():
+                pending.get_nowait()
+            for runner in self.runners:
+                self._restore(runner)
+        return CampaignReport(results=self.results, wall_seconds=time.perf_counter() - started)
@@ -0,0 +1,103 @@
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def ordered_parallel_map(func: Callable[[T], R], items: Iterable[T], workers: int,
+                         max_pending: int | None = None) -> Iterator[R]:
+    """Run ``func`` over ``items`` on a thread pool and yield results in input order.
+
+    Unlike ``ThreadPoolExecutor.map`` at most ``max_pending`` (defaults to
+    twice the number of workers) calls are submitted ahead of the consumer,
+    so results that are finished but not yet consumed stay bounded.
+    Parameters
+    ----------
+    func : Callable
+        Function to call for every item.
+    items : Iterable
+        Items to process.
+    workers : int
+        Number of worker threads.
+    max_pending : int | None
+        Maximum number of submitted but not yet consumed calls.
+    Returns
+    -------
+    Iterator
+        Results of ``func`` in the order of ``items``.
+    """
+    max_pending = max_pending or 2 * workers
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+_END_OF_ITERATION = object()
+
+
+def prefetch(items: Iterable[T], max_queued: int = 2) -> Iterator[T]:
+    """Produce ``items`` on a background thread ahead of the consumer.
+
+    The producer blocks once ``max_queued`` items wait in the queue, which
+    applies backpressure when the consumer is slower. Exceptions raised by
+    the producer are re-raised in the consumer.
+    Parameters
+    ----------
+    items : Iterable
+        Items to produce, e.g. chunks parsed from a file.
+    max_queued : int
+        Maximum number of produced items not yet taken by the consumer.
+    Returns
+    -------
+    Iterator
+        Items in the order they were produced.
+    """
+    buffer = queue.Queue(maxsize=max_queued)
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except BaseException as e:
+            put((_END_OF_ITERATION, e))
+            return
+        put((_END_OF_ITERATION, None))
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _END_OF_ITERATION:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
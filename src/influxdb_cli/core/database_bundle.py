@@ -0,0 +1,209 @@
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from influxdb_cli.core.concurrency import ordered_parallel_map
+from influxdb_cli.core.stream_writers import ParquetStreamWriter
+from influxdb_cli.core.write_pipeline import WritePipeline
+
+if TYPE_CHECKING:
+    from influxdb_cli.core.influx_client import InfluxClient
+
+MANIFEST_NAME = "manifest.json"
+BUNDLE_FORMAT_VERSION = 1
+
+FIELD_TYPES = {
+    "float": pa.float64(),
+    "integer": pa.int64(),
+    "string": pa.string(),
+    "boolean": pa.bool_(),
+}
+
+
+def _influx_duration(duration: str) -> str:
+    """Write a duration from ``SHOW RETENTION POLICIES`` (e.g. ``168h0m0s``) for InfluxQL."""
+    seconds = pd.Timedelta(duration) // pd.Timedelta(seconds=1)
+    return f"{seconds}s" if seconds else "INF"
+
+
+def measurement_schema(tags: list[str], fields: dict[str, str]) -> pa.Schema:
+    """Arrow schema of a measurement's rows, tags are strings, fields typed as in InfluxDB."""
+    return pa.schema(
+        [pa.field("time", pa.timestamp("ns", tz="UTC"))]
+        + [pa.field(tag, pa.string()) for tag in tags]
+        + [pa.field(name, FIELD_TYPES.get(field_type, pa.string()))
+           for name, field_type in fields.items()]
+    )
+
+
+def conform_table(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Cast a query result to ``schema``, columns missing from the result are all null."""
+    return pa.table([table.column(column.name).cast(column.type)
+                     if column.name in table.column_names
+                     else pa.nulls(table.num_rows, column.type)
+                     for column in schema], schema=schema)
+
+
+@dataclass
+class BundleMeasurement:
+    name: str
+    retention_policy: str
+    file: str
+    tags: list[str] = field(default_factory=list)
+    fields: dict[str, str] = field(default_factory=dict)
+    points: int = 0
+    seconds: float = 0.0
+
+    def schema(self) -> pa.Schema:
+        return measurement_schema(self.tags, self.fields)
+
+
+@dataclass
+class BundleReport:
+    database: str
+    path: str
+    measurements: list[BundleMeasurement] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def points(self) -> int:
+        return sum(measurement.points for measurement in self.measurements)
+
+
+class DatabaseBundle:
+    """Dump a whole database to a Parquet bundle and restore it.
+
+    A bundle is a directory with a ``manifest.json`` and one zstd compressed
+    Parquet file per measurement and retention policy. The manifest keeps
+    the retention policies of the database and the tag keys and field types
+    of every measurement, so a restore writes tags back as tags and fields
+    with their original types. Measurements are dumped concurrently on
+    ``workers`` threads, restore writes ``batch_size`` points per request on
+    ``workers`` threads.
+    """
+
+    def __init__(self, influx_client: "InfluxClient", workers: int = 4,
+                 chunk_size: int = 100000, batch_size: int = 10000):
+        self.influx_client = influx_client
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+
+    def dump(self, database_name: str, path: str | Path) -> BundleReport:
+        started = time.perf_counter()
+        path = Path(path)
+        if path.exists() and any(path.iterdir()):
+            raise FileExistsError(f"Bundle directory is not empty: {path}")
+        (path / "data").mkdir(parents=True, exist_ok=True)
+        retention_policies = self.influx_client.list_retention_policies(database_name)
+        tag_keys = self.influx_client.show_tag_keys(database_name)
+        field_keys = self.influx_client.show_field_keys(database_name)
+        measurements = []
+        for measurement_name in self.influx_client.show_measurements(database_name):
+            for rp in retention_policies:
+                measurements.append(BundleMeasurement(
+                    name=measurement_name,
+                    retention_policy=rp["name"],
+                    file=f"data/{len(measurements)}.parquet",
+                    tags=tag_keys.get(measurement_name, []),
+                    fields=field_keys.get(measurement_name, {})
+                ))
+
+        def dump_measurement(measurement: BundleMeasurement) -> BundleMeasurement:
+            measurement_started = time.perf_counter()
+            query = self.influx_client._build_select_query(
+                measurement_name=f'"{measurement.name}"',
+                retention_policy=f'"{measurement.retention_policy}"'
+            )
+            schema = measurement.schema()
+            writer = ParquetStreamWriter(path / measurement.file, compression="zstd")
+            with writer:
+                for tables in self.influx_client.query_chunks(
+                        query, database=database_name, chunk_size=self.chunk_size, arrow=True):
+                    table = tables.get(measurement.name)
+                    if table is not None:
+                        writer.write_table(conform_table(table, schema))
+            measurement.points = writer.rows_written
+            measurement.seconds = time.perf_counter() - measurement_started
+            return measurement
+
+        # Retention policies without data of a measurement leave no file behind
+        dumped = [measurement for measurement in
+                  ordered_parallel_map(dump_measurement, measurements, workers=self.workers)
+                  if measurement.points]
+        manifest = {
+            "format": BUNDLE_FORMAT_VERSION,
+            "database": database_name,
+            "created_at": pd.Timestamp.now(tz="UTC").isoformat(),
+            "retention_policies": retention_policies,
+            "measurements": [asdict(measurement) for measurement in dumped]
+        }
+        (path / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+        return BundleReport(database=database_name, path=str(path), measurements=dumped,
+                            wall_seconds=time.perf_counter() - started)
+
+    @staticmethod
+    def read_manifest(path: str | Path) -> dict:
+        manifest_path = Path(path) / MANIFEST_NAME
+        if not manifest_path.is_file():
+            raise FileNotFoundError(f"Bundle manifest not found: {manifest_path}")
+        manifest = json.loads(manifest_path.read_text())
+        if manifest.get("format") != BUNDLE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported bundle format: {manifest.get('format')}")
+        return manifest
+
+    def _create_database(self, database_name: str, retention_policies: list[dict]) -> None:
+        # Retention policies are taken from the bundle, not from the config
+        self.influx_client.create_database(database_name, retention_policy=None)
+        existing = {rp["name"] for rp in self.influx_client.list_retention_policies(database_name)}
+        for rp in retention_policies:
+            statement = "ALTER" if rp["name"] in existing else "CREATE"
+            default = " DEFAULT" if rp.get("default") else ""
+            self.influx_client.query(
+                f'{statement} RETENTION POLICY "{rp["name"]}" ON "{database_name}" '
+                f'DURATION {_influx_duration(rp["duration"])} REPLICATION {rp["replication"]} '
+                f'SHARD DURATION {_influx_duration(rp["shard_duration"])}{default}')
+
+    def restore(self, path: str | Path, database_name: str | None = None) -> BundleReport:
+        started = time.perf_counter()
+        path = Path(path)
+        manifest = self.read_manifest(path)
+        database_name = database_name or manifest["database"]
+        self._create_database(database_name, manifest["retention_policies"])
+        measurements = [BundleMeasurement(**{**entry, "points": 0, "seconds": 0.0})
+                        for entry in manifest["measurements"]]
+        # Shared by the workers, the in-flight limit holds for all of them together
+        pipeline = WritePipeline(self.influx_client)
+
+        def batches():
+            for measurement in measurements:
+                parquet_file = pq.ParquetFile(path / measurement.file)
+                for batch in parquet_file.iter_batches(batch_size=self.batch_size):
+                    yield measurement, pa.Table.from_batches([batch])
+
+        def write_batch(item: tuple[BundleMeasurement, pa.Table]) -> tuple:
+            measurement, table = item
+            batch_started = time.perf_counter()
+            points = self.influx_client.write_dataframe(
+                dataframe=table,
+                measurement=measurement.name,
+                database=database_name,
+                retention_policy=measurement.retention_policy,
+                tag_columns=measurement.tags,
+                time_precision="n",
+                pipeline=pipeline
+            )
+            return measurement, points, time.perf_counter() - batch_started
+
+        for measurement, points, seconds in ordered_parallel_map(write_batch, batches(),
+                                                                 workers=self.workers):
+            measurement.points += points
+            measurement.seconds += seconds
+        return BundleReport(database=database_name, path=str(path), measurements=measurements,
+                            wall_seconds=time.perf_counter() - started)
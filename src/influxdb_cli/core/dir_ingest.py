@@ -0,0 +1,155 @@
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from influxdb_cli.core.write_pipeline import WritePipeline
+
+if TYPE_CHECKING:
+    from influxdb_cli.core.influx_client import InfluxClient
+
+
+def parse_measurement_file(file_path: str) -> pd.DataFrame:
+    """Read a measurement file and give it a time index if it has none.
+
+    Module level so it can run in a worker process.
+    """
+    from influxdb_cli.core.influx_client import file_reader
+    data = file_reader(file_path)
+    if type(data.index) != pd.DatetimeIndex:
+        data.index = pd.date_range(start=pd.Timestamp.now(), periods=len(data), freq='ms')
+    return data
+
+
+@dataclass
+class FileIngestResult:
+    file: str
+    database: str
+    points: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class IngestReport:
+    results: list[FileIngestResult] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def points(self) -> int:
+        return sum(result.points for result in self.results)
+
+    @property
+    def failed(self) -> list[FileIngestResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def points_per_sec(self) -> float:
+        return self.points / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class _ByteBudget:
+    """Block producers while too many bytes are in flight.
+
+    A single item larger than the limit is still admitted once nothing else
+    is in flight, otherwise it could never be processed.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int) -> None:
+        with self._condition:
+            while self.in_flight and self.in_flight + size > self.limit:
+                self._condition.wait()
+            self.in_flight += size
+
+    def resize(self, old_size: int, new_size: int) -> None:
+        with self._condition:
+            self.in_flight += new_size - old_size
+            self._condition.notify_all()
+
+    def release(self, size: int) -> None:
+        self.resize(size, 0)
+
+
+class DirectoryIngestor:
+    """Load a directory of recordings concurrently, one database per file.
+
+    Files are parsed on a process pool and written on a thread pool sharing
+    the client's HTTP connection pool. The bytes of files that are parsed or
+    being written are capped by ``max_in_flight_bytes``: the on-disk size is
+    reserved before parsing and replaced by the DataFrame memory size once
+    the file is parsed. All writer threads share one ``WritePipeline``, so
+    batch sizing carries over between files and ``write_max_in_flight``
+    bounds the requests of all of them together.
+    """
+
+    def __init__(self,
+                 influx_client: "InfluxClient",
+                 workers: int = 4,
+                 max_in_flight_bytes: int = 512 * 1024 ** 2,
+                 parse_workers: int | None = None,
+                 pipeline: WritePipeline | None = None):
+        self.influx_client = influx_client
+        self.workers = workers
+        self.parse_workers = parse_workers or workers
+        self.budget = _ByteBudget(max_in_flight_bytes)
+        self.pipeline = pipeline or WritePipeline(influx_client)
+
+    def _write_file(self, file: Path, parsed: Future, reserved: int, started: float,
+                    measurement_name: str | None, add_batch_timestamp: bool) -> FileIngestResult:
+        result = FileIngestResult(file=str(file), database=file.stem)
+        try:
+            data = parsed.result()
+            in_memory = int(data.memory_usage(index=True).sum())
+            self.budget.resize(reserved, in_memory)
+            reserved = in_memory
+            self.influx_client.create_database(file.stem, retention_policy=True)
+            result.points = self.influx_client.write_dataframe(
+                dataframe=data,
+                measurement=measurement_name,
+                database=file.stem,
+                time_precision='ms',
+                pipeline=self.pipeline
+            )
+            del data
+            if add_batch_timestamp:
+                self.influx_client.add_first_timestamp_to_batch_measurement(
+                    database_name=file.stem,
+                    measurement_name=measurement_name
+                )
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        finally:
+            self.budget.release(reserved)
+            result.seconds = time.perf_counter() - started
+        return result
+
+    def ingest(self, files: list[Path], measurement_name: str | None = None,
+               add_batch_timestamp: bool = False) -> IngestReport:
+        report = IngestReport()
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as parsers, \
+                ThreadPoolExecutor(max_workers=self.workers) as writers:
+            write_futures = []
+            for file in files:
+                reserved = file.stat().st_size
+                self.budget.acquire(reserved)
+                parsed = parsers.submit(parse_measurement_file, str(file))
+                write_futures.append(writers.submit(
+                    self._write_file, file, parsed, reserved, time.perf_counter(),
+                    measurement_name, add_batch_timestamp))
+            report.results = [future.result() for future in write_futures]
+        report.wall_seconds = time.perf_counter() - started
+        return report
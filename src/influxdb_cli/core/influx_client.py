@@ -1,8 +1,38 @@
+import gzip
+import math
+import re
+import socket
+import threading
+import time
+from collections import defaultdict
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import requests
 from influxdb import DataFrameClient
-from influxdb_cli.config.config_manager import load_config, save_config
+from influxdb.exceptions import InfluxDBClientError
+from influxdb.resultset import ResultSet
+from urllib3.connection import HTTPConnection
+from influxdb_cli.config.config_manager import (ConfigModel, get_user_cache_dir, load_config,
+                                                 save_config, server_config)
+from influxdb_cli.core.concurrency import ordered_parallel_map, prefetch
+from influxdb_cli.core.database_bundle import FIELD_TYPES, BundleReport, DatabaseBundle
+from influxdb_cli.core.dir_ingest import DirectoryIngestor, IngestReport, parse_measurement_file
+from influxdb_cli.core.line_protocol import serialize_lines
+from influxdb_cli.core.maintenance import MaintenanceExecutor, MaintenanceReport
+from influxdb_cli.core.measurement_copy import CopyReport, MeasurementCopier
+from influxdb_cli.core.measurement_sync import MeasurementSync, SyncResult, rfc3339_ns
+from influxdb_cli.core.profiler import PROFILER, profile_phase
+from influxdb_cli.core.query_cache import QueryCache, settled_windows
+from influxdb_cli.core.response_decoders import (RESPONSE_FORMATS, CsvResponseError,
+                                                 decode_csv_response, decode_csv_tables,
+                                                 result_to_tables)
+from influxdb_cli.core.stream_readers import stream_reader
+from influxdb_cli.core.stream_writers import (ARROW_STREAM_WRITER_EXTENSIONS,
+                                             EXTENSIONS_STREAM_WRITER_MAPPING, stream_writer)
+from influxdb_cli.core.write_pipeline import WritePipeline, WriteStats
+from influxdb_cli.core.write_spool import SpoolFlusher, WriteSpool
 
 EXTENSIONS_READER_MAPPING = {
     '.csv': pd.read_csv,
@@ -20,6 +50,25 @@ EXTENSIONS_WRITER_MAPPING = {
     '.feather': pd.DataFrame.to_feather
 }
 
+DOWNSAMPLING_AGGREGATES = ('mean', 'median', 'mode', 'min', 'max', 'first', 'last', 'sum',
+                           'count', 'spread', 'stddev')
+
+# Aggregates answering floats whatever the field type, count answers integers
+FLOAT_AGGREGATES = ('mean', 'median', 'stddev')
+
+FILL_OPTIONS = ('none', 'null', 'previous', 'linear')
+
+# The measurement of a SELECT, e.g. m, "m", rp.m or "db".."m", not a regular expression
+_FROM_MEASUREMENT = re.compile(r'\bFROM\s+((?:"[^"]*"|[\w-]*)(?:\.(?:"[^"]*"|[\w-]*)){0,2})(?=[\s,;]|$)',
+                               re.IGNORECASE)
+_IDENTIFIER_PART = re.compile(r'"[^"]*"|[\w-]+|(?<=\.)(?=\.)')
+_COUNT_CALL = re.compile(r'\bcount\s*\(', re.IGNORECASE)
+
+INFLUX_DURATION_UNITS = (('w', pd.Timedelta(weeks=1)), ('d', pd.Timedelta(days=1)),
+                         ('h', pd.Timedelta(hours=1)), ('m', pd.Timedelta(minutes=1)),
+                         ('s', pd.Timedelta(seconds=1)), ('ms', pd.Timedelta(milliseconds=1)),
+                         ('u', pd.Timedelta(microseconds=1)), ('ns', pd.Timedelta(1)))
+
 
 def file_reader(file_path: str) -> pd.DataFrame:
     file_path = Path(file_path)
@@ -36,7 +85,8 @@ def file_writer(df: pd.DataFrame, file_path: str) -> None:
     extension = file_path.suffix.lower()
     if extension not in EXTENSIONS_WRITER_MAPPING:
         raise ValueError(f"Unsupported file extension: {extension}")
-    EXTENSIONS_WRITER_MAPPING[extension](df, file_path)
+    with profile_phase("file_writer", rows=len(df)):
+        EXTENSIONS_WRITER_MAPPING[extension](df, file_path)
     return
 
 
@@ -50,10 +100,60 @@ def timestamp_passer(timestamp: str) -> str:
     ]
     for pattern in supported_patterns:
         if is_valid_timestamp(timestamp, pattern):
-            return pd.to_datetime(timestamp, format="ISO8601").strftime(rfc3339_pattern)
+            return rfc3339_ns(pd.to_datetime(timestamp, format="ISO8601"))
     raise ValueError(f"Timestamp '{timestamp}' does not match any supported format.")
 
 
+def split_time_range(from_time: str, to_time: str, slice_duration: str) -> list[tuple[str, str]]:
+    """Split ``[from_time, to_time]`` into consecutive windows of ``slice_duration``.
+
+    Windows are half open ``[start, end)`` except the last one which keeps the
+    inclusive end of the requested range. Timestamps are returned in RFC 3339
+    with nanoseconds, so the inclusive end does not miss sub-microsecond points.
+    """
+    step = pd.Timedelta(slice_duration)
+    if step <= pd.Timedelta(0):
+        raise ValueError(f"Slice duration must be positive, got '{slice_duration}'.")
+    start = pd.to_datetime(timestamp_passer(from_time), format="ISO8601")
+    end = pd.to_datetime(timestamp_passer(to_time), format="ISO8601")
+    if start > end:
+        raise ValueError("Start of the time range is after its end.")
+    windows = []
+    while start + step < end:
+        windows.append((rfc3339_ns(start), rfc3339_ns(start + step)))
+        start += step
+    windows.append((rfc3339_ns(start), rfc3339_ns(end)))
+    return windows
+
+
+def influx_duration(duration: str | pd.Timedelta) -> str:
+    """Write a duration as an InfluxQL duration literal, e.g. ``1min`` as ``1m``."""
+    duration = pd.Timedelta(duration)
+    if duration <= pd.Timedelta(0):
+        raise ValueError(f"Duration must be positive, got '{duration}'.")
+    for unit, length in INFLUX_DURATION_UNITS:
+        if duration % length == pd.Timedelta(0):
+            return f"{duration // length}{unit}"
+
+
+def downsample_windows(start: pd.Timestamp, end: pd.Timestamp, every: str | pd.Timedelta,
+                       max_buckets: int) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+    """Split ``[start, end]`` into windows of at most ``max_buckets`` ``GROUP BY time()`` buckets.
+
+    InfluxDB aligns buckets to the epoch, so inner window edges are put on
+    bucket edges and no bucket is aggregated partly in two queries.
+    """
+    every = pd.Timedelta(every)
+    step = every * max_buckets
+    windows = []
+    edge = start.floor(every) + step
+    while edge < end:
+        windows.append((start, edge))
+        start, edge = edge, edge + step
+    windows.append((start, end))
+    return windows
+
+
 def is_valid_timestamp(timestamp: str, pattern: str) -> bool:
     try:
         pd.to_datetime(timestamp, format=pattern)
@@ -62,26 +162,227 @@ def is_valid_timestamp(timestamp: str, pattern: str) -> bool:
         return False
 
 
+def is_number(value: str) -> bool:
+    """True for finite numbers only, InfluxQL has no ``nan`` or ``inf`` literals."""
+    try:
+        return math.isfinite(float(value))
+    except (ValueError, TypeError):
+        return False
+
+
 class InfluxClient(DataFrameClient):
-    def __init__(self):
-        self.config = load_config()
+    def __init__(self, config: ConfigModel | None = None):
+        self.config = config or load_config()
+        headers = None
+        socket_options = None
+        if self.config.keep_alive:
+            socket_options = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        else:
+            headers = {'Connection': 'close'}
+        # gzip is handled in request() to control the compression level
         super().__init__(host=self.config.host, port=self.config.port,
-                         database=self.config.database)
+                         database=self.config.database,
+                         pool_size=self.config.pool_size,
+                         timeout=(self.config.connect_timeout, self.config.read_timeout),
+                         retries=self.config.retries,
+                         headers=headers,
+                         socket_options=socket_options)
+        # Tags and string fields per (database, measurement) for decoding CSV answers
+        self._string_columns: dict[tuple[str, str], frozenset] = {}
+        # Time the HTTP exchange alone to tell it apart from decoding when profiling
+        self._local = threading.local()
+        self._session_request = self._session.request
+        self._session.request = self._send_http
+
+    def _send_http(self, *args, **kwargs):
+        with profile_phase("http") as record:
+            started = time.perf_counter()
+            response = self._session_request(*args, **kwargs)
+            if PROFILER.enabled and not kwargs.get("stream"):
+                record.bytes = len(response.content)
+            self._local.http_seconds = time.perf_counter() - started
+        return response
+
+    def _profile_response(self, response, data, stream: bool, started: float) -> None:
+        seconds = time.perf_counter() - started
+        PROFILER.add("request", seconds, bytes=len(data or b""), started=started)
+        if getattr(response, "_msgpack", None) is not None:
+            # msgpack bodies are decoded inside the parent request()
+            decode_seconds = seconds - getattr(self._local, "http_seconds", 0.0)
+            PROFILER.add("decode", decode_seconds, bytes=len(response.content))
+        elif not stream:
+            decode_json = response.json
+
+            def timed_json(**kwargs):
+                with profile_phase("decode", bytes=len(response.content)):
+                    return decode_json(**kwargs)
+            response.json = timed_json
+
+    def check_connection(self) -> str:
+        """Ping the server and return its version.
+
+        Construction does not ping, a server that is down is reported by the
+        first request instead, saving a round-trip on every invocation.
+        """
+        with profile_phase("ping"):
+            return self.ping()
+
+    @property
+    def _retries(self) -> int:
+        """Connection attempts of the parent ``request``, ``request(retries=...)`` overrides them."""
+        retries = getattr(getattr(self, "_local", None), "retries", None)
+        return self._connection_retries if retries is None else retries
+
+    @_retries.setter
+    def _retries(self, retries: int) -> None:
+        self._connection_retries = retries
+
+    def request(self, url, method='GET', params=None, data=None, stream=False,
+                expected_response_code=200, headers=None, retries=None):
+        """Send a request, gzip compressing its body when enabled in the config.
+
+        Responses are always requested with ``Accept-Encoding: gzip`` when
+        gzip is enabled; ``requests`` decompresses them transparently.
+        ``retries`` replaces the ``retries`` config value for this request,
+        e.g. 1 to connect only once.
+        """
+        accept = getattr(self._local, "accept", None)
+        if accept is not None and headers is None:
+            headers = {**self._headers, 'Accept': accept}
+        if self.config.gzip:
+            headers = {**(headers or self._headers), 'Accept-Encoding': 'gzip'}
+            if data is not None:
+                if isinstance(data, str):
+                    data = data.encode('utf-8')
+                data = gzip.compress(data, compresslevel=self.config.gzip_level)
+                headers['Content-Encoding'] = 'gzip'
+        started = time.perf_counter()
+        self._local.retries = retries
         try:
-            super().ping()
-        except Exception as e:
+            response = super().request(url, method=method, params=params, data=data,
+                                       stream=stream,
+                                       expected_response_code=expected_response_code,
+                                       headers=headers)
+        except requests.exceptions.ConnectionError as e:
             raise ConnectionError("Could not connect to InfluxDB.") from e
+        finally:
+            self._local.retries = None
+        if PROFILER.enabled:
+            self._profile_response(response, data, stream, started)
+        return response
+
+    def query(self, query, params=None, bind_params=None, epoch=None,
+              expected_response_code=200, database=None, raise_errors=True, chunked=False,
+              chunk_size=0, method='GET', dropna=True, data_frame_index=None,
+              response_format=None):
+        """Run a query asking for ``response_format``, the config value by default.
+
+        ``json`` and ``msgpack`` are decoded by the parent ``query``. ``csv``
+        answers to a single SELECT statement are decoded column-wise by Arrow
+        without Python objects per row; other statements are asked for in
+        msgpack, and an answer in another format than CSV is decoded like JSON.
+        """
+        response_format = response_format or self.config.response_format
+        if response_format not in RESPONSE_FORMATS:
+            raise ValueError(f"Unsupported response format: {response_format}")
+        single_select = (query.lstrip().upper().startswith("SELECT")
+                         and ";" not in query.strip().rstrip(";"))
+        if (response_format == "csv" and single_select and not chunked and epoch is None
+                and bind_params is None):
+            return self._query_csv(query, params=params, database=database, method=method,
+                                   expected_response_code=expected_response_code,
+                                   dropna=dropna, data_frame_index=data_frame_index)
+        if response_format == "csv":
+            response_format = "msgpack"
+        self._local.accept = RESPONSE_FORMATS[response_format]
+        try:
+            return super().query(query, params=params, bind_params=bind_params, epoch=epoch,
+                                 expected_response_code=expected_response_code,
+                                 database=database, raise_errors=raise_errors, chunked=chunked,
+                                 chunk_size=chunk_size, method=method, dropna=dropna,
+                                 data_frame_index=data_frame_index)
+        finally:
+            self._local.accept = None
+
+    def _query_csv(self, query: str, params: dict | None, database: str | None, method: str,
+                   expected_response_code: int, dropna: bool, data_frame_index) -> dict:
+        params = {**(params or {}), 'q': query, 'db': database or self._database}
+        if " into " in query.lower():
+            method = "POST"
+        headers = {**self._headers, 'Accept': RESPONSE_FORMATS["csv"]}
+        response = self.request(url="query", method=method, params=params, headers=headers,
+                                expected_response_code=expected_response_code)
+        if "csv" not in response.headers.get("Content-Type", ""):
+            # The server does not support CSV, decode its answer like the parent query()
+            data = response._msgpack or response.json()
+            results = [ResultSet(result) for result in data.get('results', [])]
+            if not results:
+                return {}
+            return self._to_dataframe(results[0] if len(results) == 1 else results, dropna,
+                                      data_frame_index=data_frame_index)
+        string_columns = self.csv_string_columns(query, params['db'])
+        with profile_phase("decode", bytes=len(response.content)) as record:
+            try:
+                df_dict = decode_csv_response(response.content, dropna=dropna,
+                                              string_columns=string_columns)
+            except CsvResponseError as e:
+                raise InfluxDBClientError(str(e)) from e
+            record.rows = sum(len(df) for df in df_dict.values())
+        if data_frame_index:
+            for df in df_dict.values():
+                df.set_index(data_frame_index, inplace=True)
+        return df_dict
+
+    def csv_string_columns(self, query: str, database: str | None) -> frozenset:
+        """Tags and string fields of the measurement a SELECT reads from.
+
+        CSV answers do not tell strings from numbers, these columns are kept
+        as strings when decoding. They are looked up once per measurement.
+        ``count()`` answers numbers for any field, no column is kept then.
+        """
+        match = _FROM_MEASUREMENT.search(query)
+        if match is None or _COUNT_CALL.search(query):
+            return frozenset()
+        parts = [part.strip('"') for part in _IDENTIFIER_PART.findall(match.group(1))]
+        if not parts or not parts[-1]:
+            # A subquery
+            return frozenset()
+        database = parts[0] if len(parts) == 3 else database
+        key = (database, parts[-1])
+        if key not in self._string_columns:
+            tags = self.show_tag_keys(database, parts[-1]).get(parts[-1], [])
+            fields = self.show_field_keys(database, parts[-1]).get(parts[-1], {})
+            self._string_columns[key] = frozenset(
+                tags + [name for name, field_type in fields.items() if field_type == "string"])
+        return self._string_columns[key]
 
     def _to_dataframe(self, rs, dropna=True, data_frame_index=None):
-        """Override the parent _to_dataframe to handle mixed ISO8601 timestamp formats."""
-        from collections import defaultdict
-        result = defaultdict(list)
+        """Override the parent _to_dataframe to handle mixed ISO8601 timestamp formats.
+
+        Every series is assembled column by column and the ``time`` column is
+        parsed with one vectorized ``pd.to_datetime`` call per result key.
+        A multi-statement query gives one result dict per statement.
+        """
+        if isinstance(rs, list):
+            return [self._to_dataframe(result, dropna=dropna, data_frame_index=data_frame_index)
+                    for result in rs]
+        with profile_phase("to_dataframe") as record:
+            df_dict = self._result_to_dataframes(rs, dropna, data_frame_index)
+            record.rows = sum(len(df) for df in df_dict.values())
+        return df_dict
+
+    @staticmethod
+    def _result_to_dataframes(rs, dropna: bool, data_frame_index) -> dict:
+        frames = defaultdict(list)
 
         for series in rs.raw.get("series", []):
+            values = series.get("values", [])
+            if not values:
+                continue
             name = series.get("name")
             tags = series.get("tags", {})
             columns = series.get("columns", [])
-            values = series.get("values", [])
 
             # Build key based on name and tags
             if tags:
@@ -89,24 +390,68 @@ class InfluxClient(DataFrameClient):
             else:
                 key = name
 
-            # Convert rows to dictionaries
-            for row in values:
-                point = dict(zip(columns, row))
-                # Convert time strings using format='ISO8601' to handle mixed formats
-                if 'time' in point:
-                    point['time'] = pd.to_datetime(point['time'], format='ISO8601')
-                result[key].append(point)
+            frames[key].append(pd.DataFrame(dict(zip(columns, zip(*values)))))
 
         df_dict = {}
-        for key in result:
-            df_dict[key] = pd.DataFrame(result[key])
+        for key, key_frames in frames.items():
+            if len(key_frames) == 1:
+                df = key_frames[0]
+            else:
+                df = pd.concat(key_frames, ignore_index=True)
+            if 'time' in df.columns:
+                # format='ISO8601' handles mixed precision timestamps in one pass
+                df['time'] = pd.to_datetime(df['time'], format='ISO8601')
             if dropna:
-                df_dict[key].dropna(inplace=True)
+                df.dropna(inplace=True)
             if data_frame_index:
-                df_dict[key].set_index(data_frame_index, inplace=True)
+                df.set_index(data_frame_index, inplace=True)
+            df_dict[key] = df
 
         return df_dict
 
+    def write_dataframe(
+            self,
+            dataframe: pd.DataFrame,
+            measurement: str,
+            database: str | None = None,
+            retention_policy: str | None = None,
+            tag_columns: list[str] | None = None,
+            time_precision: str = 'ms',
+            batch_size: int | None = None,
+            stats: WriteStats | None = None,
+            spool: WriteSpool | None = None,
+            pipeline: WritePipeline | None = None
+    ) -> int:
+        """Write a DataFrame with the vectorized line protocol serializer.
+
+        Drop-in replacement for ``write_points`` with line protocol. Floats use
+        the fast shortest round-trip spelling, which InfluxDB parses to the
+        same values as ``write_points`` output. Points are sent by the
+        ``WritePipeline``: batches are sized from the observed latency unless
+        ``batch_size`` is given, sent concurrently and retried on transient
+        failures. Operations writing many DataFrames pass one ``pipeline``
+        for all of them, so batch sizing carries over and the in-flight limit
+        holds across their threads; ``batch_size`` only applies to the
+        pipeline made for a single call. Counters are added to ``stats`` when
+        given. With a ``spool`` the points are appended to it instead and
+        sent by its flusher. Returns the number of points written.
+        """
+        params = {'db': database or self._database, 'precision': time_precision}
+        if retention_policy is not None:
+            params['rp'] = retention_policy
+        headers = {**self._headers, 'Content-Type': 'application/octet-stream'}
+        with profile_phase("serialize", rows=len(dataframe)):
+            lines = serialize_lines(
+                dataframe,
+                measurement=measurement,
+                tag_columns=tag_columns,
+                time_precision=time_precision,
+                float_format="shortest")
+        if spool is not None:
+            return spool.append(lines)
+        pipeline = pipeline or WritePipeline(self, batch_size=batch_size)
+        return pipeline.write(lines, params, headers, stats)
+
     def is_default_rp(self, default_rp: bool) -> str:
         if default_rp:
             return "DEFAULT"
@@ -177,53 +522,95 @@ class InfluxClient(DataFrameClient):
         return
 
     def switch_database(self, database_name: str):
+        """Set the active database and persist it in the user config.
+
+        Only ``influx database use`` should call this. Every other operation
+        takes its database as an argument and leaves the config untouched.
+        """
         super().switch_database(database_name)
         self.config.database = database_name
         save_config(self.config)
         return
 
     def show_measurements(self, database_name: str | None = None) -> list[str]:
-        prev_database = self.config.database
-        if database_name:
-            self.switch_database(database_name)
-        result = self.query("SHOW MEASUREMENTS")
+        result = self.query("SHOW MEASUREMENTS", database=database_name or self.config.database)
         measurements = [measurement['name'] for measurement in result.get_points()]
-        if database_name and prev_database:
-            self.switch_database(prev_database)
         return measurements
 
+    def show_tag_keys(self, database_name: str,
+                      measurement_name: str | None = None) -> dict[str, list[str]]:
+        """Return the tag keys of every measurement, or only of ``measurement_name``."""
+        from_clause = f' FROM "{measurement_name}"' if measurement_name else ""
+        result = self.query(f"SHOW TAG KEYS{from_clause}", database=database_name)
+        return {name: [point["tagKey"] for point in points] for (name, _), points in result.items()}
+
+    def show_field_keys(self, database_name: str,
+                        measurement_name: str | None = None) -> dict[str, dict[str, str]]:
+        """Return the field types of every measurement, or only of ``measurement_name``.
+
+        A field written with different types to different shards keeps the
+        first type InfluxDB lists.
+        """
+        from_clause = f' FROM "{measurement_name}"' if measurement_name else ""
+        result = self.query(f"SHOW FIELD KEYS{from_clause}", database=database_name)
+        field_keys = {}
+        for (name, _), points in result.items():
+            fields = field_keys.setdefault(name, {})
+            for point in points:
+                fields.setdefault(point["fieldKey"], point["fieldType"])
+        return field_keys
+
+    def measurement_column_types(self, measurement_name: str, database_name: str,
+                                 aggregate: str | None = None) -> dict[str, pa.DataType]:
+        """Arrow types of a measurement's tags and fields, of their ``aggregate`` when given.
+
+        Exports cast every chunk to them, types inferred per chunk differ
+        e.g. for float fields holding only whole numbers. Aggregates are
+        keyed by the field name, as aliased columns are named, and by the
+        ``<aggregate>_<field>`` name InfluxDB gives ``<aggregate>(*)`` columns.
+        """
+        column_types = {tag: pa.string() for tag in
+                        self.show_tag_keys(database_name, measurement_name).get(measurement_name, [])}
+        fields = self.show_field_keys(database_name, measurement_name).get(measurement_name, {})
+        for name, field_type in fields.items():
+            if aggregate == "count":
+                column_types[name] = pa.int64()
+            elif aggregate in FLOAT_AGGREGATES and field_type in ("float", "integer"):
+                column_types[name] = pa.float64()
+            else:
+                column_types[name] = FIELD_TYPES.get(field_type, pa.string())
+        if aggregate:
+            for name in fields:
+                column_types.setdefault(f"{aggregate}_{name}", column_types[name])
+        return column_types
+
     def add_first_timestamp_to_batch_measurement(
             self,
             database_name: str,
             measurement_name: str,
             batch_measurement_name: str = "batch_timestamps"
     ):
-        self.switch_database(database_name)
         query = f"""SELECT * FROM {measurement_name} ORDER BY time ASC LIMIT 1"""
-        result = self.query(query)
+        result = self.query(query, database=database_name)
         first_timestamp = result[measurement_name]['time'].iloc[0]
         first_timestamp_str = pd.to_datetime(first_timestamp).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
         batch_data = pd.DataFrame(
             data={'end_time': [first_timestamp_str]},
             index=[pd.to_datetime(pd.Timestamp.now(tz="UTC"))]
         )
-        self.write_points(
+        self.write_dataframe(
             dataframe=batch_data,
             measurement=batch_measurement_name,
             database=database_name,
-            time_precision='ms',
-            batch_size=1000
+            time_precision='ms'
         )
         print(f"Added the first timestamp {first_timestamp_str} for measurement "
               f"'{measurement_name}' in database '{database_name}'.")
         return
 
     def delete_measurement(self, measurement_name: str, database_name: str | None = None):
-        prev_db = self.config.database
-        database_name = database_name or self.config.database
-        self.switch_database(database_name)
-        self.query(f"DROP MEASUREMENT {measurement_name}")
-        self.switch_database(prev_db)
+        self.query(f"DROP MEASUREMENT {measurement_name}",
+                   database=database_name or self.config.database)
         return
 
     def add_measurements(
@@ -231,54 +618,145 @@ class InfluxClient(DataFrameClient):
             database_name: str | None = None,
             file_path: str | None = None,
             measurement_name: str | None = None,
-            add_batch_timestamp: bool = False
-    ):
-        data = file_reader(file_path)
-        if type(data.index) != pd.DatetimeIndex:
-            start_ts = pd.Timestamp.now().strftime("%Y-%m-%dT%H:%M:%SZ")
-            data.index = pd.date_range(start=start_ts, periods=len(data), freq='ms', tz="UTC")
+            add_batch_timestamp: bool = False,
+            chunk_size: int | None = None,
+            retention_policy: str | None = None,
+            spool_dir: str | None = None
+    ) -> WriteStats:
+        """Write a file to a measurement.
+
+        With ``spool_dir`` parsed points go to a write-ahead ``WriteSpool``
+        first and are sent by a background ``SpoolFlusher``, so ingestion
+        rides out server outages. Points the flusher could not send before an
+        error stay in the spool for ``spool flush``.
+        """
         if measurement_name is None:
             measurement_name = Path(file_path).stem
-        self.write_points(
-            dataframe=data,
-            measurement=measurement_name,
-            database=database_name or self.config.database,
-            time_precision='ms',
-            batch_size=1000
-        )
+        database_name = database_name or self.config.database
+        stats = WriteStats()
+        flusher = None
+        if spool_dir is not None:
+            spool = WriteSpool.create(spool_dir, database=database_name,
+                                      retention_policy=retention_policy, time_precision='ms',
+                                      segment_bytes=self.config.spool_segment_mb * 1024 ** 2)
+            flusher = SpoolFlusher(self, spool).start()
+        try:
+            if chunk_size:
+                self._add_measurements_streaming(
+                    database_name=database_name,
+                    file_path=file_path,
+                    measurement_name=measurement_name,
+                    chunk_size=chunk_size,
+                    retention_policy=retention_policy,
+                    stats=stats,
+                    flusher=flusher
+                )
+            else:
+                data = file_reader(file_path)
+                if type(data.index) != pd.DatetimeIndex:
+                    start_ts = pd.Timestamp.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+                    data.index = pd.date_range(start=start_ts, periods=len(data), freq='ms',
+                                               tz="UTC")
+                self.write_dataframe(
+                    dataframe=data,
+                    measurement=measurement_name,
+                    database=database_name,
+                    retention_policy=retention_policy,
+                    time_precision='ms',
+                    stats=stats,
+                    spool=flusher.spool if flusher else None
+                )
+            if flusher is not None:
+                stats = flusher.finish()
+        except BaseException:
+            if flusher is not None:
+                flusher.abort()
+            raise
         if add_batch_timestamp:
             self.add_first_timestamp_to_batch_measurement(
-                database_name=database_name or self.config.database,
+                database_name=database_name,
                 measurement_name=measurement_name
             )
-        return len(data)
+        return stats
+
+    def flush_spool(self, spool_dir: str) -> WriteStats:
+        """Send the points left in a write spool, e.g. after an interrupted load, and remove it."""
+        return SpoolFlusher(self, WriteSpool(spool_dir), follow=False).run()
+
+    def _add_measurements_streaming(
+            self,
+            database_name: str,
+            file_path: str,
+            measurement_name: str,
+            chunk_size: int,
+            retention_policy: str | None = None,
+            max_queued_chunks: int = 2,
+            stats: WriteStats | None = None,
+            flusher: SpoolFlusher | None = None
+    ) -> int:
+        """Write a file chunk by chunk while the next chunks are parsed in the background.
+
+        Files without a time index get one synthetic millisecond timeline that
+        continues across chunk boundaries, exactly as if the file was read whole.
+        """
+        start_ts = pd.Timestamp(pd.Timestamp.now().strftime("%Y-%m-%dT%H:%M:%SZ"))
+        points = 0
+        # One pipeline for all chunks, batch sizes keep adapting from chunk to chunk
+        pipeline = WritePipeline(self)
+        chunks = prefetch(stream_reader(file_path, chunk_size), max_queued=max_queued_chunks)
+        for data in chunks:
+            if flusher is not None:
+                flusher.check()
+            if type(data.index) != pd.DatetimeIndex:
+                data.index = pd.date_range(start=start_ts + pd.Timedelta(milliseconds=points),
+                                           periods=len(data), freq='ms', tz="UTC")
+            self.write_dataframe(
+                dataframe=data,
+                measurement=measurement_name,
+                database=database_name,
+                retention_policy=retention_policy,
+                time_precision='ms',
+                stats=stats,
+                spool=flusher.spool if flusher else None,
+                pipeline=pipeline
+            )
+            points += len(data)
+        return points
 
     def add_measurement_from_dir(
             self,
             file_path: str | None = None,
             measurement_name: str | None = None,
-            add_batch_timestamp: bool = False
-    ):
+            add_batch_timestamp: bool = False,
+            workers: int | None = None,
+            max_in_flight_bytes: int = 512 * 1024 ** 2
+    ) -> IngestReport | None:
         if file_path is None:
             raise ValueError("Directory path must be provided.")
         dir_path = Path(file_path)
         if not dir_path.exists() or not dir_path.is_dir():
             raise FileNotFoundError(f"Directory not found: {dir_path}")
-        for file in dir_path.iterdir():
-            if not file.is_file():
-                continue
-            data = file_reader(str(file))
-            if type(data.index) != pd.DatetimeIndex:
-                data.index = pd.date_range(start=pd.Timestamp.now(), periods=len(data),
-                                           freq='ms')
+        files = [file for file in dir_path.iterdir() if file.is_file()]
+        pipeline = WritePipeline(self)
+        if workers:
+            ingestor = DirectoryIngestor(
+                influx_client=self,
+                workers=workers,
+                max_in_flight_bytes=max_in_flight_bytes,
+                pipeline=pipeline
+            )
+            return ingestor.ingest(files, measurement_name=measurement_name,
+                                   add_batch_timestamp=add_batch_timestamp)
+        for file in files:
+            data = parse_measurement_file(str(file))
             measurement = measurement_name
             self.create_database(file.stem, retention_policy=True)
-            self.write_points(
+            self.write_dataframe(
                 dataframe=data,
                 measurement=measurement,
                 database=file.stem,
                 time_precision='ms',
-                batch_size=1000
+                pipeline=pipeline
             )
             if add_batch_timestamp:
                 self.add_first_timestamp_to_batch_measurement(
@@ -286,6 +764,479 @@ class InfluxClient(DataFrameClient):
                     measurement_name=measurement
                 )
         return
+
+    @staticmethod
+    def _build_select_query(
+            measurement_name: str,
+            retention_policy: str | None = None,
+            column_names: str | list[str] | None = None,
+            from_time: str | None = None,
+            to_time: str | None = None,
+            where_clause: str | None = None,
+            limit: int | None = None,
+            inclusive_end: bool = True,
+            every: str | None = None,
+            aggregate: str = "mean",
+            fill: str | None = None,
+            into: str | None = None
+    ) -> str:
+        from_time = timestamp_passer(from_time) if from_time else None
+        to_time = timestamp_passer(to_time) if to_time else None
+
+        if isinstance(column_names, str):
+            # --column takes a comma separated list
+            column_names = [column.strip() for column in column_names.split(",") if column.strip()]
+
+        if every:
+            if aggregate not in DOWNSAMPLING_AGGREGATES:
+                raise ValueError(f"Unsupported aggregate '{aggregate}', use one of: "
+                                 f"{', '.join(DOWNSAMPLING_AGGREGATES)}.")
+            # Aliases keep the column names, aggregate(*) names them e.g. mean_power
+            select_clause = (", ".join(f"{aggregate}({column}) AS {column}"
+                                       for column in column_names)
+                             if column_names else f"{aggregate}(*)")
+        else:
+            select_clause = ", ".join(column_names) if column_names else "*"
+
+        from_clause = f"{retention_policy}.{measurement_name}" if retention_policy else measurement_name
+
+        conditions = []
+        if from_time:
+            conditions.append(f"time >= '{from_time}'")
+        if to_time:
+            conditions.append(f"time {'<=' if inclusive_end else '<'} '{to_time}'")
+        if where_clause:
+            conditions.append(where_clause)
+
+        where_clause_str = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        if into:
+            # Without GROUP BY * the tags would be written as fields
+            select_clause += f" INTO {into}"
+        group_by_clause = " GROUP BY *" if into else ""
+        if every:
+            group_by_clause = f" GROUP BY time({influx_duration(every)}){', *' if into else ''}"
+            if fill:
+                if fill not in FILL_OPTIONS and not is_number(fill):
+                    raise ValueError(f"Unsupported fill '{fill}', use a number or one of: "
+                                     f"{', '.join(FILL_OPTIONS)}.")
+                group_by_clause += f" fill({fill})"
+        limit_clause = f" LIMIT {limit}" if limit else ""
+
+        return (f"SELECT {select_clause} FROM {from_clause}{where_clause_str}{group_by_clause}"
+                f"{limit_clause}")
+
+    def query_arrow(self, query: str, database: str | None = None,
+                    response_format: str | None = None) -> dict:
+        """Run a single SELECT statement and return an Arrow table per series.
+
+        Keys are the same as in ``query`` results. No DataFrame is built: CSV
+        answers are parsed by Arrow directly, JSON and msgpack series are
+        converted column by column.
+        """
+        response_format = response_format or self.config.response_format
+        params = {'q': query, 'db': database or self._database}
+        headers = {**self._headers, 'Accept': RESPONSE_FORMATS[response_format]}
+        response = self.request(url="query", method="GET", params=params, headers=headers)
+        if "csv" in response.headers.get("Content-Type", ""):
+            with profile_phase("decode", bytes=len(response.content)) as record:
+                try:
+                    tables = decode_csv_tables(
+                        response.content, self.csv_string_columns(query, params['db']))
+                except CsvResponseError as e:
+                    raise InfluxDBClientError(str(e)) from e
+                record.rows = sum(table.num_rows for table in tables.values())
+            return tables
+        results = (response._msgpack or response.json()).get('results', [])
+        if not results:
+            return {}
+        if 'error' in results[0]:
+            raise InfluxDBClientError(results[0]['error'])
+        with profile_phase("to_arrow") as record:
+            tables = result_to_tables(results[0])
+            record.rows = sum(table.num_rows for table in tables.values())
+        return tables
+
+    def query_chunks(self, query: str, database: str | None = None, chunk_size: int = 10000,
+                     dropna: bool = True, arrow: bool = False):
+        """Run a SELECT query with InfluxDB chunked responses.
+
+        The response body is read line by line and every chunk is yielded as
+        soon as it arrives, converted the same way as ``query`` results, or to
+        Arrow tables like ``query_arrow`` results when ``arrow`` is set, so
+        only one chunk is held in memory at a time.
+        """
+        # Chunked responses are newline separated JSON documents, msgpack is not streamable.
+        headers = {**self._headers, 'Accept': 'application/json'}
+        params = {
+            'q': query,
+            'db': database or self._database,
+            'chunked': 'true',
+            'chunk_size': chunk_size
+        }
+        response = self.request(url="query", method="GET", params=params,
+                                stream=True, headers=headers)
+        try:
+            for result_set in self._read_chunked_response(response):
+                if arrow:
+                    with profile_phase("to_arrow"):
+                        tables = result_to_tables(result_set.raw)
+                    yield tables
+                else:
+                    yield self._to_dataframe(result_set, dropna=dropna)
+        finally:
+            response.close()
+
+    def export_measurement_chunked(
+            self,
+            query: str,
+            measurement_name: str,
+            database_name: str,
+            path: str,
+            chunk_size: int = 10000
+    ) -> int:
+        column_types = self.measurement_column_types(measurement_name, database_name)
+        with stream_writer(path, column_types=column_types) as writer:
+            for df_dict in self.query_chunks(query, database=database_name, chunk_size=chunk_size):
+                if measurement_name not in df_dict:
+                    continue
+                writer.write(df_dict[measurement_name].set_index("time", drop=True))
+        return writer.rows_written
+
+    def export_measurement_arrow(
+            self,
+            query: str,
+            measurement_name: str,
+            database_name: str,
+            path: str,
+            chunk_size: int | None = None
+    ) -> int:
+        """Export a query to Parquet, Feather or Arrow IPC without building DataFrames.
+
+        Results go from the response to Arrow tables and straight to the
+        writer, in ``chunk_size`` chunks when given. Rows with missing values
+        are left out like in the DataFrame based export.
+        """
+        if chunk_size:
+            results = self.query_chunks(query, database=database_name, chunk_size=chunk_size,
+                                        arrow=True)
+        else:
+            results = [self.query_arrow(query, database=database_name)]
+        column_types = self.measurement_column_types(measurement_name, database_name)
+        with stream_writer(path, column_types=column_types) as writer:
+            for tables in results:
+                if measurement_name in tables:
+                    writer.write_table(tables[measurement_name].drop_null())
+        return writer.rows_written
+
+    def measurement_time_bounds(
+            self,
+            measurement_name: str,
+            database_name: str,
+            retention_policy: str | None = None,
+            where_clause: str | None = None
+    ) -> tuple[pd.Timestamp, pd.Timestamp] | None:
+        """Return the first and the last timestamp of a measurement, None if it is empty."""
+        bounds = []
+        for order in ("ASC", "DESC"):
+            query = self._build_select_query(
+                measurement_name=measurement_name,
+                retention_policy=retention_policy,
+                where_clause=where_clause
+            )
+            result = self.query(f"{query} ORDER BY time {order} LIMIT 1", database=database_name)
+            if measurement_name not in result or result[measurement_name].empty:
+                return None
+            bounds.append(result[measurement_name]['time'].iloc[0])
+        return bounds[0], bounds[1]
+
+    def fetch_measurement_parallel(
+            self,
+            measurement_name: str,
+            database_name: str,
+            parallel: int,
+            slice_duration: str = "1h",
+            retention_policy: str | None = None,
+            column_names: str | list[str] | None = None,
+            from_time: str | None = None,
+            to_time: str | None = None,
+            where_clause: str | None = None,
+            limit: int | None = None
+    ):
+        """Fetch a measurement as time slices queried concurrently.
+
+        ``[from_time, to_time]`` is split into ``slice_duration`` windows that
+        are queried on a pool of ``parallel`` threads sharing the client's HTTP
+        connection pool. Missing range ends are taken from the measurement
+        itself. Slices are yielded as DataFrames in time order.
+        """
+        if not from_time or not to_time:
+            bounds = self.measurement_time_bounds(
+                measurement_name=measurement_name,
+                database_name=database_name,
+                retention_policy=retention_policy,
+                where_clause=where_clause
+            )
+            if bounds is None:
+                return
+            from_time = from_time or rfc3339_ns(bounds[0])
+            to_time = to_time or rfc3339_ns(bounds[1])
+        windows = split_time_range(from_time, to_time, slice_duration)
+
+        def fetch_window(window: tuple[str, str]) -> pd.DataFrame | None:
+            query = self._build_select_query(
+                measurement_name=measurement_name,
+                retention_policy=retention_policy,
+                column_names=column_names,
+                from_time=window[0],
+                to_time=window[1],
+                where_clause=where_clause,
+                limit=limit,
+                inclusive_end=window is windows[-1]
+            )
+            result = self.query(query, database=database_name)
+            return result.get(measurement_name)
+
+        remaining = limit
+        for df in ordered_parallel_map(fetch_window, windows, workers=parallel):
+            if df is None or df.empty:
+                continue
+            if remaining is not None:
+                df = df.iloc[:remaining]
+                remaining -= len(df)
+            yield df
+            if remaining == 0:
+                return
+
+    def fetch_measurement_downsampled(
+            self,
+            measurement_name: str,
+            database_name: str,
+            every: str,
+            aggregate: str = "mean",
+            fill: str | None = None,
+            retention_policy: str | None = None,
+            column_names: str | list[str] | None = None,
+            from_time: str | None = None,
+            to_time: str | None = None,
+            where_clause: str | None = None,
+            limit: int | None = None,
+            parallel: int | None = None
+    ):
+        """Fetch a measurement aggregated by InfluxDB into ``every`` long time buckets.
+
+        Only the ``GROUP BY time()`` results are transferred. A range of more
+        than ``downsample_max_buckets`` buckets is split into several queries,
+        run on ``parallel`` threads. Missing range ends are taken from the
+        measurement itself. Slices are yielded as DataFrames in time order,
+        buckets with missing values are kept so that ``fill`` applies.
+        """
+        rfc3339_pattern = "%Y-%m-%dT%H:%M:%S.%fZ"
+        if not from_time or not to_time:
+            bounds = self.measurement_time_bounds(
+                measurement_name=measurement_name,
+                database_name=database_name,
+                retention_policy=retention_policy,
+                where_clause=where_clause
+            )
+            if bounds is None:
+                return
+            from_time = from_time or bounds[0].strftime(rfc3339_pattern)
+            to_time = to_time or bounds[1].strftime(rfc3339_pattern)
+        start = pd.to_datetime(timestamp_passer(from_time), format="ISO8601")
+        end = pd.to_datetime(timestamp_passer(to_time), format="ISO8601")
+        if start > end:
+            raise ValueError("Start of the time range is after its end.")
+        windows = downsample_windows(start, end, every, self.config.downsample_max_buckets)
+
+        def fetch_window(window: tuple[pd.Timestamp, pd.Timestamp]) -> pd.DataFrame | None:
+            query = self._build_select_query(
+                measurement_name=measurement_name,
+                retention_policy=retention_policy,
+                column_names=column_names,
+                from_time=window[0].strftime(rfc3339_pattern),
+                to_time=window[1].strftime(rfc3339_pattern),
+                where_clause=where_clause,
+                limit=limit,
+                inclusive_end=window is windows[-1],
+                every=every,
+                aggregate=aggregate,
+                fill=fill
+            )
+            return self.query(query, database=database_name, dropna=False).get(measurement_name)
+
+        remaining = limit
+        for df in ordered_parallel_map(fetch_window, windows, workers=parallel or 1):
+            if df is None or df.empty:
+                continue
+            if remaining is not None:
+                df = df.iloc[:remaining]
+                remaining -= len(df)
+            yield df
+            if remaining == 0:
+                return
+
+    def sync_measurement(
+            self,
+            measurement_name: str,
+            database_name: str,
+            target_dir: str,
+            retention_policy: str | None = None,
+            chunk_size: int = 100000
+    ) -> SyncResult:
+        """Append the points newer than the last sync to a day partitioned Parquet dataset."""
+        syncer = MeasurementSync(self, target_dir=target_dir, chunk_size=chunk_size)
+        return syncer.sync(database_name, measurement_name, retention_policy=retention_policy)
+
+    def copy_measurement(
+            self,
+            measurement_name: str,
+            database_name: str,
+            destination_database: str,
+            destination_measurement: str | None = None,
+            retention_policy: str | None = None,
+            destination_retention_policy: str | None = None,
+            destination_server: str | None = None,
+            from_time: str | None = None,
+            to_time: str | None = None,
+            where_clause: str | None = None,
+            slice_duration: str = "1d",
+            parallel: int | None = None
+    ) -> CopyReport:
+        """Copy a measurement to another database, on this server or one of ``servers``."""
+        destination = None
+        if destination_server:
+            destination = InfluxClient(config=server_config(self.config, destination_server))
+        copier = MeasurementCopier(self, destination, workers=parallel or 1,
+                                   slice_duration=slice_duration)
+        return copier.copy(
+            measurement_name=measurement_name,
+            database_name=database_name,
+            destination_database=destination_database,
+            destination_measurement=destination_measurement,
+            retention_policy=retention_policy,
+            destination_retention_policy=destination_retention_policy,
+            from_time=from_time,
+            to_time=to_time,
+            where_clause=where_clause
+        )
+
+    def get_query_cache(self) -> QueryCache:
+        return QueryCache(
+            cache_dir=get_user_cache_dir(),
+            max_bytes=self.config.cache_max_size_mb * 1024 ** 2,
+            ttl=self.config.cache_ttl
+        )
+
+    def fetch_measurement_cached(
+            self,
+            measurement_name: str,
+            database_name: str,
+            retention_policy: str | None = None,
+            column_names: str | list[str] | None = None,
+            from_time: str | None = None,
+            to_time: str | None = None,
+            where_clause: str | None = None,
+            parallel: int | None = None
+    ):
+        """Fetch a measurement, serving settled time windows from the result cache.
+
+        Data older than ``cache_settled_after`` is treated as immutable: that
+        part of the range is split into epoch aligned ``cache_bucket`` windows
+        which are read from the cache or queried and stored on a miss. The
+        recent tail is always queried live. Missing windows are queried on
+        ``parallel`` threads. Slices are yielded as DataFrames in time order.
+        """
+        rfc3339_pattern = "%Y-%m-%dT%H:%M:%S.%fZ"
+        cache = self.get_query_cache()
+        bucket = pd.Timedelta(self.config.cache_bucket)
+        now = pd.Timestamp.now(tz="UTC")
+        settled_end = (now - pd.Timedelta(self.config.cache_settled_after)).floor(bucket)
+        if not from_time:
+            bounds = self.measurement_time_bounds(
+                measurement_name=measurement_name,
+                database_name=database_name,
+                retention_policy=retention_policy,
+                where_clause=where_clause
+            )
+            if bounds is None:
+                return
+            from_time = bounds[0].strftime(rfc3339_pattern)
+        start = pd.to_datetime(timestamp_passer(from_time), format="ISO8601")
+        end = pd.to_datetime(timestamp_passer(to_time), format="ISO8601") if to_time else now
+        windows, tail_start = settled_windows(start, end, settled_end, bucket)
+
+        def fetch_window(window: tuple[pd.Timestamp, pd.Timestamp]) -> pd.DataFrame:
+            # The range end is inclusive, so is the last window when the whole range is settled
+            inclusive_end = tail_start is None and window[1] == end
+            key = cache.make_key(
+                host=self.config.host, port=self.config.port, database=database_name,
+                retention_policy=retention_policy, measurement=measurement_name,
+                columns=column_names, where=where_clause, start=window[0], end=window[1],
+                inclusive_end=inclusive_end
+            )
+            df = cache.get(key)
+            if df is None:
+                query = self._build_select_query(
+                    measurement_name=measurement_name,
+                    retention_policy=retention_policy,
+                    column_names=column_names,
+                    from_time=window[0].strftime(rfc3339_pattern),
+                    to_time=window[1].strftime(rfc3339_pattern),
+                    where_clause=where_clause,
+                    inclusive_end=inclusive_end
+                )
+                result = self.query(query, database=database_name)
+                df = result.get(measurement_name, pd.DataFrame())
+                cache.put(key, df)
+            return df
+
+        for df in ordered_parallel_map(fetch_window, windows, workers=parallel or 1):
+            if not df.empty:
+                yield df
+        if tail_start is not None:
+            query = self._build_select_query(
+                measurement_name=measurement_name,
+                retention_policy=retention_policy,
+                column_names=column_names,
+                from_time=tail_start.strftime(rfc3339_pattern),
+                to_time=to_time,
+                where_clause=where_clause
+            )
+            df = self.query(query, database=database_name).get(measurement_name)
+            if df is not None and not df.empty:
+                yield df
+
+    def _show_measurement_parallel(self, path: str | None = None, **fetch_kwargs) -> pd.DataFrame | int:
+        slices = self.fetch_measurement_parallel(**fetch_kwargs)
+        return self._collect_slices(slices, path, fetch_kwargs["measurement_name"],
+                                    fetch_kwargs["database_name"])
+
+    def _collect_slices(self, slices, path: str | None = None, measurement_name: str | None = None,
+                        database_name: str | None = None,
+                        aggregate: str | None = None) -> pd.DataFrame | int:
+        """Write the slices to ``path`` or return them as one DataFrame.
+
+        Formats without a stream writer (``.json``, ``.xlsx``) are collected
+        and written whole like an export without slices.
+        """
+        if path and Path(path).suffix.lower() in EXTENSIONS_STREAM_WRITER_MAPPING:
+            column_types = None
+            if Path(path).suffix.lower() in ARROW_STREAM_WRITER_EXTENSIONS:
+                column_types = self.measurement_column_types(measurement_name, database_name,
+                                                             aggregate=aggregate)
+            with stream_writer(path, column_types=column_types) as writer:
+                for df in slices:
+                    writer.write(df.set_index("time", drop=True))
+            return writer.rows_written
+        frames = list(slices)
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        if path:
+            if df.empty:
+                df = pd.DataFrame(columns=["time"])
+            file_writer(df.set_index("time", drop=True), path)
+            return len(df)
+        return df
+
     def show_measurement(
             self,
             measurement_name: str,
@@ -296,50 +1247,129 @@ class InfluxClient(DataFrameClient):
             to_time: str | None = None,
             where_clause: str | None = None,
             limit: int | None = None,
-            path: str | None = None
+            path: str | None = None,
+            chunk_size: int | None = None,
+            parallel: int | None = None,
+            slice_duration: str = "1h",
+            use_cache: bool | None = None,
+            every: str | None = None,
+            aggregate: str = "mean",
+            fill: str | None = None
     ) -> pd.DataFrame | int:
-        prev_db = self.config.database
-        try:
-            from_time = timestamp_passer(from_time) if from_time else None
-            to_time = timestamp_passer(to_time) if to_time else None
+        if every:
+            slices = self.fetch_measurement_downsampled(
+                measurement_name=measurement_name,
+                database_name=database_name,
+                every=every,
+                aggregate=aggregate,
+                fill=fill,
+                retention_policy=retention_policy,
+                column_names=column_names,
+                from_time=from_time,
+                to_time=to_time,
+                where_clause=where_clause,
+                limit=limit,
+                parallel=parallel
+            )
+            return self._collect_slices(slices, path, measurement_name, database_name,
+                                        aggregate=aggregate)
+        if use_cache is None:
+            use_cache = self.config.cache_enabled
+        # A LIMIT applies to the whole range and cannot be answered from per window entries
+        if use_cache and not limit:
+            slices = self.fetch_measurement_cached(
+                measurement_name=measurement_name,
+                database_name=database_name,
+                retention_policy=retention_policy,
+                column_names=column_names,
+                from_time=from_time,
+                to_time=to_time,
+                where_clause=where_clause,
+                parallel=parallel
+            )
+            return self._collect_slices(slices, path, measurement_name, database_name)
+        if parallel:
+            return self._show_measurement_parallel(
+                path=path,
+                measurement_name=measurement_name,
+                database_name=database_name,
+                parallel=parallel,
+                slice_duration=slice_duration,
+                retention_policy=retention_policy,
+                column_names=column_names,
+                from_time=from_time,
+                to_time=to_time,
+                where_clause=where_clause,
+                limit=limit
+            )
+        query = self._build_select_query(
+            measurement_name=measurement_name,
+            retention_policy=retention_policy,
+            column_names=column_names,
+            from_time=from_time,
+            to_time=to_time,
+            where_clause=where_clause,
+            limit=limit
+        )
 
-            self.switch_database(database_name)
+        if path and Path(path).suffix.lower() in ARROW_STREAM_WRITER_EXTENSIONS:
+            return self.export_measurement_arrow(
+                query=query,
+                measurement_name=measurement_name,
+                database_name=database_name,
+                path=path,
+                chunk_size=chunk_size
+            )
+        if path and chunk_size:
+            return self.export_measurement_chunked(
+                query=query,
+                measurement_name=measurement_name,
+                database_name=database_name,
+                path=path,
+                chunk_size=chunk_size
+            )
+        result = self.query(query, database=database_name)
+        df_result = pd.DataFrame(result[measurement_name]).set_index("time", drop=True)
+        if path:
+            file_writer(df_result, path)
+            return len(df_result)
+        return pd.DataFrame(result[measurement_name])
 
-            if isinstance(column_names, str):
-                column_names = [column_names]
+    def drop_measurements(self, database_name: str, measurements: list[str],
+                          statements_per_request: int | None = None) -> None:
+        """Drop measurements sending many ``DROP MEASUREMENT`` statements per request."""
+        statements_per_request = statements_per_request or self.config.statements_per_request
+        for start in range(0, len(measurements), statements_per_request):
+            batch = measurements[start:start + statements_per_request]
+            query = "; ".join(f'DROP MEASUREMENT "{measurement}"' for measurement in batch)
+            self.query(query, database=database_name, method="POST")
 
-            select_clause = ", ".join(column_names) if column_names else "*"
+    def clean_database(self, database_name: str,
+                       exclude_measurements: list[str] | None = None) -> list[str]:
+        measurements = [
+            measurement for measurement in self.show_measurements(database_name=database_name)
+            if not (exclude_measurements and measurement in exclude_measurements)
+        ]
+        self.drop_measurements(database_name, measurements)
+        return measurements
 
-            from_clause = f"{retention_policy}.{measurement_name}" if retention_policy else measurement_name
-
-            conditions = []
-            if from_time:
-                conditions.append(f"time >= '{from_time}'")
-            if to_time:
-                conditions.append(f"time <= '{to_time}'")
-            if where_clause:
-                conditions.append(where_clause)
-
-            where_clause_str = f" WHERE {' AND '.join(conditions)}" if conditions else ""
-            limit_clause = f" LIMIT {limit}" if limit else ""
-
-            query = f"SELECT {select_clause} FROM {from_clause}{where_clause_str}{limit_clause}"
-            result = self.query(query)
-            df_result = pd.DataFrame(result[measurement_name]).set_index("time", drop=True)
-            if path:
-                file_writer(df_result, path)
-                return len(df_result)
-            return pd.DataFrame(result[measurement_name])
-        finally:
-            self.switch_database(prev_db)
-
-    def clean_database(self, database_name: str, exclude_measurements: list[str] | None = None):
-        prev_db = self.config.database
-        self.switch_database(database_name)
-        measurements = self.show_measurements()
-        for measurement in measurements:
-            if exclude_measurements and measurement in exclude_measurements:
-                continue
-            self.query(f"DROP MEASUREMENT {measurement}")
-        self.switch_database(prev_db)
-        return
+    def dump_database(self, database_name: str, path: str,
+                      workers: int | None = None) -> BundleReport:
+        bundle = DatabaseBundle(self, workers=workers or self.config.maintenance_workers)
+        return bundle.dump(database_name, path)
+
+    def restore_database(self, path: str, database_name: str | None = None,
+                         workers: int | None = None) -> BundleReport:
+        bundle = DatabaseBundle(self, workers=workers or self.config.maintenance_workers)
+        return bundle.restore(path, database_name=database_name)
+
+    def clean_databases(self, database_names: list[str],
+                        exclude_measurements: list[str] | None = None,
+                        workers: int | None = None) -> MaintenanceReport:
+        executor = MaintenanceExecutor(self, workers=workers or self.config.maintenance_workers)
+        return executor.clean(database_names, exclude_measurements=exclude_measurements)
+
+    def delete_databases(self, database_names: list[str],
+                         workers: int | None = None) -> MaintenanceReport:
+        executor = MaintenanceExecutor(self, workers=workers or self.config.maintenance_workers)
+        return executor.drop(database_names)
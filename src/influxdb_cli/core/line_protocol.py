@@ -0,0 +1,202 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+PRECISION_FACTORS = {
+    "n": 1,
+    "u": 10 ** 3,
+    "ms": 10 ** 6,
+    "s": 10 ** 9,
+    "m": 60 * 10 ** 9,
+    "h": 3600 * 10 ** 9,
+}
+
+_KEY_ESCAPES = [("\\", "\\\\"), (" ", "\\ "), (",", "\\,"), ("=", "\\="), ("\n", "\\n")]
+_STRING_FIELD_ESCAPES = [("\\", "\\\\"), ('"', '\\"')]
+
+
+def _literal(value: str) -> pa.Scalar:
+    return pa.scalar(value, pa.large_string())
+
+
+def _escape_key(key) -> str:
+    key = str(key)
+    for char, escaped in _KEY_ESCAPES:
+        key = key.replace(char, escaped)
+    return key
+
+
+def _escape_array(array: pa.Array, escapes: list[tuple[str, str]]) -> pa.Array:
+    for char, escaped in escapes:
+        array = pc.replace_substring(array, pattern=char, replacement=escaped)
+    return array
+
+
+def _time_column_ns(data: pd.DataFrame | pa.Table, time_column: str) -> np.ndarray:
+    if isinstance(data, pa.Table):
+        column = data.column(time_column)
+        if not pa.types.is_timestamp(column.type):
+            raise TypeError(f"Column '{time_column}' must be a timestamp column.")
+        return column.cast(pa.timestamp("ns", tz=column.type.tz)).to_numpy().view(np.int64)
+    index = data.index
+    if isinstance(index, pd.PeriodIndex):
+        index = index.to_timestamp()
+    if not isinstance(index, pd.DatetimeIndex):
+        raise TypeError('Must be DataFrame with DatetimeIndex or PeriodIndex.')
+    return index.as_unit("ns").asi8
+
+
+def _columns(data: pd.DataFrame | pa.Table, time_column: str) -> dict[str, pa.Array]:
+    if isinstance(data, pa.Table):
+        return {name: data.column(name).combine_chunks()
+                for name in data.column_names if name != time_column}
+    return {name: _series_to_arrow(data[name]) for name in data.columns}
+
+
+def _series_to_arrow(series: pd.Series) -> pa.Array:
+    if series.dtype == object:
+        mask = series.isna().to_numpy()
+        return pa.array(series.astype(str).to_numpy(), type=pa.large_string(), mask=mask)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return pa.array(series.astype(object).where(series.notna(), None), type=pa.large_string())
+    return pa.array(series, from_pandas=True)
+
+
+def _format_float(values: pa.Array, float_format: str) -> pa.Array:
+    numbers = values.to_numpy(zero_copy_only=False)
+    mask = ~np.isfinite(numbers)
+    if float_format == "repr":
+        # numpy keeps Python's repr, e.g. "1.0" and "1e-05", as DataFrameClient writes it
+        return pa.array(numbers.astype(str), type=pa.large_string(), mask=mask)
+    if float_format == "shortest":
+        # Arrow's shortest round-trip formatting, e.g. "1" and "0.00001": same float64
+        # on the server, an order of magnitude faster than Python's repr
+        return pc.if_else(pa.array(mask), pa.scalar(None, pa.large_string()),
+                          values.cast(pa.large_string()))
+    raise ValueError(f"Unsupported float format: {float_format}")
+
+
+def _format_field(name, values: pa.Array, float_format: str = "repr") -> pa.Array:
+    """Format a field column as ``key=value`` strings, null where there is no value."""
+    kind = values.type
+    if pa.types.is_boolean(kind):
+        formatted = pc.if_else(values, _literal("True"), _literal("False"))
+    elif pa.types.is_integer(kind):
+        formatted = pc.binary_join_element_wise(values.cast(pa.large_string()), _literal("i"), _literal(""))
+    elif pa.types.is_floating(kind):
+        formatted = _format_float(values, float_format)
+    else:
+        strings = _escape_array(values.cast(pa.large_string()), _STRING_FIELD_ESCAPES)
+        formatted = pc.binary_join_element_wise(_literal('"'), strings, _literal('"'), _literal(""))
+    return pc.binary_join_element_wise(
+        _literal(f"{_escape_key(name)}="), formatted.cast(pa.large_string()), _literal(""))
+
+
+def _format_tag(name, values: pa.Array) -> pa.Array:
+    """Format a tag column as ``key=value`` strings, null for missing or empty values."""
+    strings = values.cast(pa.large_string())
+    strings = pc.if_else(pc.equal(strings, ""), pa.scalar(None, pa.large_string()), strings)
+    strings = _escape_array(strings, _KEY_ESCAPES)
+    return pc.binary_join_element_wise(_literal(f"{_escape_key(name)}="), strings, _literal(""))
+
+
+def serialize_lines(
+        data: pd.DataFrame | pa.Table,
+        measurement: str,
+        tag_columns: list[str] | None = None,
+        field_columns: list[str] | None = None,
+        global_tags: dict | None = None,
+        time_precision: str | None = None,
+        time_column: str = "time",
+        float_format: str = "repr"
+) -> pa.LargeStringArray:
+    """Convert a DataFrame or an Arrow table to line protocol, one array item per point.
+
+    The conversion is done column by column with Arrow compute kernels instead
+    of per row string operations. A DataFrame takes its timestamps from the
+    DatetimeIndex, an Arrow table from ``time_column``. Like
+    ``DataFrameClient.write_points``, columns not listed in ``tag_columns``
+    are fields, integers get the ``i`` suffix, strings are quoted, missing and
+    infinite values are left out and points without any field are dropped.
+    Timestamps are converted with integer arithmetic so they do not lose
+    precision.
+
+    With ``float_format="repr"`` the output is byte-for-byte what
+    ``DataFrameClient`` produces, except that quotes and backslashes in
+    string fields are escaped as the line protocol requires, which
+    ``DataFrameClient`` does not do. ``"shortest"`` spells floats the way
+    Arrow does, which is much faster and parses to the same values.
+    """
+    tag_columns = list(tag_columns or [])
+    global_tags = global_tags or {}
+    if time_precision not in PRECISION_FACTORS and time_precision is not None:
+        raise ValueError(f"Invalid time precision: {time_precision}")
+    columns = _columns(data, time_column)
+    if not field_columns:
+        field_columns = [name for name in columns if name not in tag_columns]
+
+    fields = [_format_field(name, columns[name], float_format) for name in field_columns]
+    if not fields:
+        raise ValueError("At least one field column is required.")
+    if len(fields) > 1:
+        fields = pc.binary_join_element_wise(*fields, _literal(","), null_handling="skip")
+    else:
+        fields = fields[0]
+
+    length = len(fields)
+    tags = {str(name): _format_tag(name, columns[name]) for name in tag_columns}
+    for name, value in global_tags.items():
+        tags[str(name)] = _format_tag(name, pa.array([value] * length, type=pa.large_string()))
+    series_key = pc.binary_join_element_wise(
+        _literal(_escape_key(measurement)), *[tags[name] for name in sorted(tags)], _literal(","),
+        null_handling="skip")
+
+    timestamps = _time_column_ns(data, time_column) // PRECISION_FACTORS.get(time_precision, 1)
+    lines = pc.binary_join_element_wise(
+        series_key, fields, pa.array(timestamps).cast(pa.large_string()), _literal(" "))
+    # Fields are empty (not null) when every value of the point is missing
+    has_fields = pc.not_equal(pc.utf8_length(fields), 0)
+    return lines.filter(pc.and_kleene(has_fields, pc.is_valid(fields)))
+
+
+def lines_to_bytes(lines: pa.LargeStringArray) -> bytes:
+    """Join line protocol points into a newline terminated request body."""
+    if len(lines) == 0:
+        return b""
+    return _string_array_bytes(pc.binary_join_element_wise(lines, _literal("\n"), _literal("")))
+
+
+def _string_array_bytes(array: pa.LargeStringArray) -> bytes:
+    offsets = np.frombuffer(array.buffers()[1], dtype=np.int64)
+    start = offsets[array.offset]
+    end = offsets[array.offset + len(array)]
+    return array.buffers()[2].to_pybytes()[start:end]
+
+
+def dataframe_to_line_protocol(
+        data: pd.DataFrame | pa.Table,
+        measurement: str,
+        tag_columns: list[str] | None = None,
+        field_columns: list[str] | None = None,
+        global_tags: dict | None = None,
+        time_precision: str | None = None,
+        time_column: str = "time",
+        float_format: str = "repr",
+        batch_size: int | None = None
+):
+    """Serialize ``data`` and yield line protocol request bodies of ``batch_size`` points."""
+    lines = serialize_lines(
+        data,
+        measurement=measurement,
+        tag_columns=tag_columns,
+        field_columns=field_columns,
+        global_tags=global_tags,
+        time_precision=time_precision,
+        time_column=time_column,
+        float_format=float_format
+    )
+    batch_size = batch_size or len(lines) or 1
+    for start in range(0, len(lines), batch_size):
+        batch = lines.slice(start, batch_size)
+        yield lines_to_bytes(batch), len(batch)
@@ -0,0 +1,133 @@
+import re
+import subprocess
+import threading
+import time
+from typing import Callable
+
+
+class LogFollower:
+    """Follow the logs of a docker container and detect completion markers.
+
+    A single long-lived ``docker logs -f`` process is read line by line on a
+    background thread. Every line is passed to ``on_line`` and matched against
+    the completion ``patterns`` (regular expressions) as soon as it arrives.
+    When the container stops, following resumes from the moment the stream
+    ended so lines logged after a restart are still seen. ``docker logs``
+    failing ``max_failed_exits`` times in a row (e.g. the container does not
+    exist) or failing to start ends the following, the error is raised by
+    ``wait`` and ``stop``.
+    """
+
+    def __init__(self,
+                 container_name: str,
+                 patterns: list[str],
+                 since: float | None = None,
+                 on_line: Callable[[str], None] | None = None,
+                 docker_executable: str = "docker",
+                 reconnect_delay_sec: float = 0.5,
+                 max_failed_exits: int = 5):
+        self.container_name = container_name
+        self.patterns = [re.compile(pattern) for pattern in patterns]
+        self.since = since
+        self.on_line = on_line
+        self.docker_executable = docker_executable
+        self.reconnect_delay_sec = reconnect_delay_sec
+        self.max_failed_exits = max_failed_exits
+        self.matched_line: str | None = None
+        self._completed = threading.Event()
+        self._finished = threading.Event()
+        self._error: Exception | None = None
+        self._error_raised = False
+        self._stopped = threading.Event()
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def _command(self) -> list[str]:
+        command = [self.docker_executable, "logs", "-f"]
+        if self.since is not None:
+            command += ["--since", f"{self.since:.6f}"]
+        return command + [self.container_name]
+
+    def _follow(self) -> None:
+        try:
+            self._follow_streams()
+        except Exception as e:
+            self._error = e
+        finally:
+            self._finished.set()
+
+    def _follow_streams(self) -> None:
+        failed_exits = 0
+        while not self._stopped.is_set():
+            with self._lock:
+                if self._stopped.is_set():
+                    return
+                self._process = subprocess.Popen(
+                    self._command(), stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                    text=True, errors="replace", bufsize=1)
+            last_line = None
+            for line in self._process.stdout:
+                last_line = line.rstrip("\n")
+                self._handle_line(last_line)
+                if self._completed.is_set():
+                    return
+            return_code = self._process.wait()
+            if self._stopped.is_set():
+                return
+            failed_exits = failed_exits + 1 if return_code != 0 else 0
+            if failed_exits >= self.max_failed_exits:
+                raise RuntimeError(f"'docker logs' for {self.container_name} failed "
+                                   f"{failed_exits} times in a row, last exit code "
+                                   f"{return_code}: {last_line}")
+            # The stream ends when the container stops, resume where it ended
+            self.since = time.time()
+            self._stopped.wait(self.reconnect_delay_sec)
+
+    def _handle_line(self, line: str) -> None:
+        if self.on_line is not None:
+            self.on_line(line)
+        if any(pattern.search(line) for pattern in self.patterns):
+            self.matched_line = line
+            self._completed.set()
+
+    def start(self) -> "LogFollower":
+        self._thread = threading.Thread(target=self._follow, daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until a completion marker is seen, return False on timeout.
+
+        Raises the error that ended the following, if any.
+        """
+        self._finished.wait(timeout)
+        self._raise_error()
+        return self._completed.is_set()
+
+    def _raise_error(self) -> None:
+        if self._error is not None and not self._error_raised:
+            self._error_raised = True
+            raise self._error
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stopped.set()
+            if self._process is not None and self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self._raise_error()
+
+    def __enter__(self) -> "LogFollower":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is not None:
+            # Do not replace the exception leaving the block
+            self._error_raised = True
+        self.stop()
@@ -0,0 +1,73 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from influxdb_cli.core.influx_client import InfluxClient
+
+
+@dataclass
+class DatabaseMaintenanceResult:
+    database: str
+    dropped: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class MaintenanceReport:
+    results: list[DatabaseMaintenanceResult] = field(default_factory=list)
+    wall_seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[DatabaseMaintenanceResult]:
+        return [result for result in self.results if not result.ok]
+
+
+class MaintenanceExecutor:
+    """Run maintenance tasks on several databases concurrently.
+
+    Every database is handled by one task on a pool of ``workers`` threads
+    sharing the client's HTTP connection pool. A failing database does not
+    stop the others, its error is recorded in the report instead.
+    """
+
+    def __init__(self, influx_client: "InfluxClient", workers: int = 4):
+        self.influx_client = influx_client
+        self.workers = workers
+
+    def _run_task(self, task: Callable[[str], list[str] | None],
+                  database: str) -> DatabaseMaintenanceResult:
+        result = DatabaseMaintenanceResult(database=database)
+        started = time.perf_counter()
+        try:
+            result.dropped = task(database) or []
+        except Exception as e:
+            result.error = f"{type(e).__name__}: {e}"
+        result.seconds = time.perf_counter() - started
+        return result
+
+    def run(self, databases: list[str], task: Callable[[str], list[str] | None]) -> MaintenanceReport:
+        """Call ``task`` with every database name, it may return the names it dropped."""
+        report = MaintenanceReport()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            report.results = list(executor.map(lambda db: self._run_task(task, db), databases))
+        report.wall_seconds = time.perf_counter() - started
+        return report
+
+    def clean(self, databases: list[str],
+              exclude_measurements: list[str] | None = None) -> MaintenanceReport:
+        return self.run(databases, lambda db: self.influx_client.clean_database(
+            database_name=db, exclude_measurements=exclude_measurements))
+
+    def drop(self, databases: list[str]) -> MaintenanceReport:
+        def drop_database(database: str) -> list[str]:
+            self.influx_client.delete_database(database)
+            return [database]
+        return self.run(databases, drop_database)
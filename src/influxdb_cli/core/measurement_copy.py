@@ -0,0 +1,173 @@
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from influxdb_cli.core.concurrency import ordered_parallel_map, prefetch
+from influxdb_cli.core.database_bundle import conform_table, measurement_schema
+from influxdb_cli.core.measurement_sync import rfc3339_ns
+from influxdb_cli.core.write_pipeline import WritePipeline
+
+if TYPE_CHECKING:
+    from influxdb_cli.core.influx_client import InfluxClient
+
+
+@dataclass
+class CopyReport:
+    source: str
+    destination: str
+    mode: str
+    points: int = 0
+    batches: int = 0
+    wall_seconds: float = 0.0
+
+
+def into_target(database_name: str, retention_policy: str | None, measurement_name: str) -> str:
+    """Write the ``INTO`` target of a measurement, ``"db".."m"`` for the default policy."""
+    retention_policy = f'"{retention_policy}"' if retention_policy else ""
+    return f'"{database_name}".{retention_policy}."{measurement_name}"'
+
+
+class MeasurementCopier:
+    """Copy a measurement to another database, on the same or on another server.
+
+    On the same server the copy runs inside InfluxDB as ``SELECT * INTO ...
+    GROUP BY *`` statements, which keep tags as tags, one per
+    ``slice_duration`` time slice so that no single statement runs for too
+    long. Slices run on ``workers`` threads. ``SELECT INTO`` runs with the
+    source's connection and credentials, so only a destination configured
+    like the source apart from its database counts as the same server.
+    Towards another server points
+    are streamed in ``chunk_size`` chunks from the source into the
+    destination's writer, the next chunk is read while the previous one is
+    written, so memory stays bounded by a few chunks.
+    """
+
+    def __init__(self, source: "InfluxClient", destination: "InfluxClient | None" = None,
+                 workers: int = 1, slice_duration: str = "1d", chunk_size: int = 100000,
+                 batch_size: int = 10000):
+        self.source = source
+        self.destination = destination or source
+        self.workers = workers
+        self.slice_duration = slice_duration
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+
+    @property
+    def same_server(self) -> bool:
+        exclude = {"database", "servers"}
+        return self.source.config.model_dump(exclude=exclude) == \
+            self.destination.config.model_dump(exclude=exclude)
+
+    def copy(
+            self,
+            measurement_name: str,
+            database_name: str,
+            destination_database: str,
+            destination_measurement: str | None = None,
+            retention_policy: str | None = None,
+            destination_retention_policy: str | None = None,
+            from_time: str | None = None,
+            to_time: str | None = None,
+            where_clause: str | None = None
+    ) -> CopyReport:
+        started = time.perf_counter()
+        destination_measurement = destination_measurement or measurement_name
+        if destination_database not in self.destination.list_databases():
+            self.destination.create_database(destination_database, retention_policy=True)
+        report = CopyReport(
+            source=f"{self.source.config.host}:{self.source.config.port}/{database_name}",
+            destination=f"{self.destination.config.host}:{self.destination.config.port}/"
+                        f"{destination_database}",
+            mode="select_into" if self.same_server else "stream"
+        )
+        kwargs = dict(measurement_name=measurement_name, database_name=database_name,
+                      destination_database=destination_database,
+                      destination_measurement=destination_measurement,
+                      retention_policy=retention_policy,
+                      destination_retention_policy=destination_retention_policy,
+                      from_time=from_time, to_time=to_time, where_clause=where_clause)
+        if self.same_server:
+            self._select_into(report, **kwargs)
+        else:
+            self._stream(report, **kwargs)
+        report.wall_seconds = time.perf_counter() - started
+        return report
+
+    def _time_windows(self, measurement_name: str, database_name: str,
+                      retention_policy: str | None, from_time: str | None,
+                      to_time: str | None, where_clause: str | None) -> list[tuple[str, str]]:
+        from influxdb_cli.core.influx_client import split_time_range
+        if not from_time or not to_time:
+            bounds = self.source.measurement_time_bounds(
+                measurement_name=measurement_name,
+                database_name=database_name,
+                retention_policy=retention_policy,
+                where_clause=where_clause
+            )
+            if bounds is None:
+                return []
+            from_time = from_time or rfc3339_ns(bounds[0])
+            to_time = to_time or rfc3339_ns(bounds[1])
+        return split_time_range(from_time, to_time, self.slice_duration)
+
+    def _select_into(self, report: CopyReport, measurement_name: str, database_name: str,
+                     destination_database: str, destination_measurement: str,
+                     retention_policy: str | None, destination_retention_policy: str | None,
+                     from_time: str | None, to_time: str | None,
+                     where_clause: str | None) -> None:
+        windows = self._time_windows(measurement_name, database_name, retention_policy,
+                                     from_time, to_time, where_clause)
+        target = into_target(destination_database, destination_retention_policy,
+                             destination_measurement)
+
+        def copy_window(window: tuple[str, str]) -> int:
+            query = self.source._build_select_query(
+                measurement_name=measurement_name,
+                retention_policy=retention_policy,
+                from_time=window[0],
+                to_time=window[1],
+                where_clause=where_clause,
+                inclusive_end=window is windows[-1],
+                into=target
+            )
+            result = self.source.query(query, database=database_name, method="POST",
+                                       response_format="json")
+            written = result.get("result")
+            return int(written["written"].sum()) if written is not None else 0
+
+        for written in ordered_parallel_map(copy_window, windows, workers=self.workers):
+            report.points += written
+            report.batches += 1
+
+    def _stream(self, report: CopyReport, measurement_name: str, database_name: str,
+                destination_database: str, destination_measurement: str,
+                retention_policy: str | None, destination_retention_policy: str | None,
+                from_time: str | None, to_time: str | None, where_clause: str | None) -> None:
+        tags = self.source.show_tag_keys(database_name, measurement_name).get(measurement_name, [])
+        fields = self.source.show_field_keys(database_name, measurement_name).get(
+            measurement_name, {})
+        schema = measurement_schema(tags, fields)
+        query = self.source._build_select_query(
+            measurement_name=measurement_name,
+            retention_policy=retention_policy,
+            from_time=from_time,
+            to_time=to_time,
+            where_clause=where_clause
+        )
+        chunks = self.source.query_chunks(query, database=database_name,
+                                          chunk_size=self.chunk_size, arrow=True)
+        pipeline = WritePipeline(self.destination, batch_size=self.batch_size)
+        for tables in prefetch(chunks, max_queued=2):
+            table = tables.get(measurement_name)
+            if table is None:
+                continue
+            report.points += self.destination.write_dataframe(
+                dataframe=conform_table(table, schema),
+                measurement=destination_measurement,
+                database=destination_database,
+                retention_policy=destination_retention_policy,
+                tag_columns=tags,
+                time_precision="n",
+                pipeline=pipeline
+            )
+            report.batches += 1
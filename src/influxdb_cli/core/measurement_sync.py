@@ -0,0 +1,185 @@
+import json
+import os
+import re
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from influxdb_cli.core.database_bundle import conform_table, measurement_schema
+from influxdb_cli.core.stream_writers import ParquetStreamWriter
+
+if TYPE_CHECKING:
+    from influxdb_cli.core.influx_client import InfluxClient
+
+STATE_FILE_NAME = "_sync_state.json"
+PARTITION_KEY = "date"
+
+_PART_FILE = re.compile(r"^part-(\d+)-(\d+)\.parquet$")
+
+
+def rfc3339_ns(timestamp: pd.Timestamp) -> str:
+    """Write a UTC timestamp in RFC 3339 keeping its nanoseconds."""
+    nanoseconds = timestamp.microsecond * 1000 + timestamp.nanosecond
+    return f"{timestamp.strftime('%Y-%m-%dT%H:%M:%S')}.{nanoseconds:09d}Z"
+
+
+@dataclass
+class SyncResult:
+    database: str
+    measurement: str
+    points: int = 0
+    files: list[str] = field(default_factory=list)
+    high_water_mark: pd.Timestamp | None = None
+    seconds: float = 0.0
+
+
+class MeasurementSync:
+    """Append new points of measurements to Hive partitioned Parquet datasets.
+
+    Every measurement is a dataset in ``<target>/<database>/<measurement>``
+    with one ``date=YYYY-MM-DD`` directory per day. A run only queries the
+    points after the high-water mark, the newest timestamp synced so far,
+    and adds them as new ``part-<first ns>-<last ns>.parquet`` files. Files
+    are written under a hidden temporary name and renamed into place once
+    complete, in time order, and the mark is recorded in
+    ``<target>/_sync_state.json`` after every file. A file committed just
+    before an interruption is found by its name on the next run, so no
+    point is synced twice. Rows with missing values are left out like in
+    ``measurement show --path`` exports. Every file has the schema of the
+    measurement's tag keys and field types, so the dataset reads as one
+    table. Points written later with older timestamps than the mark are not
+    picked up.
+    """
+
+    def __init__(self, influx_client: "InfluxClient", target_dir: str | Path,
+                 chunk_size: int = 100000):
+        self.influx_client = influx_client
+        self.target_dir = Path(target_dir)
+        self.chunk_size = chunk_size
+        self.state_path = self.target_dir / STATE_FILE_NAME
+
+    def dataset_dir(self, database_name: str, measurement_name: str) -> Path:
+        return self.target_dir / database_name / measurement_name
+
+    def load_state(self) -> dict:
+        if not self.state_path.exists():
+            return {}
+        return json.loads(self.state_path.read_text())
+
+    def _save_state(self, state: dict) -> None:
+        tmp_path = self.state_path.with_name(f".{STATE_FILE_NAME}.{uuid.uuid4().hex}.tmp")
+        tmp_path.write_text(json.dumps(state, indent=2))
+        os.replace(tmp_path, self.state_path)
+
+    def high_water_mark(self, database_name: str, measurement_name: str) -> pd.Timestamp | None:
+        """Return the newest synced timestamp of a measurement, None before the first sync."""
+        entry = self.load_state().get(database_name, {}).get(measurement_name)
+        mark = pd.Timestamp(entry["high_water_mark"]) if entry else None
+        dataset_dir = self.dataset_dir(database_name, measurement_name)
+        if dataset_dir.is_dir():
+            for partition in dataset_dir.iterdir():
+                for path in partition.glob("part-*.parquet"):
+                    match = _PART_FILE.match(path.name)
+                    if match:
+                        last = pd.Timestamp(int(match.group(2)), tz="UTC")
+                        mark = last if mark is None or last > mark else mark
+        return mark
+
+    def _record(self, database_name: str, measurement_name: str, mark: pd.Timestamp,
+                points: int) -> None:
+        state = self.load_state()
+        entry = state.setdefault(database_name, {}).setdefault(measurement_name, {"points": 0})
+        entry["high_water_mark"] = rfc3339_ns(mark)
+        entry["points"] += points
+        entry["synced_at"] = rfc3339_ns(pd.Timestamp.now(tz="UTC"))
+        self._save_state(state)
+
+    def sync(self, database_name: str, measurement_name: str,
+             retention_policy: str | None = None) -> SyncResult:
+        started = time.perf_counter()
+        result = SyncResult(database=database_name, measurement=measurement_name)
+        mark = self.high_water_mark(database_name, measurement_name)
+        result.high_water_mark = mark
+        query = self.influx_client._build_select_query(
+            measurement_name=measurement_name,
+            retention_policy=retention_policy,
+            where_clause=f"time > '{rfc3339_ns(mark)}'" if mark is not None else None
+        )
+        tags = self.influx_client.show_tag_keys(database_name, measurement_name).get(
+            measurement_name, [])
+        fields = self.influx_client.show_field_keys(database_name, measurement_name).get(
+            measurement_name, {})
+        schema = measurement_schema(tags, fields)
+        chunks = self.influx_client.query_chunks(query, database=database_name,
+                                                 chunk_size=self.chunk_size, arrow=True)
+        dataset_dir = self.dataset_dir(database_name, measurement_name)
+        part = None
+        try:
+            for tables in chunks:
+                table = tables.get(measurement_name)
+                if table is None:
+                    continue
+                # Types inferred per chunk differ, e.g. for floats that are whole numbers
+                table = conform_table(table.drop_null(), schema)
+                days = table.column("time").cast(pa.date32())
+                for day in pc.unique(days).to_pylist():
+                    day_table = table.filter(pc.equal(days, pa.scalar(day, pa.date32())))
+                    if part is not None and part.day != day:
+                        self._commit(part, result)
+                        part = None
+                    if part is None:
+                        part = _PartFile(dataset_dir / f"{PARTITION_KEY}={day.isoformat()}", day)
+                    part.write(day_table)
+            if part is not None:
+                self._commit(part, result)
+                part = None
+        finally:
+            if part is not None:
+                part.discard()
+            result.seconds = time.perf_counter() - started
+        return result
+
+    def _commit(self, part: "_PartFile", result: SyncResult) -> None:
+        path = part.commit()
+        result.files.append(str(path))
+        result.points += part.writer.rows_written
+        result.high_water_mark = part.last
+        self._record(result.database, result.measurement, part.last, part.writer.rows_written)
+
+
+class _PartFile:
+    """A Parquet file of one day partition, hidden until it is committed."""
+
+    def __init__(self, partition_dir: Path, day):
+        partition_dir.mkdir(parents=True, exist_ok=True)
+        self.partition_dir = partition_dir
+        self.day = day
+        self.tmp_path = partition_dir / f".part-{uuid.uuid4().hex}.parquet.tmp"
+        self.writer = ParquetStreamWriter(self.tmp_path)
+        self.first = None
+        self.last = None
+
+    def write(self, table: pa.Table) -> None:
+        times = table.column("time")
+        if self.first is None:
+            self.first = pd.Timestamp(pc.min(times).value, tz="UTC")
+        self.last = pd.Timestamp(pc.max(times).value, tz="UTC")
+        self.writer.write_table(table)
+
+    def commit(self) -> Path:
+        self.writer.close()
+        with open(self.tmp_path, "rb+") as file:
+            os.fsync(file.fileno())
+        path = self.partition_dir / f"part-{self.first.value}-{self.last.value}.parquet"
+        os.replace(self.tmp_path, path)
+        return path
+
+    def discard(self) -> None:
+        self.writer.close()
+        self.tmp_path.unlink(missing_ok=True)
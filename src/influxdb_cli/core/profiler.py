@@ -0,0 +1,107 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class PhaseStats:
+    name: str
+    calls: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+    rows: int = 0
+
+
+class PhaseRecord:
+    """Counters of one running phase, set ``bytes`` and ``rows`` once they are known."""
+    __slots__ = ("bytes", "rows")
+
+    def __init__(self, bytes: int = 0, rows: int = 0):
+        self.bytes = bytes
+        self.rows = rows
+
+
+class Profiler:
+    """Collect wall time, bytes and rows per phase of a command.
+
+    Phases may nest, e.g. ``http`` runs inside ``request``, so their times
+    are inclusive and do not add up to the total. ``request`` counts the
+    bytes sent, ``http`` and ``decode`` the bytes received. When disabled
+    ``phase`` is a no-op and costs a single attribute check. With ``trace``
+    every phase call is also kept as a Chrome trace event (chrome://tracing,
+    Perfetto).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.trace = False
+        self.started = 0.0
+        self._stats: dict[str, PhaseStats] = {}
+        self._events: list[dict] = []
+        self._lock = threading.Lock()
+
+    def enable(self, trace: bool = False) -> None:
+        with self._lock:
+            self._stats = {}
+            self._events = []
+        self.enabled = True
+        self.trace = trace
+        self.started = time.perf_counter()
+
+    def add(self, name: str, seconds: float, bytes: int = 0, rows: int = 0,
+            started: float | None = None) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stats.setdefault(name, PhaseStats(name))
+            stats.calls += 1
+            stats.seconds += seconds
+            stats.bytes += bytes
+            stats.rows += rows
+            if self.trace:
+                started = started if started is not None else time.perf_counter() - seconds
+                self._events.append({
+                    "name": name, "ph": "X", "pid": os.getpid(), "tid": threading.get_ident(),
+                    "ts": (started - self.started) * 1e6, "dur": seconds * 1e6,
+                    "args": {"bytes": bytes, "rows": rows}
+                })
+
+    @contextmanager
+    def phase(self, name: str, bytes: int = 0, rows: int = 0):
+        if not self.enabled:
+            yield PhaseRecord()
+            return
+        record = PhaseRecord(bytes, rows)
+        started = time.perf_counter()
+        try:
+            yield record
+        finally:
+            self.add(name, time.perf_counter() - started, record.bytes, record.rows, started)
+
+    def stats(self) -> list[PhaseStats]:
+        with self._lock:
+            return sorted(self._stats.values(), key=lambda stats: stats.seconds, reverse=True)
+
+    def format_table(self) -> str:
+        total = time.perf_counter() - self.started
+        lines = [f"{'phase':<16}{'calls':>8}{'seconds':>10}{'share':>8}{'MB':>10}{'rows':>12}"]
+        for stats in self.stats():
+            share = stats.seconds / total if total else 0.0
+            lines.append(f"{stats.name:<16}{stats.calls:>8}{stats.seconds:>10.3f}{share:>8.1%}"
+                         f"{stats.bytes / 1024 ** 2:>10.2f}{stats.rows:>12}")
+        lines.append(f"{'total':<16}{'':>8}{total:>10.3f}")
+        return "\n".join(lines)
+
+    def write_trace(self, path: str | Path) -> None:
+        with self._lock:
+            events = list(self._events)
+        summary = [stats.__dict__ for stats in self.stats()]
+        Path(path).write_text(json.dumps({"traceEvents": events, "phases": summary}))
+
+
+PROFILER = Profiler()
+profile_phase = PROFILER.phase
@@ -0,0 +1,133 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+
+CACHE_SUBDIR = "query_results"
+
+
+class QueryCache:
+    """Size bounded on-disk cache of query results stored as Parquet files.
+
+    One entry holds the result of one query window. The file modification
+    time is the moment the entry was stored and is checked against ``ttl``;
+    the access time is bumped on every hit and drives least recently used
+    eviction once the cache grows over ``max_bytes``. The size is counted
+    once and then kept as a running total, so storing an entry does not
+    list the whole cache.
+    """
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int, ttl: str | pd.Timedelta):
+        self.cache_dir = Path(cache_dir) / CACHE_SUBDIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.ttl_sec = pd.Timedelta(ttl).total_seconds()
+        self._size = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**query_parts) -> str:
+        """Hash the parts identifying a query window, e.g. database, measurement and range."""
+        normalized = json.dumps(query_parts, sort_keys=True, default=str)
+        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.parquet"
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        now = time.time()
+        if now - stat.st_mtime > self.ttl_sec:
+            path.unlink(missing_ok=True)
+            return None
+        df = pd.read_parquet(path)
+        os.utime(path, (now, stat.st_mtime))
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        df.to_parquet(tmp_path, index=False)
+        added = tmp_path.stat().st_size
+        try:
+            replaced = path.stat().st_size
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._size is None:
+                self._size = self.size()
+            else:
+                self._size += added - replaced
+            if self._size > self.max_bytes:
+                self.evict()
+
+    def entries(self) -> list[tuple[Path, os.stat_result]]:
+        entries = []
+        for path in self.cache_dir.glob("*.parquet"):
+            try:
+                entries.append((path, path.stat()))
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def size(self) -> int:
+        return sum(stat.st_size for _, stat in self.entries())
+
+    def evict(self) -> int:
+        """Remove expired entries, then least recently used ones until under ``max_bytes``."""
+        now = time.time()
+        removed = 0
+        entries = []
+        for path, stat in self.entries():
+            if now - stat.st_mtime > self.ttl_sec:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((path, stat))
+        total = sum(stat.st_size for _, stat in entries)
+        for path, stat in sorted(entries, key=lambda entry: entry[1].st_atime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+            removed += 1
+        self._size = total
+        return removed
+
+    def clear(self) -> int:
+        entries = self.entries()
+        for path, _ in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
+
+
+def settled_windows(start: pd.Timestamp, end: pd.Timestamp, settled_end: pd.Timestamp,
+                    bucket: str | pd.Timedelta) -> tuple[list[tuple[pd.Timestamp, pd.Timestamp]],
+                                                         pd.Timestamp | None]:
+    """Split ``[start, end]`` into cacheable windows and the start of the live tail.
+
+    Windows are ``bucket`` long, aligned to the epoch and clipped to the range,
+    so repeated queries over overlapping ranges reuse the same entries. Only
+    the part before ``settled_end`` is split; the returned tail start is None
+    when the whole range is settled.
+    """
+    bucket = pd.Timedelta(bucket)
+    windows = []
+    settled_stop = min(end, settled_end)
+    window_start = start
+    while window_start < settled_stop:
+        aligned = window_start.floor(bucket) + bucket
+        window_end = min(aligned, settled_stop)
+        windows.append((window_start, window_end))
+        window_start = window_end
+    tail_start = None if end < settled_end else max(start, settled_end)
+    return windows, tail_start
@@ -0,0 +1,134 @@
+import io
+import re
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+RESPONSE_FORMATS = {
+    "json": "application/json",
+    "msgpack": "application/x-msgpack",
+    "csv": "application/csv",
+}
+
+_UNESCAPED_COMMA = re.compile(r"(?<!\\),")
+_UNESCAPED_EQUALS = re.compile(r"(?<!\\)=")
+_ESCAPED_CHAR = re.compile(r"\\([ ,=\\])")
+
+
+class CsvResponseError(Exception):
+    """The server answered a CSV query with an error instead of results."""
+
+
+def parse_tags(tags: str) -> tuple[tuple[str, str], ...]:
+    """Parse the ``tags`` column of a CSV response, e.g. ``host=a,region=b``."""
+    if not tags:
+        return ()
+    pairs = []
+    for pair in _UNESCAPED_COMMA.split(tags):
+        key, value = _UNESCAPED_EQUALS.split(pair, maxsplit=1)
+        pairs.append((_ESCAPED_CHAR.sub(r"\1", key), _ESCAPED_CHAR.sub(r"\1", value)))
+    return tuple(sorted(pairs))
+
+
+def _read_block(block: bytes, string_columns: set[str] | frozenset = frozenset()) -> pa.Table:
+    header = block.split(b"\n", 1)[0].decode().split(",")
+    if header == ["error"]:
+        raise CsvResponseError(block.split(b"\n", 2)[1].decode())
+    column_types = {name: pa.string() for name in string_columns}
+    column_types.update({"name": pa.string(), "tags": pa.string(), "time": pa.int64()})
+    return pa_csv.read_csv(
+        io.BytesIO(block),
+        convert_options=pa_csv.ConvertOptions(column_types=column_types,
+                                              strings_can_be_null=True)
+    )
+
+
+def _series_key(name: str, tag_string: str | None):
+    tags = parse_tags(tag_string or "")
+    return (name, tags) if tags else name
+
+
+def _split_series(table: pa.Table, tables: dict) -> None:
+    """Split a CSV block by its ``name`` and ``tags`` columns into one table per series."""
+    names = table.column("name")
+    tags = pc.fill_null(table.column("tags"), "")
+    data = table.drop_columns(["name", "tags"])
+    time_index = data.schema.get_field_index("time")
+    data = data.set_column(time_index, "time",
+                           data.column(time_index).cast(pa.timestamp("ns", tz="UTC")))
+    series = pa.table({"name": names, "tags": tags}).group_by(["name", "tags"]).aggregate([])
+    if series.num_rows == 1:
+        groups = [(series.column("name")[0].as_py(), series.column("tags")[0].as_py(), data)]
+    else:
+        groups = []
+        for name, tag_string in zip(series.column("name").to_pylist(),
+                                    series.column("tags").to_pylist()):
+            mask = pc.and_(pc.equal(names, name), pc.equal(tags, tag_string))
+            groups.append((name, tag_string, data.filter(mask)))
+    for name, tag_string, group in groups:
+        tables.setdefault(_series_key(name, tag_string), []).append(group)
+
+
+def decode_csv_tables(body: bytes, string_columns: set[str] | frozenset = frozenset()
+                      ) -> dict[str | tuple, pa.Table]:
+    """Decode the CSV answer to a single statement into an Arrow table per series.
+
+    InfluxDB writes one CSV block per set of columns, blocks are separated
+    by an empty line and start with a ``name,tags,time,...`` header. Blocks
+    are parsed by Arrow's multi-threaded CSV reader straight into columns,
+    without Python objects per row. Keys are like ``InfluxClient._to_dataframe``
+    keys and ``time`` is a UTC timestamp column.
+
+    CSV does not tell strings from numbers, column types are inferred from
+    the values. Columns in ``string_columns``, the tags and string fields,
+    are kept as strings so that e.g. ``"42"`` or ``"true"`` stay strings as
+    in JSON answers.
+    """
+    tables: dict = {}
+    for block in re.split(rb"\r?\n\r?\n", body):
+        if not block.strip():
+            continue
+        _split_series(_read_block(block, string_columns), tables)
+    return {key: pa.concat_tables(key_tables, promote_options="default")
+            for key, key_tables in tables.items()}
+
+
+def decode_csv_response(body: bytes, dropna: bool = True,
+                        string_columns: set[str] | frozenset = frozenset()) -> dict:
+    """Decode the CSV answer to a single statement into DataFrames per series."""
+    df_dict = {}
+    for key, table in decode_csv_tables(body, string_columns).items():
+        df = table.to_pandas()
+        if dropna:
+            df = df.dropna()
+        df_dict[key] = df
+    return df_dict
+
+
+def series_to_table(columns: list[str], values: list[list]) -> pa.Table:
+    """Build an Arrow table from the ``columns`` and ``values`` of a JSON or msgpack series.
+
+    Columns are converted one at a time and the RFC 3339 ``time`` strings are
+    parsed by Arrow, no DataFrame is built.
+    """
+    arrays = {}
+    for name, column in zip(columns, zip(*values)):
+        if name == "time":
+            arrays[name] = pa.array(column, pa.string()).cast(pa.timestamp("ns", tz="UTC"))
+        else:
+            arrays[name] = pa.array(column)
+    return pa.table(arrays)
+
+
+def result_to_tables(raw: dict) -> dict[str | tuple, pa.Table]:
+    """Convert one statement result of a JSON or msgpack answer to an Arrow table per series."""
+    tables: dict = {}
+    for series in raw.get("series", []):
+        if not series.get("values"):
+            continue
+        tags = series.get("tags")
+        key = (series.get("name"), tuple(sorted(tags.items()))) if tags else series.get("name")
+        tables.setdefault(key, []).append(series_to_table(series["columns"], series["values"]))
+    return {key: pa.concat_tables(key_tables, promote_options="default")
+            for key, key_tables in tables.items()}
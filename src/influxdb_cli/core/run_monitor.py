@@ -0,0 +1,165 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable
+
+import pandas as pd
+
+from influxdb_cli.core.measurement_sync import rfc3339_ns
+
+if TYPE_CHECKING:
+    from influxdb_cli.core.influx_client import InfluxClient
+
+
+@dataclass
+class ProgressSample:
+    elapsed_seconds: float
+    points: int
+    points_per_sec: float
+    latest: pd.Timestamp | None = None
+    progress: float | None = None
+    eta_seconds: float | None = None
+
+    def describe(self) -> str:
+        text = f"{self.points} points written, {self.points_per_sec:.0f} points/s"
+        if self.latest is not None:
+            text += f", reached {self.latest.isoformat()}"
+        if self.progress is not None:
+            text += f" ({self.progress:.1%})"
+        if self.eta_seconds is not None:
+            text += f", about {self.eta_seconds:.0f}s left"
+        return text
+
+
+@dataclass
+class RunProgress:
+    samples: list[ProgressSample] = field(default_factory=list)
+
+    @property
+    def points(self) -> int:
+        return self.samples[-1].points if self.samples else 0
+
+    @property
+    def points_per_sec(self) -> float:
+        if not self.samples or not self.samples[-1].elapsed_seconds:
+            return 0.0
+        return self.samples[-1].points / self.samples[-1].elapsed_seconds
+
+
+class RunMonitor:
+    """Poll a test database while the application processes it.
+
+    Every ``poll_interval_sec`` the points written to the output measurements
+    (all but ``source_measurement`` and ``ignored_measurements``) since the
+    previous poll are counted and the latest output timestamp is compared
+    with the time range of the source measurement to estimate progress and
+    the time to completion. A poll first reads the latest timestamp of every
+    measurement, then counts the points between the previous and this upper
+    bound, so points written meanwhile are left to the next poll instead of
+    being lost. The queries of each step are sent in a single request.
+    """
+
+    def __init__(self,
+                 influx_client: "InfluxClient",
+                 database_name: str,
+                 source_measurement: str,
+                 poll_interval_sec: float = 10.0,
+                 ignored_measurements: list[str] | None = None,
+                 on_sample: Callable[[ProgressSample], None] | None = None):
+        self.influx_client = influx_client
+        self.database_name = database_name
+        self.source_measurement = source_measurement
+        self.poll_interval_sec = poll_interval_sec
+        self.ignored_measurements = set(ignored_measurements or []) | {source_measurement}
+        self.on_sample = on_sample
+        self.progress = RunProgress()
+        self._source_bounds: tuple[pd.Timestamp, pd.Timestamp] | None = None
+        self._latest: pd.Timestamp | None = None
+        self._latest_by_measurement: dict[str, pd.Timestamp] = {}
+        self._points = 0
+        self._started = 0.0
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _query_results(self, statements: list[str]) -> list[dict]:
+        results = self.influx_client.query("; ".join(statements), database=self.database_name,
+                                           dropna=False)
+        return results if isinstance(results, list) else [results]
+
+    def poll(self) -> ProgressSample:
+        """Query the database once and record a progress sample."""
+        measurements = [name for name in self.influx_client.show_measurements(self.database_name)
+                        if name not in self.ignored_measurements]
+        if measurements:
+            lasts = self._query_results(
+                [f'SELECT * FROM "{name}" ORDER BY time DESC LIMIT 1' for name in measurements])
+            bounds = {name: last[name]["time"].iloc[0] for name, last in zip(measurements, lasts)
+                      if name in last and not last[name].empty}
+            counted = [name for name in bounds
+                       if bounds[name] != self._latest_by_measurement.get(name)]
+            statements = []
+            for name in counted:
+                time_filter = f"time <= '{rfc3339_ns(bounds[name])}'"
+                if name in self._latest_by_measurement:
+                    time_filter += f" AND time > '{rfc3339_ns(self._latest_by_measurement[name])}'"
+                statements.append(f'SELECT count(*) FROM "{name}" WHERE {time_filter}')
+            if statements:
+                for name, count in zip(counted, self._query_results(statements)):
+                    if name in count and not count[name].empty:
+                        # count(*) returns one column per field, a point has at most all of them
+                        self._points += int(count[name].drop(columns="time").max(axis=1).iloc[0])
+            self._latest_by_measurement.update(bounds)
+            self._latest = max(self._latest_by_measurement.values(), default=None)
+
+        elapsed = time.perf_counter() - self._started
+        sample = ProgressSample(
+            elapsed_seconds=elapsed,
+            points=self._points,
+            points_per_sec=self._points / elapsed if elapsed else 0.0,
+            latest=self._latest
+        )
+        if self._source_bounds is not None and self._latest is not None:
+            first, last = self._source_bounds
+            span = (last - first).total_seconds()
+            if span > 0:
+                sample.progress = min(max((self._latest - first).total_seconds() / span, 0.0), 1.0)
+                if 0 < sample.progress < 1:
+                    sample.eta_seconds = elapsed * (1 - sample.progress) / sample.progress
+        self.progress.samples.append(sample)
+        if self.on_sample is not None:
+            self.on_sample(sample)
+        return sample
+
+    def _poll_loop(self) -> None:
+        while not self._stopped.wait(self.poll_interval_sec):
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Progress poll failed: {e}")
+
+    def start(self) -> "RunMonitor":
+        self._started = time.perf_counter()
+        self._source_bounds = self.influx_client.measurement_time_bounds(
+            measurement_name=self.source_measurement,
+            database_name=self.database_name
+        )
+        self._thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> RunProgress:
+        """Stop polling and take a final sample."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        try:
+            self.poll()
+        except Exception as e:
+            print(f"Progress poll failed: {e}")
+        return self.progress
+
+    def __enter__(self) -> "RunMonitor":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.stop()
@@ -0,0 +1,43 @@
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+def _read_csv_chunks(file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    with pd.read_csv(file_path, chunksize=chunk_size) as reader:
+        yield from reader
+
+
+def _read_parquet_chunks(file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Read a Parquet file one row group at a time, ``chunk_size`` is set by the file."""
+    parquet_file = pq.ParquetFile(file_path)
+    for row_group in range(parquet_file.num_row_groups):
+        yield parquet_file.read_row_group(row_group).to_pandas()
+
+
+def _read_feather_chunks(file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Read a Feather (Arrow IPC) file one record batch at a time."""
+    with pa.memory_map(str(file_path), "r") as source:
+        reader = pa.ipc.open_file(source)
+        for batch_index in range(reader.num_record_batches):
+            yield reader.get_batch(batch_index).to_pandas()
+
+
+EXTENSIONS_STREAM_READER_MAPPING = {
+    '.csv': _read_csv_chunks,
+    '.parquet': _read_parquet_chunks,
+    '.feather': _read_feather_chunks,
+}
+
+
+def stream_reader(file_path: str | Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    file_path = Path(file_path)
+    if not file_path.exists() or not file_path.is_file():
+        raise FileNotFoundError(f"File not found: {file_path}")
+    extension = file_path.suffix.lower()
+    if extension not in EXTENSIONS_STREAM_READER_MAPPING:
+        raise ValueError(f"Unsupported file extension for streaming import: {extension}")
+    return EXTENSIONS_STREAM_READER_MAPPING[extension](file_path, chunk_size)
@@ -0,0 +1,198 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from influxdb_cli.core.profiler import profile_phase
+
+
+class StreamWriter:
+    """Base class for writers that persist a measurement chunk by chunk.
+
+    Chunks are DataFrames indexed by ``time``. Subclasses keep only the
+    open file handle between calls, so memory stays bounded by one chunk.
+    """
+
+    def __init__(self, file_path: str | Path):
+        self.file_path = Path(file_path)
+        self.rows_written = 0
+
+    def write(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        with profile_phase("file_writer", rows=len(df)):
+            self._write(df)
+        self.rows_written += len(df)
+
+    def _write(self, df: pd.DataFrame) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CsvStreamWriter(StreamWriter):
+    """Append CSV lines, writing the header with the first chunk only."""
+
+    def __init__(self, file_path: str | Path):
+        super().__init__(file_path)
+        self._file = open(self.file_path, "w", newline="")
+
+    def _write(self, df: pd.DataFrame) -> None:
+        df.to_csv(self._file, header=self.rows_written == 0)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class NdjsonStreamWriter(StreamWriter):
+    """Append one JSON record per line."""
+
+    def __init__(self, file_path: str | Path):
+        super().__init__(file_path)
+        self._file = open(self.file_path, "w")
+
+    def _write(self, df: pd.DataFrame) -> None:
+        df.reset_index().to_json(self._file, orient="records", lines=True, date_format="iso")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ArrowStreamWriter(StreamWriter):
+    """Common schema handling for the Arrow based writers.
+
+    The schema of the first chunk is kept and later chunks are cast to it.
+    A chunk's inferred types depend on its values, e.g. a float field whose
+    values are all whole numbers comes back from JSON as integers, so the
+    known types of the columns should be given as ``column_types``: every
+    chunk is cast to them before its schema is compared. Besides
+    DataFrames, ``write_table`` takes Arrow tables with a ``time`` column
+    and writes them without going through pandas.
+    """
+
+    preserve_index = True
+
+    def __init__(self, file_path: str | Path,
+                 column_types: dict[str, pa.DataType] | None = None):
+        super().__init__(file_path)
+        self.column_types = column_types or {}
+        self._schema = None
+        self._writer = None
+
+    def _to_table(self, df: pd.DataFrame) -> pa.Table:
+        if not self.preserve_index:
+            df = df.reset_index()
+        return pa.Table.from_pandas(df, preserve_index=self.preserve_index)
+
+    def _from_arrow(self, table: pa.Table) -> pa.Table:
+        """Lay out an Arrow table with a ``time`` column like ``_to_table`` output."""
+        if not self.preserve_index:
+            return table
+        names = [name for name in table.column_names if name != "time"] + ["time"]
+        if self._schema is not None:
+            return table.select(names)
+        # pandas metadata marking "time" as the index, as written by DataFrame.to_parquet
+        empty = table.slice(0, 0).to_pandas().set_index("time")
+        metadata = pa.Table.from_pandas(empty, preserve_index=True).schema.metadata
+        return table.select(names).replace_schema_metadata(metadata)
+
+    def _conform(self, table: pa.Table) -> pa.Table:
+        if self.column_types:
+            schema = pa.schema([field.with_type(self.column_types[field.name])
+                                if field.name in self.column_types else field
+                                for field in table.schema], metadata=table.schema.metadata)
+            if not schema.equals(table.schema):
+                table = table.cast(schema)
+        if self._schema is None:
+            self._schema = table.schema
+            self._writer = self._open(self._schema)
+        elif not table.schema.equals(self._schema, check_metadata=False):
+            table = table.select(self._schema.names).cast(self._schema)
+        return table
+
+    def _open(self, schema: pa.Schema):
+        raise NotImplementedError
+
+    def _write(self, df: pd.DataFrame) -> None:
+        self._write_table(self._conform(self._to_table(df)))
+
+    def write_table(self, table: pa.Table) -> None:
+        if table.num_rows == 0:
+            return
+        with profile_phase("file_writer", rows=table.num_rows):
+            self._write_table(self._conform(self._from_arrow(table)))
+        self.rows_written += table.num_rows
+
+    def _write_table(self, table: pa.Table) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+class ParquetStreamWriter(_ArrowStreamWriter):
+    """Write every chunk as a separate Parquet row group."""
+
+    def __init__(self, file_path: str | Path, compression: str = "snappy",
+                 column_types: dict[str, pa.DataType] | None = None):
+        super().__init__(file_path, column_types=column_types)
+        self.compression = compression
+
+    def _open(self, schema: pa.Schema):
+        return pq.ParquetWriter(self.file_path, schema, compression=self.compression)
+
+    def _write_table(self, table: pa.Table) -> None:
+        self._writer.write_table(table)
+
+
+class ArrowIpcStreamWriter(_ArrowStreamWriter):
+    """Write every chunk as Arrow IPC record batches (readable as Feather v2)."""
+
+    preserve_index = False
+
+    def _open(self, schema: pa.Schema):
+        return pa.ipc.new_file(self.file_path, schema)
+
+    def _write_table(self, table: pa.Table) -> None:
+        for batch in table.to_batches():
+            self._writer.write_batch(batch)
+
+
+EXTENSIONS_STREAM_WRITER_MAPPING = {
+    '.csv': CsvStreamWriter,
+    '.ndjson': NdjsonStreamWriter,
+    '.jsonl': NdjsonStreamWriter,
+    '.parquet': ParquetStreamWriter,
+    '.feather': ArrowIpcStreamWriter,
+    '.arrow': ArrowIpcStreamWriter,
+}
+
+ARROW_STREAM_WRITER_EXTENSIONS = ('.parquet', '.feather', '.arrow')
+
+
+def stream_writer(file_path: str | Path,
+                  column_types: dict[str, pa.DataType] | None = None) -> StreamWriter:
+    """Open the stream writer for the extension of ``file_path``.
+
+    ``.json`` is not streamed: a JSON document cannot be appended to chunk by
+    chunk, ``.ndjson``/``.jsonl`` write one record per line instead.
+    """
+    file_path = Path(file_path)
+    extension = file_path.suffix.lower()
+    if extension not in EXTENSIONS_STREAM_WRITER_MAPPING:
+        supported = ", ".join(EXTENSIONS_STREAM_WRITER_MAPPING)
+        raise ValueError(f"Unsupported file extension for streaming export: {extension}, "
+                         f"use one of {supported}")
+    writer_class = EXTENSIONS_STREAM_WRITER_MAPPING[extension]
+    if issubclass(writer_class, _ArrowStreamWriter):
+        return writer_class(file_path, column_types=column_types)
+    return writer_class(file_path)
@@ -0,0 +1,212 @@
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+import numpy as np
+import pyarrow as pa
+import requests
+from influxdb.exceptions import InfluxDBClientError, InfluxDBServerError
+
+from influxdb_cli.core.line_protocol import lines_to_bytes
+from influxdb_cli.core.profiler import profile_phase
+
+if TYPE_CHECKING:
+    from influxdb_cli.core.influx_client import InfluxClient
+
+MAX_BACKOFF_SEC = 30.0
+
+
+@dataclass
+class WriteStats:
+    points: int = 0
+    bytes: int = 0
+    batches: int = 0
+    retries: int = 0
+    seconds: float = 0.0
+
+    @property
+    def points_per_sec(self) -> float:
+        return self.points / self.seconds if self.seconds else 0.0
+
+
+def is_transient(error: Exception) -> bool:
+    """Tell errors worth retrying (connection problems, 5xx, 429) from rejected data.
+
+    ``InfluxClient.request`` re-raises connection failures of ``requests`` as
+    the builtin ``ConnectionError``, both count as connection problems.
+    """
+    if isinstance(error, (ConnectionError, requests.exceptions.ConnectionError,
+                          requests.exceptions.Timeout, InfluxDBServerError)):
+        return True
+    return isinstance(error, InfluxDBClientError) and error.code == 429
+
+
+class AdaptiveBatchSizer:
+    """Pick the number of points of the next write from the latency of the previous ones.
+
+    The time per point is smoothed over the acknowledged batches and the next
+    batch is sized to take ``target_seconds``, growing at most twice per
+    batch and staying within ``[min_size, max_size]``. A failed batch halves
+    the size.
+    """
+
+    def __init__(self, initial_size: int, min_size: int, max_size: int, target_seconds: float,
+                 smoothing: float = 0.3):
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size)
+        self.target_seconds = target_seconds
+        self.smoothing = smoothing
+        self.size = self._clamp(initial_size)
+        self._seconds_per_point = None
+        self._lock = threading.Lock()
+
+    def _clamp(self, size: int) -> int:
+        return max(self.min_size, min(self.max_size, size))
+
+    def observe(self, points: int, seconds: float) -> None:
+        if not points:
+            return
+        with self._lock:
+            seconds_per_point = seconds / points
+            if self._seconds_per_point is None:
+                self._seconds_per_point = seconds_per_point
+            else:
+                self._seconds_per_point += self.smoothing * (seconds_per_point
+                                                             - self._seconds_per_point)
+            target = int(self.target_seconds / max(self._seconds_per_point, 1e-9))
+            self.size = self._clamp(min(target, 2 * self.size))
+
+    def shrink(self) -> None:
+        with self._lock:
+            self.size = self._clamp(self.size // 2)
+
+
+class WritePipeline:
+    """Write line protocol points in adaptively sized, concurrent batches.
+
+    Batches are cut from the serialized points by the ``AdaptiveBatchSizer``
+    and never exceed ``write_batch_max_bytes``. At most
+    ``write_max_in_flight`` batches are sent at a time, the next batch is
+    only cut once one of them is acknowledged. One pipeline is meant to be
+    shared by all writes of an operation: the sizer keeps adapting across
+    calls and the in-flight limit holds for all threads writing through it.
+    Transient failures are retried ``write_retries`` times with full jitter
+    exponential backoff, every attempt connects only once so this is the
+    only retry policy of writes. A retry
+    sends the very same body and every point carries its timestamp, so
+    InfluxDB overwrites points it may already have stored instead of
+    duplicating them. Tuning values come from the client's config, a fixed
+    ``batch_size`` turns the adaptation off.
+    """
+
+    def __init__(self, influx_client: "InfluxClient", batch_size: int | None = None):
+        config = influx_client.config
+        self.influx_client = influx_client
+        self.sizer = AdaptiveBatchSizer(
+            initial_size=batch_size or config.write_batch_size,
+            min_size=batch_size or config.write_batch_min_size,
+            max_size=batch_size or config.write_batch_max_size,
+            target_seconds=config.write_batch_target_sec
+        )
+        self.max_bytes = config.write_batch_max_bytes
+        self.max_in_flight = config.write_max_in_flight
+        self.retries = config.write_retries
+        self.backoff_sec = config.write_backoff_sec
+        self._in_flight = threading.Semaphore(self.max_in_flight)
+
+    def _batch_length(self, offsets: np.ndarray, start: int) -> int:
+        """Points from ``start`` on that fit into the next batch, at least one."""
+        size = self.sizer.size
+        fitting = int(np.searchsorted(offsets, offsets[start] + self.max_bytes, side="right")) \
+            - 1 - start
+        return max(1, min(size, fitting))
+
+    def send(self, body: bytes, params: dict, headers: dict) -> tuple[float, int]:
+        """Send one request body, retrying transient failures.
+
+        Returns the seconds of the successful attempt and the number of retries.
+        """
+        for attempt in range(self.retries + 1):
+            try:
+                with self._in_flight:
+                    started = time.perf_counter()
+                    self.influx_client.request(url="write", method="POST", params=params,
+                                               data=body, expected_response_code=204,
+                                               headers=dict(headers), retries=1)
+                    return time.perf_counter() - started, attempt
+            except Exception as e:
+                if attempt == self.retries or not is_transient(e):
+                    raise
+                self.sizer.shrink()
+                backoff = min(MAX_BACKOFF_SEC, self.backoff_sec * 2 ** attempt)
+                time.sleep(random.uniform(0, backoff))
+
+    def write(self, lines: pa.LargeStringArray, params: dict, headers: dict,
+              stats: WriteStats | None = None) -> int:
+        """Send ``lines`` and return the number of points written, counted into ``stats``."""
+        if len(lines) == 0:
+            return 0
+        # Newline separated, the byte size of a batch is an offsets difference plus its newlines
+        offsets = np.frombuffer(lines.buffers()[1], dtype=np.int64)[
+            lines.offset:lines.offset + len(lines) + 1] + np.arange(len(lines) + 1)
+
+        def body(start: int, length: int) -> bytes:
+            return lines_to_bytes(lines.slice(start, length))
+
+        return self.write_batches(body, offsets, params, headers, stats)
+
+    def write_batches(self, body: Callable[[int, int], bytes], offsets: np.ndarray,
+                      params: dict, headers: dict, stats: WriteStats | None = None,
+                      on_acked: Callable[[int], None] | None = None,
+                      stop: threading.Event | None = None) -> int:
+        """Send points cut into batches by ``body(start, length)``.
+
+        ``offsets`` are the byte offsets of the points in the body and the end
+        of the last one, they bound the request size. ``on_acked`` is called
+        with the number of leading points that are all acknowledged whenever
+        it grows, batches may finish out of order. Once ``stop`` is set no
+        further batch is cut, the pending ones are still waited for.
+        """
+        stats = stats if stats is not None else WriteStats()
+        started = time.perf_counter()
+        total = len(offsets) - 1
+        points = 0
+        acked = 0
+        finished = {}
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            pending = {}
+            start = 0
+            try:
+                while start < total and not (stop is not None and stop.is_set()) or pending:
+                    while start < total and len(pending) < self.max_in_flight \
+                            and not (stop is not None and stop.is_set()):
+                        length = self._batch_length(offsets, start)
+                        with profile_phase("serialize", rows=length) as record:
+                            request_body = body(start, length)
+                            record.bytes = len(request_body)
+                        future = executor.submit(self.send, request_body, params, headers)
+                        pending[future] = (start, length, len(request_body))
+                        start += length
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        batch_start, length, size = pending.pop(future)
+                        seconds, retries = future.result()
+                        self.sizer.observe(length, seconds)
+                        points += length
+                        stats.points += length
+                        stats.bytes += size
+                        stats.batches += 1
+                        stats.retries += retries
+                        finished[batch_start] = length
+                    if on_acked is not None and acked in finished:
+                        while acked in finished:
+                            acked += finished.pop(acked)
+                        on_acked(acked)
+            finally:
+                for future in pending:
+                    future.cancel()
+                stats.seconds += time.perf_counter() - started
+        return points
@@ -0,0 +1,247 @@
+import json
+import mmap
+import os
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pyarrow as pa
+
+from influxdb_cli.core.line_protocol import lines_to_bytes
+from influxdb_cli.core.write_pipeline import (MAX_BACKOFF_SEC, WritePipeline, WriteStats,
+                                              is_transient)
+
+if TYPE_CHECKING:
+    from influxdb_cli.core.influx_client import InfluxClient
+
+META_FILE_NAME = "spool.json"
+ACK_FILE_NAME = "ack.json"
+SEGMENT_SUFFIX = ".lp"
+
+
+def _write_json(path: Path, data: dict) -> None:
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    with open(tmp_path, "w") as file:
+        json.dump(data, file)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+class WriteSpool:
+    """Append-only on-disk log of line protocol points waiting to be written.
+
+    Points are appended to numbered segment files of about
+    ``segment_bytes``, as the request bodies they will be sent as, so the
+    log can be replayed straight from memory maps. ``spool.json`` holds the
+    target database, retention policy and precision and whether the
+    producer closed the spool. ``ack.json`` holds the segment and byte
+    offset up to which the server acknowledged the points, a flusher
+    continues from there after a crash.
+    """
+
+    def __init__(self, spool_dir: str | Path):
+        self.spool_dir = Path(spool_dir)
+        self.meta_path = self.spool_dir / META_FILE_NAME
+        self.ack_path = self.spool_dir / ACK_FILE_NAME
+        if not self.meta_path.is_file():
+            raise FileNotFoundError(f"Not a write spool: {self.spool_dir}")
+        self.meta = json.loads(self.meta_path.read_text())
+        self._file = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, spool_dir: str | Path, database: str, retention_policy: str | None,
+               time_precision: str, segment_bytes: int) -> "WriteSpool":
+        spool_dir = Path(spool_dir)
+        if (spool_dir / META_FILE_NAME).exists():
+            raise FileExistsError(f"Spool {spool_dir} still holds points, flush it first.")
+        spool_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(spool_dir / META_FILE_NAME, {
+            "database": database, "retention_policy": retention_policy,
+            "time_precision": time_precision, "segment_bytes": segment_bytes, "closed": False
+        })
+        _write_json(spool_dir / ACK_FILE_NAME, {"segment": 0, "offset": 0})
+        return cls(spool_dir)
+
+    @property
+    def closed(self) -> bool:
+        return self.meta["closed"]
+
+    def segment_path(self, segment: int) -> Path:
+        return self.spool_dir / f"{segment:08d}{SEGMENT_SUFFIX}"
+
+    def segments(self) -> list[int]:
+        return sorted(int(path.stem) for path in self.spool_dir.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def append(self, lines: pa.LargeStringArray) -> int:
+        """Append points to the log, starting a new segment when the current one is full."""
+        if len(lines) == 0:
+            return 0
+        body = lines_to_bytes(lines)
+        with self._lock:
+            if self._file is None or self._file.tell() >= self.meta["segment_bytes"]:
+                self._rotate()
+            self._file.write(body)
+            self._file.flush()
+        return len(lines)
+
+    def _rotate(self) -> None:
+        segments = self.segments()
+        self._close_segment()
+        self._file = open(self.segment_path(segments[-1] + 1 if segments else 0), "ab")
+
+    def _close_segment(self) -> None:
+        if self._file is not None:
+            try:
+                os.fsync(self._file.fileno())
+            finally:
+                self._file.close()
+                self._file = None
+
+    def release(self) -> None:
+        """Close the segment being appended to, the spool stays open for ``spool flush``."""
+        with self._lock:
+            self._close_segment()
+
+    def close(self) -> None:
+        """Mark the spool complete, a flusher then drains it and removes it."""
+        with self._lock:
+            self._close_segment()
+            self.meta["closed"] = True
+            _write_json(self.meta_path, self.meta)
+
+    def read_ack(self) -> tuple[int, int]:
+        ack = json.loads(self.ack_path.read_text())
+        return ack["segment"], ack["offset"]
+
+    def commit_ack(self, segment: int, offset: int) -> None:
+        _write_json(self.ack_path, {"segment": segment, "offset": offset})
+
+    def pending_bytes(self) -> int:
+        segment, offset = self.read_ack()
+        return sum(self.segment_path(number).stat().st_size for number in self.segments()
+                   if number >= segment) - offset
+
+    def remove(self) -> None:
+        for number in self.segments():
+            self.segment_path(number).unlink()
+        self.ack_path.unlink(missing_ok=True)
+        self.meta_path.unlink(missing_ok=True)
+
+
+class SpoolFlusher:
+    """Drain a ``WriteSpool`` to the server through the ``WritePipeline``.
+
+    Segments are memory mapped and cut into requests at point boundaries,
+    the acknowledged offset is committed as requests complete, fully
+    written segments are deleted. Server outages longer than the
+    pipeline's retries are waited out with backoff, the flusher then
+    continues from the last acknowledged offset. With ``follow`` it waits
+    for points a producer still appends until the spool is closed, without
+    it everything complete in the spool is drained, e.g. after a crash.
+    """
+
+    def __init__(self, influx_client: "InfluxClient", spool: WriteSpool, follow: bool = True,
+                 poll_interval_sec: float = 0.2):
+        self.influx_client = influx_client
+        self.spool = spool
+        self.follow = follow
+        self.poll_interval_sec = poll_interval_sec
+        self.stats = WriteStats()
+        self.pipeline = WritePipeline(influx_client)
+        meta = spool.meta
+        self.params = {'db': meta["database"], 'precision': meta["time_precision"]}
+        if meta["retention_policy"] is not None:
+            self.params['rp'] = meta["retention_policy"]
+        self.headers = {**influx_client._headers, 'Content-Type': 'application/octet-stream'}
+        self._stop = threading.Event()
+        self._executor = None
+        self._future: Future | None = None
+
+    def _drain_segment(self, segment: int, offset: int) -> None:
+        """Send the complete points of a segment after ``offset``."""
+        path = self.spool.segment_path(segment)
+        if path.stat().st_size <= offset:
+            return
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            newlines = np.frombuffer(mm, dtype=np.uint8, offset=offset) == ord("\n")
+            offsets = np.concatenate(([offset], np.flatnonzero(newlines) + offset + 1))
+            del newlines
+            if len(offsets) == 1:
+                return
+
+            def body(start: int, length: int) -> bytes:
+                return mm[offsets[start]:offsets[start + length]]
+
+            def on_acked(points: int) -> None:
+                self.spool.commit_ack(segment, int(offsets[points]))
+
+            self.pipeline.write_batches(body, offsets, self.params, self.headers,
+                                        stats=self.stats, on_acked=on_acked, stop=self._stop)
+
+    def _drain(self) -> bool:
+        """Drain what is in the spool, return True once it is closed and empty."""
+        segment, offset = self.spool.read_ack()
+        complete = self.spool.closed or not self.follow
+        segments = [number for number in self.spool.segments() if number >= segment]
+        for number in segments:
+            self._drain_segment(number, offset if number == segment else 0)
+            if self._stop.is_set() or number == segments[-1] and not complete:
+                return False
+            # Earlier segments are complete, the producer moved on to a newer one
+            if number != segments[-1]:
+                self.spool.commit_ack(number + 1, 0)
+                self.spool.segment_path(number).unlink()
+        return complete
+
+    def run(self) -> WriteStats:
+        backoff = self.pipeline.backoff_sec
+        while not self._stop.is_set():
+            if self.follow:
+                # The producer may close the spool while a pass runs, the next pass drains the rest
+                self.spool.meta = json.loads(self.spool.meta_path.read_text())
+            try:
+                if self._drain():
+                    self.spool.remove()
+                    return self.stats
+                backoff = self.pipeline.backoff_sec
+            except Exception as e:
+                if not is_transient(e):
+                    raise
+                backoff = min(MAX_BACKOFF_SEC, max(backoff, 0.1) * 2)
+                self._stop.wait(backoff)
+                continue
+            self._stop.wait(self.poll_interval_sec)
+        return self.stats
+
+    def start(self) -> "SpoolFlusher":
+        """Drain the spool on a background thread while a producer appends to it."""
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._future = self._executor.submit(self.run)
+        return self
+
+    def check(self) -> None:
+        """Raise the error the background flusher stopped with, if any."""
+        if self._future is not None and self._future.done():
+            self._future.result()
+
+    def finish(self) -> WriteStats:
+        """Close the spool and wait until the background flusher drained it."""
+        self.spool.close()
+        try:
+            return self._future.result()
+        finally:
+            self._executor.shutdown()
+
+    def abort(self) -> None:
+        """Stop the background flusher, the spool keeps what is not written yet."""
+        self._stop.set()
+        try:
+            self._future.exception()
+        finally:
+            self._executor.shutdown()
+            self.spool.release()
@@ -0,0 +1,31 @@
+import socket
+
+import pytest
+
+from fake_influx import FakeInfluxServer
+from influxdb_cli.config.config_manager import ConfigModel
+from influxdb_cli.core.influx_client import InfluxClient
+
+
+@pytest.fixture
+def influx_server():
+    with FakeInfluxServer() as server:
+        yield server
+
+
+@pytest.fixture
+def make_client(influx_server):
+    """Build clients of the fake server, config values can be overridden."""
+    def make(**overrides) -> InfluxClient:
+        config = {"host": "127.0.0.1", "port": influx_server.port, "database": "bench",
+                  **overrides}
+        return InfluxClient(ConfigModel(**config))
+    return make
+
+
+@pytest.fixture
+def closed_port() -> int:
+    """A local port nothing listens on, connections to it are refused."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
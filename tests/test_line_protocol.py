@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from influxdb import DataFrameClient
+
+from influxdb_cli.core.line_protocol import lines_to_bytes, serialize_lines
+
+
+def _frame() -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=5, freq="1234567ns", tz="UTC")
+    return pd.DataFrame({
+        "power": [0.1, 1.0, 1e-05, np.nan, -2.5e300],
+        "count": [1, -2, 3, 4, 0],
+        "ok": [True, False, True, False, True],
+        "state": ["plain", "with space", "a,b=c", None, "x"],
+        "host": ["a", "b c", "d,e", "f=g", ""],
+    }, index=index)
+
+
+def _reference(df: pd.DataFrame, measurement: str, **kwargs) -> list[str]:
+    return DataFrameClient()._convert_dataframe_to_lines(df, measurement, **kwargs)
+
+
+def _ours(data, measurement: str, **kwargs) -> list[str]:
+    return lines_to_bytes(serialize_lines(data, measurement, **kwargs)).decode().splitlines()
+
+
+@pytest.mark.parametrize("time_precision", [None, "n", "u", "ms", "s", "m", "h"])
+def test_repr_output_is_byte_for_byte_dataframe_client(time_precision):
+    df = _frame()
+    kwargs = dict(tag_columns=["host"], time_precision=time_precision)
+    assert _ours(df, "my measurement", **kwargs) == _reference(df, "my measurement", **kwargs)
+
+
+def test_global_tags_and_field_columns_match_dataframe_client():
+    df = _frame()
+    kwargs = dict(tag_columns=["host"], field_columns=["power", "count"],
+                  global_tags={"site": "north pole", "rack": "1"})
+    assert _ours(df, "m", **kwargs) == _reference(df, "m", **kwargs)
+
+
+def test_arrow_table_serializes_like_the_dataframe():
+    df = _frame()
+    table = pa.Table.from_pandas(df.rename_axis("time").reset_index(), preserve_index=False)
+    assert _ours(table, "m", tag_columns=["host"]) == _ours(df, "m", tag_columns=["host"])
+
+
+def test_string_field_escapes_diverge_from_dataframe_client():
+    """Expected divergence: quotes and backslashes in string fields are escaped.
+
+    ``DataFrameClient`` writes them unescaped, a quote then ends the string
+    early; the line protocol requires ``\\"`` and ``\\\\``.
+    """
+    index = pd.date_range("2024-01-01", periods=2, freq="s", tz="UTC")
+    df = pd.DataFrame({"note": ['say "hi"', "C:\\temp"]}, index=index)
+    assert _reference(df, "m") == ['m note="say "hi"" 1704067200000000000',
+                                   'm note="C:\\temp" 1704067201000000000']
+    assert _ours(df, "m") == ['m note="say \\"hi\\"" 1704067200000000000',
+                              'm note="C:\\\\temp" 1704067201000000000']
+
+
+def test_shortest_floats_parse_to_the_same_values():
+    df = _frame()[["power"]].dropna()
+    lines = _ours(df, "m", float_format="shortest")
+    values = [float(line.split(" ")[1].split("=")[1]) for line in lines]
+    assert values == df["power"].tolist()
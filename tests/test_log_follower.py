@@ -0,0 +1,96 @@
+import sys
+import textwrap
+import time
+
+import pytest
+
+from influxdb_cli.core.log_follower import LogFollower
+
+
+def fake_docker(tmp_path, script: str) -> str:
+    """Write an executable standing in for ``docker``, it runs ``script`` for ``docker logs``.
+
+    Every invocation appends its arguments to ``calls.txt`` next to it.
+    """
+    path = tmp_path / "docker"
+    calls = tmp_path / "calls.txt"
+    path.write_text(f"#!{sys.executable}\n" + textwrap.dedent(f"""\
+        import sys
+        with open({str(calls)!r}, "a") as file:
+            file.write(" ".join(sys.argv[1:]) + "\\n")
+        calls = open({str(calls)!r}).read().splitlines()
+        """) + textwrap.dedent(script))
+    path.chmod(0o755)
+    return str(path)
+
+
+def calls(tmp_path) -> list[str]:
+    return (tmp_path / "calls.txt").read_text().splitlines()
+
+
+def test_completion_marker_is_detected(tmp_path):
+    docker = fake_docker(tmp_path, """\
+        print("starting", flush=True)
+        print("Run finished: 3 tests", flush=True)
+        """)
+    lines = []
+    with LogFollower("app", [r"Run finished"], on_line=lines.append,
+                     docker_executable=docker) as follower:
+        assert follower.wait(timeout=10)
+    assert follower.matched_line == "Run finished: 3 tests"
+    assert lines == ["starting", "Run finished: 3 tests"]
+    assert calls(tmp_path) == ["logs -f app"]
+
+
+def test_stream_is_resumed_after_the_container_restarts(tmp_path):
+    docker = fake_docker(tmp_path, """\
+        if len(calls) == 1:
+            print("before restart", flush=True)
+        else:
+            print("DONE", flush=True)
+        """)
+    with LogFollower("app", [r"^DONE$"], since=100.0, docker_executable=docker,
+                     reconnect_delay_sec=0.01) as follower:
+        assert follower.wait(timeout=10)
+    first, second = calls(tmp_path)
+    assert first == "logs -f --since 100.000000 app"
+    assert second.startswith("logs -f --since ") and float(second.split()[3]) > 100.0
+
+
+def test_missing_docker_is_raised_by_wait(tmp_path):
+    follower = LogFollower("app", [r"DONE"], docker_executable=str(tmp_path / "missing"))
+    with follower:
+        with pytest.raises(FileNotFoundError):
+            follower.wait(timeout=10)
+
+
+def test_failing_docker_logs_gives_up_after_max_failed_exits(tmp_path):
+    docker = fake_docker(tmp_path, """\
+        print("Error: No such container: app", flush=True)
+        sys.exit(1)
+        """)
+    follower = LogFollower("app", [r"DONE"], docker_executable=docker,
+                           reconnect_delay_sec=0.01, max_failed_exits=3).start()
+    started = time.perf_counter()
+    with pytest.raises(RuntimeError, match="No such container"):
+        follower.wait(timeout=10)
+    assert time.perf_counter() - started < 10
+    assert len(calls(tmp_path)) == 3
+    follower.stop()
+
+
+def test_error_is_raised_by_stop_when_not_waited_for(tmp_path):
+    follower = LogFollower("app", [r"DONE"], docker_executable=str(tmp_path / "missing")).start()
+    follower._finished.wait(timeout=10)
+    with pytest.raises(FileNotFoundError):
+        follower.stop()
+
+
+def test_wait_times_out_while_the_run_is_going(tmp_path):
+    docker = fake_docker(tmp_path, """\
+        import time
+        print("working", flush=True)
+        time.sleep(30)
+        """)
+    with LogFollower("app", [r"DONE"], docker_executable=docker) as follower:
+        assert not follower.wait(timeout=0.3)
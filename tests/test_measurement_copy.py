@@ -0,0 +1,55 @@
+import pytest
+
+from fake_influx import FakeInfluxServer
+from influxdb_cli.config.config_manager import ConfigModel
+from influxdb_cli.core.influx_client import InfluxClient
+from influxdb_cli.core.measurement_copy import MeasurementCopier
+
+# The last point has a sub-microsecond timestamp, as nanosecond precision writes do
+VALUES = [["2024-01-01T10:00:00Z", "a", 1, 5], ["2024-01-01T11:00:00Z", "a", 2, 6],
+          ["2024-01-01T11:30:00Z", "b", 2.5, 7], ["2024-01-01T12:30:00.123456789Z", "b", 3, 8]]
+
+
+def add_measurement(server: FakeInfluxServer) -> None:
+    server.add_measurement("m", ["time", "host", "power", "count"], VALUES,
+                           field_types={"power": "float", "count": "integer"}, tags=["host"])
+
+
+def test_select_into_copies_slices_on_the_server(influx_server, make_client):
+    add_measurement(influx_server)
+    copier = MeasurementCopier(make_client(response_format="json"), slice_duration="1h")
+    report = copier.copy("m", "bench", "copy")
+    assert report.mode == "select_into"
+    assert report.points == 4
+    assert report.batches == 3
+    statements = [query for query in influx_server.queries if " INTO " in query]
+    assert len(statements) == 3
+    assert all('INTO "copy".."m"' in query and query.endswith("GROUP BY *")
+               for query in statements)
+    assert "time < '2024-01-01T11:00:00.000000000Z'" in statements[0]
+    assert "time < '2024-01-01T12:00:00.000000000Z'" in statements[1]
+    assert "time <= '2024-01-01T12:30:00.123456789Z'" in statements[2]
+    assert "CREATE DATABASE copy" in influx_server.queries
+
+
+def test_server_entry_with_other_settings_streams(influx_server, make_client):
+    source = make_client()
+    destination = InfluxClient(ConfigModel(**{**source.config.model_dump(), "gzip": True}))
+    assert MeasurementCopier(source, make_client(database="other")).same_server
+    assert not MeasurementCopier(source, destination).same_server
+
+
+def test_stream_writes_tags_and_typed_fields(influx_server, make_client):
+    add_measurement(influx_server)
+    with FakeInfluxServer(keep_writes=True) as destination_server:
+        destination = InfluxClient(ConfigModel(host="127.0.0.1", port=destination_server.port))
+        copier = MeasurementCopier(make_client(response_format="json"), destination,
+                                   chunk_size=1)
+        report = copier.copy("m", "bench", "copy")
+        lines = b"".join(destination_server.write_bodies).decode().splitlines()
+    assert report.mode == "stream"
+    assert report.points == 4
+    # Whole number floats are written without the integer suffix, as floats
+    assert lines[0] == "m,host=a power=1,count=5i 1704103200000000000"
+    assert lines[2] == "m,host=b power=2.5,count=7i 1704108600000000000"
+    assert lines[3] == "m,host=b power=3,count=8i 1704112200123456789"
@@ -0,0 +1,26 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from influxdb_cli.core.measurement_sync import MeasurementSync
+
+# Day one holds only whole numbers of the float field, JSON answers them as integers
+VALUES = [["2024-01-01T10:00:00Z", 1, 5, "a"], ["2024-01-01T11:00:00Z", 2, 6, "a"],
+          ["2024-01-02T10:00:00Z", 2.5, 7, "b"], ["2024-01-02T11:00:00Z", 3, 8, "b"]]
+
+
+def test_part_files_share_the_measurement_schema(influx_server, make_client, tmp_path):
+    influx_server.add_measurement("m", ["time", "power", "count", "host"], VALUES,
+                                  field_types={"power": "float", "count": "integer"},
+                                  tags=["host"])
+    syncer = MeasurementSync(make_client(response_format="json"), tmp_path, chunk_size=1)
+    result = syncer.sync("bench", "m")
+    assert result.points == 4
+    assert len(result.files) == 2
+    schemas = {pq.read_schema(path).remove_metadata() for path in result.files}
+    assert len(schemas) == 1
+    schema = schemas.pop()
+    assert schema.field("power").type == pa.float64()
+    assert schema.field("count").type == pa.int64()
+    assert schema.field("host").type == pa.string()
+    dataset = pq.read_table(tmp_path / "bench" / "m")
+    assert sorted(dataset.column("power").to_pylist()) == [1.0, 2.0, 2.5, 3.0]
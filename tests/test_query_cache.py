@@ -0,0 +1,33 @@
+import pandas as pd
+
+from influxdb_cli.core.query_cache import QueryCache
+
+
+def frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"value": range(rows)})
+
+
+def test_put_lists_the_cache_only_when_over_budget(tmp_path, monkeypatch):
+    cache = QueryCache(tmp_path, max_bytes=10 ** 9, ttl="1d")
+    listings = []
+    entries = cache.entries
+    monkeypatch.setattr(cache, "entries", lambda: listings.append(1) or entries())
+    for index in range(50):
+        cache.put(f"key{index}", frame(10))
+    assert len(listings) == 1
+    assert cache.get("key49") is not None
+
+
+def test_put_evicts_least_recently_used_over_budget(tmp_path):
+    probe = QueryCache(tmp_path / "probe", max_bytes=10 ** 9, ttl="1d")
+    probe.put("probe", frame(10))
+    entry_size = probe.size()
+    cache = QueryCache(tmp_path, max_bytes=3 * entry_size, ttl="1d")
+    for index in range(3):
+        cache.put(f"key{index}", frame(10))
+    cache.put("key1", frame(10))
+    assert cache.size() == 3 * entry_size
+    cache.put("key3", frame(10))
+    assert cache.size() <= 3 * entry_size
+    assert cache.get("key3") is not None
+    assert len(cache.entries()) == 3
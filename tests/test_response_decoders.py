@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+from influxdb_cli.core.response_decoders import decode_csv_response, decode_csv_tables
+
+VALUES = [["2024-01-01T00:00:00Z", 1.5, 3, "007", "true", "a"],
+          ["2024-01-01T00:00:01Z", 2.0, 4, "42", "false", "b"]]
+COLUMNS = ["time", "power", "count", "code", "flag", "host"]
+FIELD_TYPES = {"power": "float", "count": "integer", "code": "string", "flag": "string"}
+
+
+@pytest.fixture
+def influx_server(influx_server):
+    influx_server.add_measurement("m", COLUMNS, VALUES, field_types=FIELD_TYPES, tags=["host"])
+    return influx_server
+
+
+def test_csv_answer_has_the_types_of_the_json_answer(make_client):
+    json_df = make_client(response_format="json").query("SELECT * FROM m")["m"]
+    csv_df = make_client(response_format="csv").query("SELECT * FROM m")["m"]
+    assert csv_df.dtypes.to_dict() == json_df.dtypes.to_dict()
+    assert csv_df["code"].tolist() == ["007", "42"]
+    assert csv_df["flag"].tolist() == ["true", "false"]
+    pd.testing.assert_frame_equal(csv_df, json_df)
+
+
+def test_csv_arrow_answer_keeps_string_fields(make_client):
+    tables = make_client().query_arrow('SELECT * FROM "m"', response_format="csv")
+    assert tables["m"].column("code").to_pylist() == ["007", "42"]
+    assert str(tables["m"].schema.field("count").type) == "int64"
+
+
+def test_string_columns_are_looked_up_once_per_measurement(make_client):
+    client = make_client(response_format="csv")
+    assert client.csv_string_columns("SELECT * FROM m", "bench") == {"code", "flag", "host"}
+    client.show_field_keys = None
+    assert client.csv_string_columns("SELECT power FROM rp.m", "bench") == {"code", "flag", "host"}
+    # count() answers numbers for every field
+    assert client.csv_string_columns("SELECT count(code) FROM m", "bench") == frozenset()
+    assert client.csv_string_columns("SELECT * FROM (SELECT * FROM m)", "bench") == frozenset()
+
+
+def test_values_are_inferred_without_string_columns():
+    body = b"name,tags,time,code,flag\nm,,0,42,true\n"
+    table = decode_csv_tables(body)["m"]
+    assert str(table.schema.field("code").type) == "int64"
+    assert decode_csv_response(body, string_columns={"code", "flag"})["m"]["code"].tolist() == ["42"]
@@ -0,0 +1,83 @@
+import re
+
+import pandas as pd
+
+from influxdb_cli.core.run_monitor import RunMonitor
+
+_STATEMENT = re.compile(r'SELECT (?P<what>count\(\*\)|\*) FROM "(?P<name>[\w-]+)"'
+                        r"(?: WHERE (?P<where>.*?))?(?: ORDER BY time DESC LIMIT 1)?$")
+_CONDITION = re.compile(r"time (?P<op><=|>) '(?P<time>[^']+)'")
+
+
+class FakeDatabase:
+    """Answer the monitor's statements from timestamps kept per measurement.
+
+    ``after_statement`` runs after every statement is answered, e.g. to write
+    points while a poll is running.
+    """
+
+    def __init__(self, points: dict[str, list[int]]):
+        self.points = {name: [pd.Timestamp(second, unit="s", tz="UTC") for second in seconds]
+                       for name, seconds in points.items()}
+        self.after_statement = None
+
+    def write(self, name: str, *seconds: int) -> None:
+        self.points[name] += [pd.Timestamp(second, unit="s", tz="UTC") for second in seconds]
+
+    def show_measurements(self, database_name: str) -> list[str]:
+        return sorted(self.points)
+
+    def _answer(self, statement: str) -> dict:
+        match = _STATEMENT.match(statement)
+        name = match.group("name")
+        times = self.points[name]
+        for condition in _CONDITION.finditer(match.group("where") or ""):
+            bound = pd.Timestamp(condition.group("time"))
+            times = [t for t in times if (t <= bound if condition.group("op") == "<=" else t > bound)]
+        if match.group("what") == "*":
+            return {name: pd.DataFrame({"time": [max(times)]})} if times else {}
+        return {name: pd.DataFrame({"time": [pd.Timestamp(0, tz="UTC")],
+                                    "count_value": [len(times)]})}
+
+    def query(self, query: str, database: str, dropna: bool = True):
+        results = []
+        for statement in query.split("; "):
+            results.append(self._answer(statement))
+            if self.after_statement is not None:
+                self.after_statement()
+        return results if len(results) > 1 else results[0]
+
+
+def test_new_points_of_a_lagging_measurement_are_counted():
+    database = FakeDatabase({"source": [0], "fast": [10, 100], "slow": [5, 10]})
+    monitor = RunMonitor(database, "test_db", "source")
+    assert monitor.poll().points == 4
+    # Still older than the newest point of "fast"
+    database.write("slow", 20, 30)
+    sample = monitor.poll()
+    assert sample.points == 6
+    assert sample.latest == pd.Timestamp(100, unit="s", tz="UTC")
+
+
+def test_points_written_during_a_poll_are_counted_by_the_next_one():
+    database = FakeDatabase({"source": [0], "out": [1, 2]})
+    monitor = RunMonitor(database, "test_db", "source")
+    statements = []
+
+    def write_after_first_statement():
+        statements.append(None)
+        if len(statements) == 1:
+            database.write("out", 3)
+    database.after_statement = write_after_first_statement
+    assert monitor.poll().points == 2
+    database.after_statement = None
+    assert monitor.poll().points == 3
+    assert monitor.poll().points == 3
+
+
+def test_progress_follows_the_source_time_range():
+    database = FakeDatabase({"source": [0, 100], "out": [25]})
+    monitor = RunMonitor(database, "test_db", "source")
+    monitor._source_bounds = (pd.Timestamp(0, unit="s", tz="UTC"),
+                              pd.Timestamp(100, unit="s", tz="UTC"))
+    assert monitor.poll().progress == 0.25
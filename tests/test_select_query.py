@@ -0,0 +1,44 @@
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from influxdb_cli.core.influx_client import InfluxClient
+
+
+def test_every_aggregates_each_column_of_a_comma_separated_list():
+    query = InfluxClient._build_select_query("m", column_names="power, speed", every="10min",
+                                             aggregate="max")
+    assert query == "SELECT max(power) AS power, max(speed) AS speed FROM m GROUP BY time(10m)"
+
+
+def test_comma_separated_columns_without_every():
+    assert InfluxClient._build_select_query("m", column_names="a,b") == "SELECT a, b FROM m"
+
+
+@pytest.mark.parametrize("fill", ["0", "-1.5", "previous", "none"])
+def test_valid_fill(fill):
+    query = InfluxClient._build_select_query("m", every="1h", fill=fill)
+    assert query.endswith(f"GROUP BY time(1h) fill({fill})")
+
+
+@pytest.mark.parametrize("fill", ["nan", "inf", "-Infinity", "zero"])
+def test_invalid_fill_is_rejected(fill):
+    with pytest.raises(ValueError, match="Unsupported fill"):
+        InfluxClient._build_select_query("m", every="1h", fill=fill)
+
+
+def test_downsampled_export_keeps_aggregate_types_across_windows(influx_server, make_client,
+                                                                 tmp_path):
+    # InfluxDB names max(*) columns max_<field>, the first window holds a whole number
+    influx_server.add_measurement("m", ["time", "max_power"],
+                                  [["2024-01-01T10:00:00Z", 2], ["2024-01-01T11:00:00Z", 2.5]],
+                                  field_types={"power": "float"})
+    client = make_client(response_format="json", downsample_max_buckets=1)
+    path = tmp_path / "export.parquet"
+    rows = client.show_measurement("m", "bench", path=str(path), every="1h", aggregate="max",
+                                   from_time="2024-01-01T10:00:00Z",
+                                   to_time="2024-01-01T11:30:00Z")
+    assert rows == 2
+    table = pq.read_table(path)
+    assert table.schema.field("max_power").type == pa.float64()
+    assert table.column("max_power").to_pylist() == [2.0, 2.5]
@@ -0,0 +1,34 @@
+from influxdb_cli.cli.shell import InteractiveShell
+
+VALUES = [["2024-01-01T10:00:00Z", 1.5], ["2024-01-01T11:00:00Z", 2.5]]
+
+
+def test_single_select(influx_server, make_client, capsys):
+    influx_server.add_measurement("m", ["time", "power"], VALUES)
+    InteractiveShell(make_client(response_format="json")).execute('SELECT * FROM "m"')
+    output = capsys.readouterr().out
+    assert "name: m" in output
+    assert "2.5" in output
+    assert "(2 rows in" in output
+
+
+def test_multiple_statements_print_each_result(influx_server, make_client, capsys):
+    influx_server.add_measurement("m", ["time", "power"], VALUES)
+    shell = InteractiveShell(make_client(response_format="json"))
+    shell.execute('SELECT * FROM "m"; SELECT * FROM "m"')
+    output = capsys.readouterr().out
+    assert "statement: 0" in output and "statement: 1" in output
+    assert output.count("name: m") == 2
+    assert "(4 rows in" in output
+
+    shell.execute("SHOW DATABASES; SHOW MEASUREMENTS")
+    output = capsys.readouterr().out
+    assert "statement: 1" in output
+    assert "bench" in output
+    assert "(2 rows in" in output
+
+
+def test_query_errors_are_reported(make_client, capsys, closed_port):
+    shell = InteractiveShell(make_client(port=closed_port, retries=1))
+    assert shell.handle("SELECT * FROM m")
+    assert "Error:" in capsys.readouterr().err
@@ -0,0 +1,60 @@
+import json
+
+import pandas as pd
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+import pytest
+
+from influxdb_cli.core.stream_writers import stream_writer
+
+# A float field that JSON answers with whole numbers in the first chunk
+VALUES = [[f"2024-01-01T00:00:0{i}Z", i, f"s{i}"] for i in range(4)] + \
+         [["2024-01-01T00:00:04Z", 4.5, "s4"], ["2024-01-01T00:00:05Z", 5.25, "s5"]]
+
+
+@pytest.fixture
+def client(influx_server, make_client):
+    influx_server.add_measurement("m", ["time", "power", "state"], VALUES,
+                                  field_types={"power": "float", "state": "string"})
+    return make_client(response_format="json")
+
+
+@pytest.mark.parametrize("extension", [".parquet", ".feather"])
+def test_chunked_export_keeps_float_field_type_across_chunks(client, tmp_path, extension):
+    path = tmp_path / f"out{extension}"
+    written = client.show_measurement("m", "bench", path=str(path), chunk_size=2)
+    assert written == 6
+    table = pq.read_table(path) if extension == ".parquet" else feather.read_table(path)
+    assert str(table.schema.field("power").type) == "double"
+    assert table.column("power").to_pylist() == [0.0, 1.0, 2.0, 3.0, 4.5, 5.25]
+
+
+def test_chunked_dataframe_export_keeps_float_field_type(client, tmp_path):
+    path = tmp_path / "out.parquet"
+    query = client._build_select_query(measurement_name="m")
+    client.export_measurement_chunked(query, "m", "bench", str(path), chunk_size=2)
+    assert pd.read_parquet(path)["power"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.5, 5.25]
+
+
+def test_json_is_not_streamed(tmp_path):
+    with pytest.raises(ValueError, match=".ndjson"):
+        stream_writer(tmp_path / "out.json")
+
+
+def test_sliced_json_export_is_a_json_document(client, tmp_path):
+    path = tmp_path / "out.json"
+    written = client.show_measurement("m", "bench", path=str(path), parallel=2,
+                                      from_time="2024-01-01 00:00:00",
+                                      to_time="2024-01-01 00:00:05", slice_duration="1d")
+    assert written == 6
+    assert json.loads(path.read_text())["power"]["1704067204000"] == 4.5
+
+
+def test_sliced_xlsx_export(client, tmp_path):
+    pytest.importorskip("openpyxl")
+    path = tmp_path / "out.xlsx"
+    written = client.show_measurement("m", "bench", path=str(path), parallel=2,
+                                      from_time="2024-01-01 00:00:00",
+                                      to_time="2024-01-01 00:00:05", slice_duration="1d")
+    assert written == 6
+    assert pd.read_excel(path)["state"].tolist() == [f"s{i}" for i in range(6)]
@@ -0,0 +1,65 @@
+import pandas as pd
+from influxdb.resultset import ResultSet
+
+from influxdb_cli.core.influx_client import InfluxClient
+
+
+def _result(*series) -> ResultSet:
+    return ResultSet({"statement_id": 0, "series": list(series)})
+
+
+def test_mixed_iso8601_precision_is_parsed_in_one_column():
+    rs = _result({"name": "m", "columns": ["time", "value"], "values": [
+        ["2024-01-15T14:30:45Z", 1.0],
+        ["2024-01-15T14:30:45.5Z", 2.0],
+        ["2024-01-15T14:30:45.123456789Z", 3.0],
+    ]})
+    df = InfluxClient._result_to_dataframes(rs, dropna=True, data_frame_index=None)["m"]
+    assert list(df["time"]) == [
+        pd.Timestamp("2024-01-15T14:30:45Z"),
+        pd.Timestamp("2024-01-15T14:30:45.5Z"),
+        pd.Timestamp("2024-01-15T14:30:45.123456789Z"),
+    ]
+    assert str(df["time"].dtype) == "datetime64[ns, UTC]"
+    assert list(df["value"]) == [1.0, 2.0, 3.0]
+
+
+def test_multiple_series_are_keyed_by_name_and_tags():
+    rs = _result(
+        {"name": "m", "tags": {"host": "a"}, "columns": ["time", "value"],
+         "values": [["2024-01-01T00:00:00Z", 1], ["2024-01-01T00:00:01.25Z", 2]]},
+        {"name": "m", "tags": {"host": "b"}, "columns": ["time", "value"],
+         "values": [["2024-01-01T00:00:00.000001Z", 3]]},
+        {"name": "other", "columns": ["time", "flag"],
+         "values": [["2024-01-01T00:00:00Z", True]]},
+    )
+    df_dict = InfluxClient._result_to_dataframes(rs, dropna=True, data_frame_index=None)
+    assert set(df_dict) == {("m", (("host", "a"),)), ("m", (("host", "b"),)), "other"}
+    host_a = df_dict[("m", (("host", "a"),))]
+    assert list(host_a["value"]) == [1, 2]
+    assert host_a["time"].iloc[1] == pd.Timestamp("2024-01-01T00:00:01.25Z")
+    assert df_dict[("m", (("host", "b"),))]["time"].iloc[0] == \
+        pd.Timestamp("2024-01-01T00:00:00.000001Z")
+    assert df_dict["other"]["flag"].tolist() == [True]
+
+
+def test_chunks_of_one_series_are_concatenated_and_indexed():
+    rs = _result(
+        {"name": "m", "columns": ["time", "value"],
+         "values": [["2024-01-01T00:00:00Z", 1.0], ["2024-01-01T00:00:01Z", None]]},
+        {"name": "m", "columns": ["time", "value"],
+         "values": [["2024-01-01T00:00:02.123Z", 3.0]]},
+    )
+    df = InfluxClient._result_to_dataframes(rs, dropna=True, data_frame_index=["time"])["m"]
+    assert list(df.index) == [pd.Timestamp("2024-01-01T00:00:00Z"),
+                              pd.Timestamp("2024-01-01T00:00:02.123Z")]
+    assert list(df["value"]) == [1.0, 3.0]
+
+
+def test_multi_statement_results_give_one_dict_each(make_client):
+    client = make_client()
+    results = client._to_dataframe([
+        _result({"name": "a", "columns": ["time", "v"], "values": [["2024-01-01T00:00:00Z", 1]]}),
+        _result({"name": "b", "columns": ["time", "v"], "values": [["2024-01-01T00:00:00Z", 2]]}),
+    ])
+    assert [list(result) for result in results] == [["a"], ["b"]]
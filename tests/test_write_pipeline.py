@@ -0,0 +1,95 @@
+import threading
+import time
+
+import pandas as pd
+import pytest
+from influxdb.exceptions import InfluxDBClientError
+
+from influxdb_cli.core import write_pipeline
+from influxdb_cli.core.dir_ingest import DirectoryIngestor
+from influxdb_cli.core.write_pipeline import WritePipeline, is_transient
+
+BODY = b"m value=1 1\nm value=2 2\n"
+PARAMS = {"db": "bench", "precision": "s"}
+HEADERS = {"Content-Type": "application/octet-stream"}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the backoffs of the pipeline instead of sleeping."""
+    recorded = []
+    monkeypatch.setattr(write_pipeline.time, "sleep", recorded.append)
+    return recorded
+
+
+@pytest.mark.parametrize("status", [503, 429])
+def test_send_retries_transient_status(influx_server, make_client, sleeps, status):
+    influx_server.write_errors = [status, status]
+    pipeline = WritePipeline(make_client(write_retries=3, write_backoff_sec=1))
+    _, retries = pipeline.send(BODY, PARAMS, HEADERS)
+    assert retries == 2
+    assert len(sleeps) == 2
+    assert all(0 <= backoff <= 2 ** attempt for attempt, backoff in enumerate(sleeps))
+    assert influx_server.points_written == 2
+
+
+def test_send_retries_refused_connection(make_client, sleeps, closed_port):
+    pipeline = WritePipeline(make_client(port=closed_port, retries=1, write_retries=2,
+                                         write_backoff_sec=1))
+    with pytest.raises(ConnectionError) as raised:
+        pipeline.send(BODY, PARAMS, HEADERS)
+    assert is_transient(raised.value)
+    assert len(sleeps) == 2
+
+
+def test_send_does_not_retry_rejected_data(influx_server, make_client, sleeps):
+    influx_server.write_errors = [400]
+    pipeline = WritePipeline(make_client(write_retries=3))
+    with pytest.raises(InfluxDBClientError):
+        pipeline.send(BODY, PARAMS, HEADERS)
+    assert sleeps == []
+    assert influx_server.points_written == 0
+
+
+def test_each_write_attempt_connects_once(make_client, sleeps, closed_port):
+    client = make_client(port=closed_port, retries=3, write_retries=2)
+    connections = []
+    session_request = client._session_request
+    client._session_request = lambda *args, **kwargs: connections.append(1) or \
+        session_request(*args, **kwargs)
+    with pytest.raises(ConnectionError):
+        WritePipeline(client).send(BODY, PARAMS, HEADERS)
+    assert len(connections) == 3
+    # Other requests keep the configured attempts
+    with pytest.raises(ConnectionError):
+        client.request(url="ping", expected_response_code=204)
+    assert len(connections) == 6
+
+
+def test_shared_pipeline_bounds_requests_of_all_threads(influx_server, make_client, tmp_path):
+    client = make_client(write_max_in_flight=2, write_batch_size=10, write_batch_min_size=10,
+                         write_batch_max_size=10)
+    lock = threading.Lock()
+    in_flight = [0, 0]
+    request = client.request
+
+    def counting_request(*args, **kwargs):
+        if kwargs.get("url") != "write":
+            return request(*args, **kwargs)
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        try:
+            time.sleep(0.01)
+            return request(*args, **kwargs)
+        finally:
+            with lock:
+                in_flight[0] -= 1
+
+    client.request = counting_request
+    for index in range(4):
+        pd.DataFrame({"value": range(50)}).to_csv(tmp_path / f"db{index}.csv", index=False)
+    report = DirectoryIngestor(client, workers=4).ingest(sorted(tmp_path.iterdir()), "m")
+    assert not report.failed
+    assert influx_server.points_written == 200
+    assert in_flight[1] == 2
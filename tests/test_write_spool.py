@@ -0,0 +1,58 @@
+import threading
+import time
+
+import pandas as pd
+import pyarrow as pa
+
+from fake_influx import FakeInfluxServer
+from influxdb_cli.config.config_manager import ConfigModel
+from influxdb_cli.core.influx_client import InfluxClient
+from influxdb_cli.core.write_spool import SpoolFlusher, WriteSpool
+
+POINTS = 1000
+
+
+def down_client(port: int) -> InfluxClient:
+    """A client of a server that is not up yet, failing fast on every attempt."""
+    return InfluxClient(ConfigModel(host="127.0.0.1", port=port, database="bench", retries=1,
+                                    write_retries=0, write_backoff_sec=0.01))
+
+
+def test_ingest_waits_for_server_to_come_up(tmp_path, closed_port):
+    file_path = tmp_path / "points.csv"
+    pd.DataFrame({"value": range(POINTS)}).to_csv(file_path, index=False)
+    spool_dir = tmp_path / "spool"
+    servers = []
+
+    def start_server_later():
+        # Bound only once the flusher ran into refused connections with points in the spool
+        while not (spool_dir / "00000000.lp").exists():
+            time.sleep(0.01)
+        time.sleep(0.5)
+        servers.append(FakeInfluxServer(port=closed_port).__enter__())
+
+    starter = threading.Thread(target=start_server_later, daemon=True)
+    starter.start()
+    try:
+        stats = down_client(closed_port).add_measurements(
+            "bench", str(file_path), "m", chunk_size=100, spool_dir=str(spool_dir))
+    finally:
+        starter.join()
+        for server in servers:
+            server.__exit__(None, None, None)
+    assert stats.points == POINTS
+    assert servers[0].points_written == POINTS
+    assert not (spool_dir / "spool.json").exists()
+
+
+def test_abort_closes_segment_and_keeps_points(tmp_path, closed_port):
+    spool = WriteSpool.create(tmp_path / "spool", database="bench", retention_policy=None,
+                              time_precision="ms", segment_bytes=1024)
+    flusher = SpoolFlusher(down_client(closed_port), spool).start()
+    spool.append(pa.array(["m value=1 1", "m value=2 2"], pa.large_string()))
+    file = spool._file
+    flusher.abort()
+    assert file.closed
+    assert spool._file is None
+    assert not spool.closed
+    assert WriteSpool(tmp_path / "spool").pending_bytes() == len(b"m value=1 1\nm value=2 2\n")